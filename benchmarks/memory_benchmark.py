@@ -0,0 +1,131 @@
+############################################################################################################
+#  MEMORY BENCHMARK                                                                                        #
+############################################################################################################
+"""
+Measures the memory allocated by the models when loading synthetic rosters and tournament histories:
+bytes per Player, bytes per Match, and bytes per match of a whole history loaded as Tournament
+objects or as results matrices.
+
+Usage:
+    python -m benchmarks.memory_benchmark --players 10000 100000 --tournaments 100 1000 --output memory.json
+"""
+import argparse
+from datetime import datetime
+import json
+import platform
+import tracemalloc
+
+from benchmarks.synthetic import make_history, make_roster
+from easychess.models.match import Match
+from easychess.models.player import Player
+from easychess.models.results_matrix import ResultsMatrix
+from easychess.models.tournament import Tournament
+
+
+def allocated(function):
+    """
+    Calls a function and returns the memory still allocated by its result.
+
+    Args:
+        function (callable): The function building the objects to measure.
+
+    Returns:
+        int: The number of bytes allocated, the result being still alive.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = function()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def run_players(number_of_players):
+    """
+    Measures the bytes per Player of a roster loaded from its dictionaries.
+
+    Args:
+        number_of_players (int): The size of the roster.
+
+    Returns:
+        dict: The bytes per player.
+    """
+    roster = make_roster(number_of_players)
+    size = allocated(lambda: [Player.from_dict(player_data) for player_data in roster])
+    return {"bytes_per_player": size / number_of_players}
+
+
+def run_tournaments(number_of_tournaments, players_per_tournament=32):
+    """
+    Measures the bytes per match of a tournament history: as Match objects alone,
+    as Tournament objects and as results matrices.
+
+    Args:
+        number_of_tournaments (int): The number of tournaments of the history.
+        players_per_tournament (int, optional): The number of players of each tournament. Defaults to 32.
+
+    Returns:
+        dict: The number of matches and the bytes per match of each representation.
+    """
+    roster = make_roster(max(1000, players_per_tournament))
+    history = json.dumps(make_history(roster, number_of_tournaments, players_per_tournament))
+    tournaments = list(json.loads(history).values())
+    match_tuples = [match for data in tournaments for round_ in data["list_rounds"] for match in round_["matches"]]
+    number_of_matches = len(match_tuples)
+    results = {"matches": number_of_matches}
+    results["bytes_per_match"] = (
+        allocated(lambda: [Match.from_tuple(match) for match in match_tuples]) / number_of_matches
+    )
+    for name, model in (("tournament", Tournament), ("results_matrix", ResultsMatrix)):
+        tournaments = list(json.loads(history).values())
+        # The tournament data is parsed beforehand: only the objects built from it are measured
+        results[f"{name}_bytes_per_match"] = (
+            allocated(lambda: [model.from_dict(data) for data in tournaments]) / number_of_matches
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la mémoire des joueurs, matchs et tournois.")
+    parser.add_argument("--players", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--tournaments", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'mesure':<32} {'taille':>8} {'octets':>10}")
+    for number_of_players in args.players:
+        for name, value in run_players(number_of_players).items():
+            print(f"{name:<32} {number_of_players:>8} {value:>10.1f}")
+            results.append({"benchmark": name, "players": number_of_players, "tournaments": 0, "bytes": value})
+    for number_of_tournaments in args.tournaments:
+        measures = run_tournaments(number_of_tournaments)
+        number_of_matches = measures.pop("matches")
+        for name, value in measures.items():
+            print(f"{name:<32} {number_of_matches:>8} {value:>10.1f}")
+            results.append(
+                {
+                    "benchmark": name,
+                    "players": 0,
+                    "tournaments": number_of_tournaments,
+                    "matches": number_of_matches,
+                    "bytes": value,
+                }
+            )
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(
+                {
+                    "date": datetime.now().isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                output_file,
+                indent=4,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+############################################################################################################
+#  PAIRING BENCHMARK                                                                                       #
+############################################################################################################
+"""
+Plays simulated Swiss tournaments round by round and reports, for every field size, the pairing
+latency of each round, the number of rematches and the number of forced pairings (rematches or
+players requiring the same colour).
+
+Usage:
+    python -m benchmarks.pairing_benchmark --players 8 100 1000 5000 --results favourites --output pairing.json
+"""
+import argparse
+from datetime import datetime
+import json
+import platform
+import random
+import statistics
+import time
+
+from benchmarks.synthetic import make_roster
+from easychess.models.match import Match
+from easychess.models.round import Round
+from easychess.models.tournament import Tournament
+from easychess.pairing.swiss_pairing import SwissPairing
+
+FIELD_SIZES = (8, 16, 32, 64, 128, 256, 512, 1000, 2000, 5000)
+
+
+def draw_result(rng, results, white_id, black_id):
+    """
+    Draws the score of the white player of a match.
+
+    Args:
+        rng (random.Random): The random generator.
+        results (str): "random" (uniform results), "draws" (mostly draws, large score groups)
+            or "favourites" (the lower id mostly wins, spread-out score groups).
+        white_id (int): The id of the white player.
+        black_id (int): The id of the black player.
+
+    Returns:
+        float: The score of the white player (0, 0.5 or 1).
+    """
+    if results == "draws":
+        return 0.5 if rng.random() < 0.7 else rng.choice((0, 1))
+    if results == "favourites":
+        favourite_wins = rng.random() < 0.8
+        return float(favourite_wins == (white_id < black_id)) if rng.random() > 0.1 else 0.5
+    return rng.choice((0, 0.5, 1))
+
+
+def run(number_of_players, number_of_rounds=None, results="random", seed=0):
+    """
+    Plays a Swiss tournament with simulated results and measures the pairing of each round.
+
+    Args:
+        number_of_players (int): The number of players.
+        number_of_rounds (int, optional): The number of rounds. Defaults to the Swiss round count of the field.
+        results (str, optional): The distribution of the results, see draw_result. Defaults to "random".
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        list: For each round, a dictionary with its pairing time in seconds, its rematches and its forced pairings.
+    """
+    rng = random.Random(seed)
+    tournament = Tournament("Benchmark", "Paris", "Benchmark", players=make_roster(number_of_players, seed))
+    number_of_rounds = number_of_rounds or min(SwissPairing.round_count(number_of_players), number_of_players - 1)
+    rounds = []
+    for round_index in range(number_of_rounds):
+        round_ = Round.create(f"Round {round_index + 1}")
+        start = time.perf_counter()
+        pairing = SwissPairing(tournament)
+        pairs, round_.bye = pairing.pair_round()
+        elapsed = time.perf_counter() - start
+        rounds.append({"seconds": elapsed, "rematches": pairing.rematches, "forced_pairings": pairing.forced_pairings})
+        if round_.bye is not None:
+            tournament.byes.add(round_.bye)
+            tournament.add_points(round_.bye, 0.5)
+        for white_id, black_id in pairs:
+            match = Match(white_id, black_id)
+            score1 = draw_result(rng, results, white_id, black_id)
+            match.set_score(score1, 1 - score1)
+            round_.add_match(match)
+            tournament.record_match(match)
+            tournament.add_points(white_id, score1)
+            tournament.add_points(black_id, 1 - score1)
+        tournament.list_rounds.append(round_)
+    return rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'appariement suisse : temps et qualité.")
+    parser.add_argument("--players", type=int, nargs="+", default=list(FIELD_SIZES))
+    parser.add_argument("--rounds", type=int, help="Nombre de rounds (par défaut : ⌈log2 n⌉ + 2)")
+    parser.add_argument("--results", choices=("random", "draws", "favourites"), default="random")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    args = parser.parse_args()
+
+    report = []
+    print(
+        f"{'joueurs':>8} {'rounds':>7} {'médiane (ms)':>13} {'pire (ms)':>10} {'total (ms)':>11} "
+        f"{'revanches':>10} {'forcés':>7}"
+    )
+    for number_of_players in args.players:
+        rounds = run(number_of_players, args.rounds, args.results, args.seed)
+        timings = [round_["seconds"] for round_ in rounds]
+        rematches = sum(round_["rematches"] for round_ in rounds)
+        forced_pairings = sum(round_["forced_pairings"] for round_ in rounds)
+        print(
+            f"{number_of_players:>8} {len(rounds):>7} {statistics.median(timings) * 1000:>13.2f} "
+            f"{max(timings) * 1000:>10.2f} {sum(timings) * 1000:>11.2f} {rematches:>10} {forced_pairings:>7}"
+        )
+        report.append({"players": number_of_players, "rounds": rounds})
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(
+                {
+                    "date": datetime.now().isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": args.results,
+                    "seed": args.seed,
+                    "fields": report,
+                },
+                output_file,
+                indent=4,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+############################################################################################################
+#  RATING BENCHMARK                                                                                        #
+############################################################################################################
+"""
+Rates synthetic tournament histories with the Elo engine, as for a historical import,
+and reports the throughput in rated games per second.
+
+Usage:
+    python -m benchmarks.rating_benchmark --tournaments 100 1000 --players 32 256 --output rating.json
+"""
+import argparse
+from datetime import datetime
+import json
+import platform
+import time
+
+from benchmarks.synthetic import make_history, make_roster
+from easychess.models.tournament import Tournament
+from easychess.rating.elo_rating import EloRating
+
+
+def run(number_of_tournaments, players_per_tournament, repeat=3):
+    """
+    Rates a synthetic history and measures its fastest run.
+
+    The tournaments are rebuilt from their data before the timing, which only covers the rating.
+
+    Args:
+        number_of_tournaments (int): The number of tournaments of the history.
+        players_per_tournament (int): The number of players of each tournament.
+        repeat (int, optional): The number of runs. Defaults to 3.
+
+    Returns:
+        dict: The number of rated games, the duration of the fastest run in seconds and the games per second.
+    """
+    roster = make_roster(max(1000, players_per_tournament))
+    history = make_history(roster, number_of_tournaments, players_per_tournament)
+    tournaments = [Tournament.from_dict(tournament_data) for tournament_data in history.values()]
+    timings = []
+    for _ in range(repeat):
+        elo_rating = EloRating(roster)
+        start = time.perf_counter()
+        games = elo_rating.rate_history(tournaments)
+        timings.append(time.perf_counter() - start)
+    seconds = min(timings)
+    return {"games": games, "seconds": seconds, "games_per_second": games / seconds}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du calcul des classements Elo.")
+    parser.add_argument("--tournaments", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--players", type=int, nargs="+", default=[32, 256])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'tournois':>9} {'joueurs':>8} {'parties':>9} {'temps (ms)':>12} {'parties/s':>12}")
+    for number_of_tournaments in args.tournaments:
+        for players_per_tournament in args.players:
+            result = run(number_of_tournaments, players_per_tournament, args.repeat)
+            print(
+                f"{number_of_tournaments:>9} {players_per_tournament:>8} {result['games']:>9} "
+                f"{result['seconds'] * 1000:>12.2f} {result['games_per_second']:>12.0f}"
+            )
+            results.append(dict(result, tournaments=number_of_tournaments, players=players_per_tournament))
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(
+                {
+                    "date": datetime.now().isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "repeat": args.repeat,
+                    "results": results,
+                },
+                output_file,
+                indent=4,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+############################################################################################################
+#  STARTUP BENCHMARK                                                                                       #
+############################################################################################################
+"""
+Times the first reads of a launch of the application, cold (data files parsed) and warm (data
+unpickled from the on-disk cache of the previous launch), on synthetic rosters and tournament histories.
+
+Usage:
+    python -m benchmarks.startup_benchmark --players 1000 100000 --tournaments 100 1000 --output startup.json
+"""
+import argparse
+from datetime import datetime
+import json
+import platform
+import tempfile
+
+from benchmarks.storage_benchmark import measure
+from benchmarks.synthetic import make_history, make_roster, write_dataset
+from easychess.models.tournament import Tournament
+from easychess.storage.json_repository import JsonRepository
+from easychess.storage.read_cache import READ_CACHE
+
+
+def first_reads(repository, tournament_key):
+    """
+    Performs the reads of a launch: the roster, every tournament, and resuming one of them.
+
+    Args:
+        repository (JsonRepository): The repository of the data files.
+        tournament_key (str): The storage key of the tournament to resume.
+    """
+    repository.read_players()
+    repository.read_tournaments()
+    Tournament.from_dict(repository.read_tournament(tournament_key))
+
+
+def run(number_of_players, number_of_tournaments, repeat, players_per_tournament=32):
+    """
+    Times the first reads of a launch, without and with the on-disk cache of the previous launch.
+
+    Args:
+        number_of_players (int): The size of the roster.
+        number_of_tournaments (int): The number of tournaments of the history.
+        repeat (int): The number of launches of each kind.
+        players_per_tournament (int, optional): The number of players of each tournament. Defaults to 32.
+
+    Returns:
+        dict: The duration of the cold and warm launches, in seconds.
+    """
+    roster = make_roster(max(number_of_players, players_per_tournament))
+    tournaments = make_history(roster, number_of_tournaments, players_per_tournament)
+    tournament_key = f"tournament{number_of_tournaments}"
+    with tempfile.TemporaryDirectory() as directory:
+        players_file, tournaments_file = write_dataset(directory, roster, tournaments)
+        repository = JsonRepository(players_file, tournaments_file)
+
+        def cold():
+            # A new process, without the cache of a previous launch
+            READ_CACHE.clear()
+            READ_CACHE.warm_cache.invalidate(players_file)
+            READ_CACHE.warm_cache.invalidate(tournaments_file)
+            first_reads(repository, tournament_key)
+
+        def warm():
+            # A new process, after a launch which left its cache on disk
+            READ_CACHE.clear()
+            first_reads(repository, tournament_key)
+
+        return {"startup_cold": measure(cold, repeat), "startup_warm": measure(warm, repeat)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du démarrage, à froid et avec le cache sur disque.")
+    parser.add_argument("--players", type=int, nargs="+", default=[1000, 100000])
+    parser.add_argument("--tournaments", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    args = parser.parse_args()
+    if READ_CACHE.warm_cache is None:
+        parser.error("le cache sur disque est désactivé (settings.WARM_CACHE)")
+
+    results = []
+    print(f"{'mesure':<16} {'joueurs':>8} {'tournois':>9} {'temps (ms)':>12}")
+    for number_of_players in args.players:
+        for number_of_tournaments in args.tournaments:
+            for name, seconds in run(number_of_players, number_of_tournaments, args.repeat).items():
+                print(f"{name:<16} {number_of_players:>8} {number_of_tournaments:>9} {seconds * 1000:>12.2f}")
+                results.append(
+                    {
+                        "benchmark": name,
+                        "players": number_of_players,
+                        "tournaments": number_of_tournaments,
+                        "seconds": seconds,
+                    }
+                )
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(
+                {
+                    "date": datetime.now().isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "repeat": args.repeat,
+                    "results": results,
+                },
+                output_file,
+                indent=4,
+            )
+
+
+if __name__ == "__main__":
+    main()
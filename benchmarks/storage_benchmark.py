@@ -0,0 +1,170 @@
+############################################################################################################
+#  STORAGE BENCHMARK                                                                                       #
+############################################################################################################
+"""
+Times the load, save, resume and report paths (report data, without display) on synthetic rosters
+and tournament histories, and writes the results as JSON to track regressions between releases.
+The reads through the repository are timed again once cached, as when navigating the menus.
+
+Usage:
+    python -m benchmarks.storage_benchmark --players 100 1000 10000 100000 --tournaments 10 100 1000 \
+        --output storage_results.json
+"""
+import argparse
+import contextlib
+from datetime import datetime
+import io
+import json
+import platform
+import tempfile
+import time
+
+from benchmarks.synthetic import make_history, make_roster, write_dataset
+from easychess.controllers.report_controller import ReportManagerController
+from easychess.models.player import Player
+from easychess.models.tournament import Tournament
+from easychess.storage.json_repository import JsonRepository
+from easychess.storage.read_cache import READ_CACHE
+from easychess.storage.tournament_store import TournamentStore
+
+
+def measure(function, repeat):
+    """
+    Calls a function several times and returns its fastest run.
+
+    Args:
+        function (callable): The function to time.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The duration of the fastest run, in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_players(number_of_players, repeat):
+    """
+    Times the roster paths: reading, reading again from the cache, registering a player and the alphabetical report.
+
+    Args:
+        number_of_players (int): The size of the roster.
+        repeat (int): The number of runs of each path.
+
+    Returns:
+        dict: The duration of each path, in seconds.
+    """
+    roster = make_roster(number_of_players)
+    with tempfile.TemporaryDirectory() as directory:
+        players_file, tournaments_file = write_dataset(directory, roster, {})
+        new_player = dict(roster[0], last_name="Nouveau")
+        repository = JsonRepository(players_file, tournaments_file)
+        report = ReportManagerController()
+        report.repository = repository
+        repository.read_players()
+        return {
+            "player_read": measure(lambda: Player.read(players_file), repeat),
+            "player_read_cached": measure(repository.read_players, repeat),
+            "player_save": measure(lambda: Player.save(players_file, dict(new_player)), repeat),
+            "report_players": measure(report.alphabetical_players, repeat),
+        }
+
+
+def run_tournaments(number_of_tournaments, repeat, players_per_tournament=32):
+    """
+    Times the tournament paths: reading all tournaments (parsed or from the cache) or their headers,
+    saving one, rebuilding one, resuming one in progress and the tournament reports.
+
+    Args:
+        number_of_tournaments (int): The number of tournaments of the history.
+        repeat (int): The number of runs of each path.
+        players_per_tournament (int, optional): The number of players of each tournament. Defaults to 32.
+
+    Returns:
+        dict: The duration of each path, in seconds.
+    """
+    roster = make_roster(max(1000, players_per_tournament))
+    tournaments = make_history(roster, number_of_tournaments, players_per_tournament)
+    with tempfile.TemporaryDirectory() as directory:
+        players_file, tournaments_file = write_dataset(directory, roster, tournaments)
+        repository = JsonRepository(players_file, tournaments_file)
+        roster_by_id = repository.roster()
+        report = ReportManagerController()
+        report.repository = repository
+        in_progress = next(
+            (key for key, tournament_data in tournaments.items() if tournament_data["status"] is None),
+            next(iter(tournaments)),
+        )
+        last_key = f"tournament{number_of_tournaments}"
+        last_data = tournaments[last_key]
+        repository.read_tournaments()
+        return {
+            "tournament_read_all": measure(lambda: TournamentStore.read(tournaments_file, roster_by_id), repeat),
+            "tournament_read_all_cached": measure(repository.read_tournaments, repeat),
+            "tournament_read_headers": measure(lambda: TournamentStore.read_headers(tournaments_file), repeat),
+            "tournament_read_one": measure(
+                lambda: TournamentStore.read_one(tournaments_file, last_key, roster_by_id), repeat
+            ),
+            "tournament_from_dict": measure(lambda: Tournament.from_dict(json.loads(json.dumps(last_data))), repeat),
+            "tournament_save": measure(
+                lambda: TournamentStore.save(tournaments_file, last_data, roster_by_id), repeat
+            ),
+            # Resuming without any cache, as at a launch after the file changed
+            "tournament_resume": measure(
+                lambda: (
+                    READ_CACHE.invalidate(tournaments_file),
+                    Tournament.from_dict(repository.read_tournament(in_progress)),
+                ),
+                repeat,
+            ),
+            "report_tournaments": measure(repository.read_tournament_headers, repeat),
+            "report_tournament_details": measure(lambda: report.tournament_details(last_data["name"]), repeat),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du stockage, de la reprise et des rapports.")
+    parser.add_argument("--players", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--tournaments", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    args = parser.parse_args()
+
+    results = []
+    for number_of_players in args.players:
+        for name, seconds in run_players(number_of_players, args.repeat).items():
+            results.append({"benchmark": name, "players": number_of_players, "tournaments": 0, "seconds": seconds})
+    for number_of_tournaments in args.tournaments:
+        for name, seconds in run_tournaments(number_of_tournaments, args.repeat).items():
+            results.append(
+                {"benchmark": name, "players": 0, "tournaments": number_of_tournaments, "seconds": seconds}
+            )
+
+    print(f"{'mesure':<28} {'joueurs':>8} {'tournois':>9} {'temps (ms)':>12}")
+    for result in results:
+        print(
+            f"{result['benchmark']:<28} {result['players']:>8} {result['tournaments']:>9} "
+            f"{result['seconds'] * 1000:>12.2f}"
+        )
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(
+                {
+                    "date": datetime.now().isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "repeat": args.repeat,
+                    "results": results,
+                },
+                output_file,
+                indent=4,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+############################################################################################################
+#  SYNTHETIC DATA                                                                                          #
+############################################################################################################
+"""
+Deterministic synthetic rosters and tournament histories for the benchmarks.
+
+The same arguments and seed always produce the same data, so timings can be compared between releases.
+"""
+from datetime import datetime, timedelta
+import json
+import os
+import random
+
+from easychess.models.match import Match
+from easychess.models.player import Player
+from easychess.models.round import Round
+from easychess.models.tournament import Tournament
+from easychess.pairing.swiss_pairing import SwissPairing
+from easychess.storage.tournament_store import TournamentStore
+
+SYLLABLES = ("ba", "ri", "mon", "del", "lu", "ca", "sel", "tor", "vi", "nan", "go", "ber", "ma", "zo", "fel", "quin")
+LOCATIONS = ("Paris", "Lyon", "Marseille", "Lille", "Nantes", "Bordeaux", "Toulouse", "Strasbourg")
+START_DATE = datetime(2020, 1, 4, 9, 0)
+
+
+def make_name(rng, syllables):
+    """
+    Builds a capitalized name from random syllables.
+
+    Args:
+        rng (random.Random): The random generator.
+        syllables (int): The number of syllables.
+
+    Returns:
+        str: The name.
+    """
+    return "".join(rng.choice(SYLLABLES) for _ in range(syllables)).capitalize()
+
+
+def make_roster(number_of_players, seed=0):
+    """
+    Builds a roster of distinct players with ids 1 to number_of_players.
+
+    Args:
+        number_of_players (int): The number of players.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        list: The player dictionaries.
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            "id": player_id,
+            "last_name": make_name(rng, 3),
+            "first_name": make_name(rng, 2),
+            "birthdate": f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(1950, 2015)}",
+            "national_id": f"{chr(65 + player_id // 100000 % 26)}{chr(65 + player_id // 10000 % 26)}"
+            f"{player_id % 100000:05d}",
+            "score": 0,
+        }
+        for player_id in range(1, number_of_players + 1)
+    ]
+
+
+def make_tournament(index, roster, number_of_players, rng, in_progress=False):
+    """
+    Plays a Swiss tournament between players drawn from the roster, with random results.
+
+    Args:
+        index (int): The number of the tournament, used for its name and dates.
+        roster (list): The player dictionaries to draw from.
+        number_of_players (int): The number of players of the tournament.
+        rng (random.Random): The random generator.
+        in_progress (bool, optional): If True, the tournament stops in the middle of a round. Defaults to False.
+
+    Returns:
+        dict: The tournament data, as saved by the application.
+    """
+    start_date = START_DATE + timedelta(days=7 * index)
+    players = [dict(player, score=0) for player in rng.sample(roster, min(number_of_players, len(roster)))]
+    tournament = Tournament(
+        f"Tournoi {index + 1}",
+        LOCATIONS[index % len(LOCATIONS)],
+        f"Open synthétique numéro {index + 1}",
+        start_date=start_date,
+        number_of_rounds=min(SwissPairing.round_count(len(players)), len(players) - 1),
+        players=players,
+        status=True,
+    )
+    rounds_to_play = rng.randint(1, tournament.number_of_rounds) if in_progress else tournament.number_of_rounds
+    for round_index in range(rounds_to_play):
+        round_ = Round(f"Round {round_index + 1}", start_date + timedelta(hours=3 * round_index), None)
+        pairs, round_.bye = SwissPairing(tournament).pair_round()
+        if round_.bye is not None:
+            tournament.byes.add(round_.bye)
+            tournament.add_points(round_.bye, 0.5)
+        last_round = in_progress and round_index == rounds_to_play - 1
+        for board, (white_id, black_id) in enumerate(pairs):
+            match = Match(white_id, black_id)
+            round_.add_match(match)
+            tournament.record_match(match)
+            if last_round and board >= len(pairs) // 2:
+                continue
+            score1 = rng.choice((0, 0.5, 1))
+            match.set_score(score1, 1 - score1)
+            tournament.add_points(white_id, score1)
+            tournament.add_points(black_id, 1 - score1)
+        if not last_round:
+            round_.end_date_time = round_.start_date_time + timedelta(hours=2)
+        tournament.list_rounds.append(round_)
+    tournament.current_round = rounds_to_play - 1 if in_progress else rounds_to_play
+    if in_progress:
+        tournament.status = None
+    else:
+        tournament.end_date = start_date + timedelta(hours=3 * rounds_to_play)
+    return tournament.as_dict()
+
+
+def make_history(roster, number_of_tournaments, players_per_tournament=32, seed=0):
+    """
+    Builds a history of tournaments, one in ten still in progress.
+
+    Args:
+        roster (list): The player dictionaries to draw from.
+        number_of_tournaments (int): The number of tournaments.
+        players_per_tournament (int, optional): The number of players of each tournament. Defaults to 32.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        dict: The tournaments keyed by their storage key ('tournament1', 'tournament2', ...).
+    """
+    rng = random.Random(seed)
+    return {
+        f"tournament{index + 1}": make_tournament(
+            index, roster, players_per_tournament, rng, in_progress=index % 10 == 9
+        )
+        for index in range(number_of_tournaments)
+    }
+
+
+def write_dataset(directory, roster, tournaments):
+    """
+    Writes a roster and a tournament history in the files of the application, in the stored format.
+
+    Args:
+        directory (str): The directory of the data files.
+        roster (list): The player dictionaries.
+        tournaments (dict): The tournaments keyed by storage key.
+
+    Returns:
+        tuple: The paths of the players file and of the tournaments file.
+    """
+    players_file = os.path.join(directory, "data_players.json")
+    tournaments_file = os.path.join(directory, "data_tournament.json")
+    Player.journal(players_file).clear()
+    with open(players_file, "w") as json_file:
+        json.dump(roster, json_file, indent=4)
+    roster_by_id = {player["id"]: player for player in roster}
+    TournamentStore.write_tournaments(
+        tournaments_file,
+        {
+            key: json.dumps(TournamentStore.normalize(tournament_data, roster_by_id))
+            for key, tournament_data in tournaments.items()
+        },
+        {key: TournamentStore.header(tournament_data) for key, tournament_data in tournaments.items()},
+    )
+    return players_file, tournaments_file
@@ -0,0 +1,258 @@
+from datetime import datetime
+
+from easychess.controllers.tournament_controller import TournamentManagerController
+from easychess.models.tournament import Tournament
+from easychess.utils.utils import Utils
+
+
+class BatchManagerController:
+    """
+    Runs tournaments without interaction from a results script, with no prompts, pauses or screen clears.
+
+    The script is read line by line; empty lines and text after '#' are ignored:
+
+        tournoi: Open de Paris          starts a tournament
+        lieu: Paris
+        description: Open annuel de la ville
+        systeme: suisse                 or 'toutes-rondes' (defaults to suisse)
+        rounds: 5                       Swiss only, optional (defaults to ⌈log2 n⌉ + 2)
+        joueurs: 1 2 3 4 5 6 7 8        roster ids of the players, or 'tous'
+        round: 1 0 2 1                  results of the generated pairing, board by board
+        round:                          or a round replayed with its own pairing:
+        partie: 3 7 1                       white id, black id, result
+        exempt: 9                           id of the exempted player, if any
+
+    Results use the codes of the interactive mode: 1 (player 1 wins), 2 (player 2 wins), 0 (draw).
+    Each round is saved once all its results are applied. A tournament with fewer rounds than
+    planned is saved in progress and can be resumed interactively.
+    """
+
+    FIELDS = {"tournoi": "name", "lieu": "location", "description": "description"}
+
+    def __init__(self):
+        """
+        Initializes the BatchManagerController and switches the application to non-interactive mode.
+
+        Attributes:
+            tournament_controller (TournamentManagerController): The controller pairing and saving the tournaments.
+            repository (JsonRepository | SqliteRepository): The storage of players and tournaments.
+        """
+        Utils.interactive = False
+        self.tournament_controller = TournamentManagerController()
+        self.repository = self.tournament_controller.repository
+
+    def run(self, lines):
+        """
+        Runs every tournament of a results script.
+
+        Args:
+            lines (iterable): The lines of the script (an open file or sys.stdin).
+
+        Returns:
+            list: The tournaments played.
+
+        Raises:
+            ValueError: If a line is invalid, with its line number.
+        """
+        tournaments = []
+        infos = None
+        tournament = None
+        games = None
+        bye = None
+        for line_number, line in enumerate(lines, start=1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            keyword, _, value = line.partition(":")
+            keyword = keyword.strip().lower()
+            value = value.strip()
+            try:
+                if keyword in ("tournoi", "round") and games is not None:
+                    self.play_pairing(tournament, games, bye)
+                    games, bye = None, None
+                if keyword == "tournoi":
+                    if tournament is not None:
+                        tournaments.append(self.finish(tournament))
+                    infos = {"name": value, "location": "", "description": "", "pairing_system": Tournament.SWISS}
+                    tournament = None
+                elif infos is None:
+                    raise ValueError("le script doit commencer par 'tournoi:'")
+                elif keyword in self.FIELDS and tournament is None:
+                    infos[self.FIELDS[keyword]] = value
+                elif keyword == "systeme" and tournament is None:
+                    infos["pairing_system"] = self.parse_pairing_system(value)
+                elif keyword == "rounds" and tournament is None:
+                    infos["number_of_rounds"] = int(value)
+                elif keyword == "joueurs" and tournament is None:
+                    tournament = self.create_tournament(infos, value)
+                elif keyword == "round" and tournament is not None:
+                    if value:
+                        self.play_results(tournament, value.split())
+                    else:
+                        games = []
+                elif keyword == "partie" and games is not None:
+                    white_id, black_id, result = value.split()
+                    games.append((int(white_id), int(black_id), result))
+                elif keyword == "exempt" and games is not None:
+                    bye = int(value)
+                else:
+                    raise ValueError(f"instruction inattendue '{keyword}'")
+            except (ValueError, KeyError) as e:
+                raise ValueError(f"Ligne {line_number} : {e}")
+        if games is not None:
+            self.play_pairing(tournament, games, bye)
+        if tournament is not None:
+            tournaments.append(self.finish(tournament))
+        return tournaments
+
+    def parse_pairing_system(self, value):
+        """
+        Converts the pairing system of the script.
+
+        Args:
+            value (str): 'suisse' or 'toutes-rondes'.
+
+        Returns:
+            str: Tournament.SWISS or Tournament.ROUND_ROBIN.
+        """
+        systems = {"suisse": Tournament.SWISS, "toutes-rondes": Tournament.ROUND_ROBIN}
+        if value.lower() not in systems:
+            raise ValueError(f"système d'appariement inconnu '{value}'")
+        return systems[value.lower()]
+
+    def create_tournament(self, infos, value):
+        """
+        Creates the tournament, registers its players and sets its rounds.
+
+        Args:
+            infos (dict): The tournament fields read from the script.
+            value (str): The roster ids of the players, or 'tous'.
+
+        Returns:
+            Tournament: The tournament, ready for its first round.
+        """
+        tournament = Tournament.create(
+            (
+                infos["name"],
+                infos["location"],
+                infos["description"],
+                infos["pairing_system"],
+                infos.get("number_of_rounds"),
+            )
+        )
+        roster = {player["id"]: player for player in self.repository.read_players()}
+        player_ids = list(roster) if value.lower() == "tous" else [int(player_id) for player_id in value.split()]
+        for player_id in player_ids:
+            if player_id not in roster:
+                raise ValueError(f"joueur {player_id} inconnu")
+            tournament.add_player(dict(roster[player_id], score=0))
+        self.tournament_controller.get_players(tournament)
+        self.tournament_controller.generate_rounds(tournament)
+        tournament.start_date = datetime.now()
+        return tournament
+
+    def play_results(self, tournament, results):
+        """
+        Pairs the next round and applies its results, board by board.
+
+        The results are checked against the pairing before the round is created, so an invalid line
+        records neither matches nor bye.
+
+        Args:
+            tournament (Tournament): The tournament.
+            results (list): The result code of each board.
+        """
+        self.check_round_available(tournament)
+        pairs, bye = self.tournament_controller.pair_round(tournament, tournament.current_round)
+        self.check_results(results, len(pairs))
+        round = self.tournament_controller.get_round(tournament)
+        self.tournament_controller.create_matches(tournament, round, pairs, bye)
+        self.apply_results(tournament, round, results)
+
+    def play_pairing(self, tournament, games, bye):
+        """
+        Replays the next round with its own pairing and results.
+
+        Every player of the tournament must play exactly one game of the round or be exempted.
+
+        Args:
+            tournament (Tournament): The tournament.
+            games (list): The (white id, black id, result code) of each board.
+            bye (int): The id of the exempted player, or None.
+        """
+        self.check_round_available(tournament)
+        paired = [player_id for white_id, black_id, _ in games for player_id in (white_id, black_id)]
+        if bye is not None:
+            paired.append(bye)
+        if len(set(paired)) != len(paired):
+            raise ValueError("un joueur apparaît plusieurs fois dans le round")
+        unknown = [player_id for player_id in paired if player_id not in tournament.players_by_id]
+        if unknown:
+            raise ValueError(f"joueur {unknown[0]} absent du tournoi")
+        missing = [player_id for player_id in tournament.players_by_id if player_id not in paired]
+        if missing:
+            raise ValueError(f"joueur {missing[0]} ni apparié ni exempt dans le round")
+        results = [result for _, _, result in games]
+        self.check_results(results, len(games))
+        round = self.tournament_controller.get_round(tournament)
+        self.tournament_controller.create_matches(
+            tournament, round, [(white_id, black_id) for white_id, black_id, _ in games], bye
+        )
+        self.apply_results(tournament, round, results)
+
+    def check_round_available(self, tournament):
+        """
+        Checks that the tournament still has a round to play.
+
+        Args:
+            tournament (Tournament): The tournament.
+        """
+        if tournament.current_round >= tournament.number_of_rounds:
+            raise ValueError(f"le tournoi ne compte que {tournament.number_of_rounds} rounds")
+
+    def check_results(self, results, number_of_matches):
+        """
+        Checks the result codes of a round against the number of its matches.
+
+        Args:
+            results (list): The result code of each match, in board order.
+            number_of_matches (int): The number of matches of the round.
+        """
+        if len(results) != number_of_matches:
+            raise ValueError(f"{len(results)} résultats pour {number_of_matches} matchs")
+        invalid = [result for result in results if result not in ("0", "1", "2")]
+        if invalid:
+            raise ValueError(f"résultat invalide '{invalid[0]}' (1, 2 ou 0 attendu)")
+
+    def apply_results(self, tournament, round, results):
+        """
+        Applies the checked results of a round, then closes the round and saves the tournament.
+
+        Args:
+            tournament (Tournament): The tournament.
+            round (Round): The round, with its matches.
+            results (list): The result code of each match, in board order.
+        """
+        for match, result in zip(round.matches, results):
+            self.tournament_controller.record_result(match, tournament, result)
+        round.end_date_time = datetime.now()
+        tournament.current_round += 1
+        self.repository.save_tournament(tournament.as_dict())
+        print(f"{tournament.name} - {round.name} : {len(results)} résultats enregistrés")
+
+    def finish(self, tournament):
+        """
+        Ends the tournament if all its rounds were played, or leaves it in progress.
+
+        Args:
+            tournament (Tournament): The tournament.
+
+        Returns:
+            Tournament: The tournament.
+        """
+        if tournament.current_round >= tournament.number_of_rounds:
+            self.tournament_controller.finish_tournament(tournament)
+        else:
+            self.repository.save_tournament(tournament.as_dict())
+            print(f"{tournament.name} : en cours au round {tournament.current_round}/{tournament.number_of_rounds}")
+        return tournament
@@ -1,10 +1,10 @@
 from easychess.models.player import Player
+from easychess.storage.repository import get_repository
 from easychess.utils.player_validator import PlayerInputValidator
 from easychess.utils.sanitize import Sanitize
 from easychess.utils.utils import Utils
 from easychess.views.main_view import MainView
 from easychess.views.player_view import PlayerView
-from settings import PLAYERS_FILE
 
 
 class PlayerManagerController:
@@ -20,14 +20,14 @@ class PlayerManagerController:
         Attributes:
             main_view (MainView): The main view object for general application display.
             view (PlayerView): The view object for displaying player-related interfaces.
-            db_players (str): The path to the file where player data is stored.
+            repository (JsonRepository | SqliteRepository): The storage of players.
             sanitize (Sanitize): A sanitization object to clean user inputs.
             utils (Utils): Utility functions for general use.
             input_validator (PlayerInputValidator): A validator for ensuring player input correctness.
         """
         self.main_view = MainView()
         self.view = PlayerView()
-        self.db_players = PLAYERS_FILE
+        self.repository = get_repository()
         self.sanitize = Sanitize(self.view)
         self.utils = Utils()
         self.input_validator = PlayerInputValidator(self.utils, self.sanitize)
@@ -59,7 +59,7 @@ class PlayerManagerController:
     def create_player(self):
         """
         Handles the process of gathering player information and creating a new player.
-        The new player is saved to the file specified in `self.db_players`.
+        The new player is saved in `self.repository`.
 
         Returns:
             Player: The newly created player object, or False if player creation was unsuccessful.
@@ -68,7 +68,7 @@ class PlayerManagerController:
         if not player_info:
             return False
         new_player = Player.create(player_info)
-        Player.save(self.db_players, new_player.as_dict())
+        new_player.player_id = self.repository.save_player(new_player.as_dict())
         self.utils.display_success(f"Joueurs {new_player.first_name}, ajouté avec succès ! ")
         return new_player
 
@@ -113,7 +113,7 @@ class PlayerManagerController:
         The user can return to the player menu after viewing the list.
         """
         while True:
-            players_data = Player.read(self.db_players)
+            players_data = self.repository.read_players()
             players = [Player.from_dict(player_data) for player_data in players_data]
             formatted_players = [f"{i+1}. {str(player)}" for i, player in enumerate(players)]
             self.view.display_player_list("\n".join(formatted_players))
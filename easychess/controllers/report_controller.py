@@ -1,9 +1,10 @@
 from easychess.models.player import Player
-from easychess.models.tournament import Tournament
+from easychess.models.results_matrix import ResultsMatrix
+from easychess.models.tiebreaks import Tiebreaks
+from easychess.storage.repository import get_repository
 from easychess.utils.reports_validator import ReportsInputValidator
 from easychess.utils.utils import Utils
 from easychess.views.report_view import ReportView
-from settings import PLAYERS_FILE, TOURNAMENTS_FILE
 
 
 class ReportManagerController:
@@ -13,14 +14,12 @@ class ReportManagerController:
 
         Attributes:
         - view (ReportView): The view component for displaying reports.
-        - db_players (str): The path to the players file.
-        - db_tournaments (str): The path to the tournaments file.
+        - repository (JsonRepository | SqliteRepository): The storage of players and tournaments.
         - utils (Utils): Utility functions for the controller.
         - input_validator (ReportsInputValidator): Validator for report inputs.
         """
         self.view = ReportView()
-        self.db_players = PLAYERS_FILE
-        self.db_tournaments = TOURNAMENTS_FILE
+        self.repository = get_repository()
         self.utils = Utils()
         self.input_validator = ReportsInputValidator(self.utils)
 
@@ -47,25 +46,34 @@ class ReportManagerController:
         """
         Retrieves and displays the list of players sorted in alphabetical order.
 
-        The method reads player data from the specified file, sorts the players
+        The method reads player data from the repository, sorts the players
         by last name, and formats the output for display.
         """
-        players = Player.read(self.db_players)
+        self.view.display_alphabetical_players(self.alphabetical_players())
+
+    def alphabetical_players(self):
+        """
+        Builds the report of the players sorted in alphabetical order.
+
+        Returns:
+            list: The players formatted as strings.
+        """
+        players = self.repository.read_players()
         players.sort(key=lambda x: x["last_name"])
-        formatted_players = [
+        return [
             f"{player['last_name']} {player['first_name']} - "
-            f"{player['birthdate']} - National ID: {player['national_id']}"
+            f"{player['birthdate']} - National ID: {player['national_id']} - "
+            f"Elo: {player.get('rating', Player.DEFAULT_RATING):g}"
             for player in players
         ]
-        self.view.display_alphabetical_players(formatted_players)
 
     def get_all_tournaments(self):
         """
-        Retrieves and displays all tournaments from the specified file.
+        Retrieves and displays all tournaments from the repository.
 
-        The method reads tournament data and formats it for display.
+        The method reads the tournament headers only and formats them for display.
         """
-        tournaments = Tournament.read(self.db_tournaments)
+        tournaments = self.repository.read_tournament_headers()
         self.view.display_all_tournaments(tournaments)
 
     def get_tournament_by_name(self):
@@ -74,17 +82,27 @@ class ReportManagerController:
 
         The method prompts the user for a tournament name, validates the input,
         and if found, displays the tournament details along with the players
-        ranked by their scores.
+        ranked by their scores and tiebreaks.
         """
-        tournaments = Tournament.read(self.db_tournaments)
+        tournaments = self.repository.read_tournament_headers()
         self.view.display_tournaments_name(tournaments)
         tournament_name = self.input_validator.validate_tournament_name(
             self.view.ask_tournament_name_input, tournaments
         )
         if tournament_name:
-            for tournament in tournaments.values():
-                players = tournament["players"]
-                players.sort(key=lambda x: x["last_name"])
-                ranking_players = sorted(players, key=lambda x: x["score"], reverse=True)
-                self.view.display_tournament_details(tournament, ranking_players)
-                break
+            tournament, ranking_players, tiebreaks = self.tournament_details(tournament_name)
+            self.view.display_tournament_details(tournament, ranking_players, tiebreaks)
+
+    def tournament_details(self, tournament_name):
+        """
+        Builds the report of a tournament: its data and its players ranked by score, then by tiebreaks.
+
+        Args:
+            tournament_name (str): The name of the tournament.
+
+        Returns:
+            tuple: The tournament data, the list of its players in rank order and their tiebreaks.
+        """
+        tournament = self.repository.find_tournament(tournament_name)
+        tiebreaks = Tiebreaks(ResultsMatrix.from_dict(tournament))
+        return tournament, tiebreaks.ranked_players(), tiebreaks
@@ -1,16 +1,17 @@
 from datetime import datetime
-import random
-import time
 from easychess.controllers.player_controller import PlayerManagerController
 from easychess.models.match import Match
 from easychess.models.player import Player
 from easychess.models.round import Round
 from easychess.models.tournament import Tournament
+from easychess.pairing.round_robin import BergerTable
+from easychess.pairing.swiss_pairing import SwissPairing
+from easychess.rating.elo_rating import EloRating
+from easychess.storage.repository import get_repository
 from easychess.utils.sanitize import Sanitize
 from easychess.utils.tournament_validator import TournamentInputValidator
 from easychess.utils.utils import Utils
 from easychess.views.tournament_view import TournamentView
-from settings import TOURNAMENTS_FILE, PLAYERS_FILE
 
 
 class TournamentManagerController:
@@ -26,17 +27,15 @@ class TournamentManagerController:
 
         Attributes:
             view (TournamentView): The view object for displaying tournament information.
-            db_tournament (str): The file path for storing tournament data.
-            db_player (str): The file path for storing player data.
+            repository (JsonRepository | SqliteRepository): The storage of players and tournaments.
             sanitize (Sanitize): The sanitizer object for input sanitization.
             input_validator (TournamentInputValidator): The validator object for validating user input.
         """
         self.view = TournamentView()
-        self.db_tournament = TOURNAMENTS_FILE
-        self.db_player = PLAYERS_FILE
+        self.repository = get_repository()
         self.utils = Utils()
         self.sanitize = Sanitize(self.view)
-        self.input_validator = TournamentInputValidator(self.utils, self.db_player, self.sanitize)
+        self.input_validator = TournamentInputValidator(self.utils, self.repository, self.sanitize)
 
     def show_menu_options(self):
         """
@@ -86,7 +85,8 @@ class TournamentManagerController:
         Gathers information necessary to create a new tournament from user input.
 
         Returns:
-            tuple: A tuple containing the tournament name, location, and description or False if invalid.
+            tuple: A tuple containing the tournament name, location, description, pairing system
+            and number of rounds (None to compute it from the number of players) or False if invalid.
         """
         while True:
             name = self.input_validator.validate_name(self.view.ask_name)
@@ -98,7 +98,16 @@ class TournamentManagerController:
             description = self.input_validator.validate_description(self.view.ask_description)
             if description is False:
                 break
-            tournament_info = name, location, description
+            pairing_system = self.input_validator.validate_pairing_system(self.view.ask_pairing_system)
+            if pairing_system is False:
+                break
+            number_of_rounds = None
+            if pairing_system == "1":
+                number_of_rounds = self.input_validator.validate_number_of_rounds(self.view.ask_number_of_rounds)
+                if number_of_rounds is False:
+                    break
+            pairing_system = Tournament.ROUND_ROBIN if pairing_system == "2" else Tournament.SWISS
+            tournament_info = name, location, description, pairing_system, number_of_rounds
             return tournament_info
 
     def choose_players_registration_method(self, new_tournament):
@@ -140,8 +149,9 @@ class TournamentManagerController:
             Exception: If an error occurs during automatic registration.
         """
         try:
-            players = Player.read(self.db_player)
-            new_tournament.players.extend(players)
+            players = self.repository.read_players()
+            for player in players:
+                new_tournament.add_player(player)
             return new_tournament
         except Exception as e:
             raise Exception(f"Une erreur est survenue lors de l'enregistrement automatique des joueurs : {str(e)}")
@@ -161,7 +171,7 @@ class TournamentManagerController:
             Exception: If an error occurs during manual registration.
         """
         try:
-            players = Player.read(self.db_player)
+            players = self.repository.read_players()
             selected_player_indices = self.input_validator.validate_selected_players(
                 self.view.ask_player_selection, players
             )
@@ -169,7 +179,7 @@ class TournamentManagerController:
             for idx in selected_player_indices:
                 if 0 <= idx < len(players):
                     player = players[idx]
-                    new_tournament.players.append(player)
+                    new_tournament.add_player(player)
                 else:
                     raise IndexError("Le joueur à cet index n'existe pas.")
             return new_tournament
@@ -189,7 +199,7 @@ class TournamentManagerController:
         while True:
             self.player_manager_controller = PlayerManagerController()
             new_player = self.player_manager_controller.create_player()
-            new_tournament.players.append(new_player.as_dict())
+            new_tournament.add_player(new_player.as_dict())
             add_another = self.input_validator.validate_add_new_player(self.view.ask_add_another_player)
             if add_another == "o":
                 continue
@@ -211,286 +221,283 @@ class TournamentManagerController:
             if len(new_tournament.players) < 5:
                 print("Erreur : Il doit y avoir au moins 5 joueurs pour démarrer le tournoi.")
                 return None
-            list_rounds = self.generate_rounds(new_tournament)
-            self.generate_matches(new_tournament, list_rounds[0])
+            first_round = self.generate_rounds(new_tournament)
+            self.generate_matches(new_tournament, first_round)
             return new_tournament
         return choice if choice == "0" else None
 
     def generate_rounds(self, new_tournament):
-        num_players = len(new_tournament.players)
-        num_rounds = num_players - 1
-        new_tournament.number_of_rounds = num_rounds
-        list_rounds = []
-        for i in range(1, num_rounds + 1):
-            round_name = f"Round {i}"
-            round_obj = Round.create(round_name)
-            list_rounds.append(round_obj)
-            new_tournament.list_rounds.append(round_obj)
-        return list_rounds
-
-    def generate_matches(self, new_tournament, round):
         """
-        Generates player pairs for a round of the tournament.
+        Sets the number of rounds of the tournament and creates its first round.
+
+        A round-robin plays the whole Berger schedule, computed here once. A Swiss tournament plays
+        the number of rounds chosen at its creation, or ⌈log2 n⌉ + SwissPairing.EXTRA_ROUNDS by default,
+        without exceeding n - 1 rounds. The following rounds are created as the tournament advances.
 
         Args:
-            new_tournament (Tournament): The tournament for which matches are generated.
-            round (Round): The current round for which matches are to be created.
+            new_tournament (Tournament): The tournament for which rounds are created.
+
+        Returns:
+            Round: The first round of the tournament.
         """
-        players = self.get_players(new_tournament)
-        players_shuffle = self.shuffle_players(players)
-        players_sorted = self.sort_players_by_score(players_shuffle)
-        self.create_matches(players_sorted, round, new_tournament)
+        num_players = len(new_tournament.players)
+        if new_tournament.pairing_system == Tournament.ROUND_ROBIN:
+            new_tournament.schedule = BergerTable([player["id"] for player in new_tournament.players])
+            new_tournament.number_of_rounds = len(new_tournament.schedule.rounds)
+        else:
+            num_rounds = new_tournament.number_of_rounds or SwissPairing.round_count(num_players)
+            new_tournament.number_of_rounds = min(num_rounds, num_players - 1)
+        return self.get_round(new_tournament)
 
-    def get_players(self, new_tournament):
+    def get_round(self, new_tournament):
         """
-        Retrieves the players registered in the tournament.
+        Returns the current round of the tournament, creating it if it does not exist yet.
 
         Args:
-            new_tournament (Tournament): The tournament from which to get players.
+            new_tournament (Tournament): The tournament.
 
         Returns:
-            list: The list of players participating in the tournament.
-
-        Raises:
-            ValueError: If there are not enough players to create matches.
+            Round: The current round.
         """
-        players = new_tournament.players
-        if len(players) < 5:
-            raise ValueError("Pas assez de joueurs pour créer des matchs.")
-        return players
+        while len(new_tournament.list_rounds) <= new_tournament.current_round:
+            new_tournament.list_rounds.append(Round.create(f"Round {len(new_tournament.list_rounds) + 1}"))
+        return new_tournament.list_rounds[new_tournament.current_round]
 
-    def shuffle_players(self, players):
+    def generate_matches(self, new_tournament, round):
         """
-        Randomly shuffles the list of players.
+        Generates player pairs for a round of the tournament, from the Berger schedule for a
+        round-robin, with the Swiss pairing engine otherwise.
 
         Args:
-            players (list): The list of players to shuffle.
-
-        Returns:
-            list: The shuffled list of players.
+            new_tournament (Tournament): The tournament for which matches are generated.
+            round (Round): The current round for which matches are to be created.
         """
-        random.shuffle(players)
-        return players
+        pairs, bye = self.pair_round(new_tournament, new_tournament.list_rounds.index(round))
+        self.create_matches(new_tournament, round, pairs, bye)
 
-    def sort_players_by_score(self, players_shuffle):
+    def pair_round(self, new_tournament, round_index):
         """
-        Sorts players by their score in descending order.
+        Computes the pairing of a round of the tournament, without creating its matches.
 
         Args:
-            players_shuffle (list): The shuffled list of players to sort.
+            new_tournament (Tournament): The tournament.
+            round_index (int): The index of the round.
 
         Returns:
-            list: The sorted list of players.
+            tuple: The (white id, black id) pairs in board order, and the id of the exempted player or None.
         """
-        players_sorted = sorted(players_shuffle, key=lambda x: x["score"], reverse=True)
-        return players_sorted
+        players = self.get_players(new_tournament)
+        if new_tournament.pairing_system == Tournament.ROUND_ROBIN:
+            if new_tournament.schedule is None:
+                new_tournament.schedule = BergerTable([player["id"] for player in players])
+            return new_tournament.schedule.pair_round(round_index)
+        return SwissPairing(new_tournament).pair_round()
 
-    def create_matches(self, players_sorted, round, tournament):
+    def create_matches(self, new_tournament, round, pairs, bye=None):
         """
-        Crée les matches pour un tour du tournoi tout en évitant les rencontres répétées si possible.
-        Si aucun match inédit n'est possible, un appariement forcé est fait.
+        Creates the matches of a round from its pairing.
 
         Args:
-            players_sorted (list): La liste triée des joueurs à apparier pour les matches.
-            round (Round): Le tour actuel pour lequel les matches sont créés.
-            tournament (Tournament): Le tournoi auquel appartiennent les matches.
+            new_tournament (Tournament): The tournament of the round.
+            round (Round): The round.
+            pairs (list): The (white id, black id) pairs, in board order.
+            bye (int, optional): The id of the player exempted from the round. Defaults to None.
         """
-        # Initialiser la liste des matches pour ce tour
         round.matches = []
+        for white_id, black_id in pairs:
+            match = Match.create(white_id, black_id)
+            round.add_match(match)
+            new_tournament.record_match(match)
+        if bye is not None:
+            round.bye = bye
+            new_tournament.byes.add(bye)
+            self.handle_odd_player(new_tournament, bye)
 
-        # Set pour suivre les joueurs qui ont déjà été appariés dans ce tour
-        matched_players = set()
-
-        # Liste des joueurs non appariés dans ce tour
-        unpaired_players = players_sorted[:]
-
-        i = 0  # indice pour parcourir la liste des joueurs
-
-        while i < len(unpaired_players):  # tant que i est inférieur à la longueur de la liste des joueurs non appariés
-            player1 = unpaired_players[i]
-
-            # Si 'player1' est déjà apparié, passer au joueur suivant
-            if player1["last_name"] in matched_players:
-                i += 1
-                continue
-
-            # Tenter d'apparier 'player1' avec un adversaire
-            matched = False
-            for j in range(i + 1, len(unpaired_players)):
-                player2 = unpaired_players[j]
-
-                # Vérifier si les joueurs se sont déjà rencontrés
-                if not self.have_players_met(player1, player2, tournament):
-                    # Créer le match et ajouter les joueurs à la liste des appariés
-                    print(f"Appariement réussi: {player1['last_name']} vs {player2['last_name']}")
-                    match = Match.create(player1, player2)
-                    round.add_match(match)
-                    matched_players.add(player1["last_name"])
-                    matched_players.add(player2["last_name"])
-
-                    # Supprimer 'player2' de la liste des joueurs non appariés
-                    unpaired_players.pop(j)
-                    matched = True
-                    break
-
-            if not matched:
-                # Si aucun appariement inédit n'a été trouvé, tenter d'autres stratégies avant d'appairer de force
-                print(f"Pas d'adversaire inédit pour {player1['last_name']}, recherche plus large...")
-
-                # Recherche élargie parmi les joueurs non appariés restants
-                for k in range(i + 1, len(unpaired_players)):
-                    player2 = unpaired_players[k]
-
-                    # Si un joueur est disponible plus loin dans la liste
-                    if player2["last_name"] not in matched_players:
-                        print(
-                            f"Appariement forcé: {player1['last_name']} avec {player2['last_name']}(recherche étendue)"
-                        )
-                        match = Match.create(player1, player2)
-                        round.add_match(match)
-                        matched_players.add(player1["last_name"])
-                        matched_players.add(player2["last_name"])
-                        unpaired_players.pop(k)
-                        break
-                else:
-                    # Si même la recherche élargie échoue, forcer l'appariement avec le joueur suivant immédiat
-                    if i + 1 < len(unpaired_players):
-                        player2 = unpaired_players[i + 1]
-                        print(f"Appariement forcé final: {player1['last_name']} avec {player2['last_name']}")
-                        match = Match.create(player1, player2)
-                        round.add_match(match)
-                        matched_players.add(player1["last_name"])
-                        matched_players.add(player2["last_name"])
-
-            # Passer au joueur suivant
-            i += 1
-
-        # Gérer le cas où le nombre de joueurs est impair
-        if len(unpaired_players) % 2 != 0:
-            last_player = unpaired_players[-1]
-            if last_player["last_name"] not in matched_players:
-                self.handle_odd_player(last_player)
-
-    def have_players_met(self, player1, player2, tournament):
+    def get_players(self, new_tournament):
         """
-        Checks if two players have already faced each other in the tournament.
+        Retrieves the players registered in the tournament.
 
         Args:
-            player1 (dict): The first player.
-            player2 (dict): The second player.
-            tournament (Tournament): The tournament to check against.
+            new_tournament (Tournament): The tournament from which to get players.
 
         Returns:
-            bool: True if the players have met, False otherwise.
-        """
-        for round in tournament.list_rounds:
-            for match in round.matches:
-                if (
-                    match.player1["last_name"] == player1["last_name"]
-                    and match.player2["last_name"] == player2["last_name"]
-                ) or (
-                    match.player1["last_name"] == player2["last_name"]
-                    and match.player2["last_name"] == player1["last_name"]
-                ):
-                    return True
-        return False
-
-    def handle_odd_player(self, player):
+            list: The list of players participating in the tournament.
+
+        Raises:
+            ValueError: If there are not enough players to create matches.
+        """
+        players = new_tournament.players
+        if len(players) < 5:
+            raise ValueError("Pas assez de joueurs pour créer des matchs.")
+        return players
+
+    def handle_odd_player(self, new_tournament, player_id):
         """
         Handles the situation of having an odd number of players.
 
         Args:
-            player (dict): The player without an opponent.
+            new_tournament (Tournament): The tournament.
+            player_id (int): The id of the player without an opponent.
         """
-        player["score"] += 0.5
+        new_tournament.add_points(player_id, 0.5)
+        player = new_tournament.get_player(player_id)
         self.utils.display_success(f"{player['last_name']} {player['first_name']} a un bye et marque 0,5 point.")
 
     def start_tournament(self, new_tournament):
+        """
+        Plays the tournament round by round, from its current round.
+
+        A snapshot of the tournament is saved at the start of every round, and every result is
+        checkpointed as it is entered, so an interrupted tournament can be resumed.
+
+        Args:
+            new_tournament (Tournament): The tournament to play or resume.
+
+        Returns:
+            bool: True if the tournament is over, False otherwise.
+        """
         if not new_tournament:
             return False
 
-        new_tournament.status = True
-        new_tournament.start_date = datetime.now()
+        # Un tournoi en cours garde le statut None jusqu'à sa fin
+        new_tournament.status = None
+        if not new_tournament.start_date:
+            new_tournament.start_date = datetime.now()
 
         print(f"Début du tournoi: {new_tournament.name}")
         print(f"Nombre de rounds: {new_tournament.number_of_rounds}")
         print(f"Round actuel: {new_tournament.current_round}")
-        time.sleep(1)
+        self.utils.pause(1)
 
-        while new_tournament.current_round <= new_tournament.number_of_rounds:
+        while new_tournament.current_round < new_tournament.number_of_rounds:
             print(f"Jouer round {new_tournament.current_round}/{new_tournament.number_of_rounds}")
 
-            round = new_tournament.list_rounds[new_tournament.current_round]
+            round = self.get_round(new_tournament)
 
             if not round.matches:
                 self.generate_matches(new_tournament, round)
                 print(f"Matchs générés pour le round {new_tournament.current_round}")
+            self.repository.save_tournament(new_tournament.as_dict())
 
             self.play_round(round, new_tournament, new_tournament.current_round)
 
             if not self.prepare_next_round(new_tournament):
+                if new_tournament.current_round >= new_tournament.number_of_rounds:
+                    return bool(new_tournament.status)
                 print(f"Le tournoi s'arrête au round {new_tournament.current_round}")
-                new_tournament.status = None
                 self.end_tournament(new_tournament)
                 return False
 
-        self.end_tournament(new_tournament)
-        return True
+        return self.finish_tournament(new_tournament)
 
     def play_round(self, round, new_tournament, round_index):
         """
         Plays a round of the tournament, managing individual matches.
 
+        The results of the whole round can first be entered at once; they are validated together
+        and checkpointed as a single record. The remaining matches are then entered one by one,
+        each result being checkpointed as soon as it is entered. Matches already played
+        (when resuming a tournament) are skipped.
+
         Args:
             round (Round): The round to be played.
+            new_tournament (Tournament): The tournament of the round.
             round_index (int): The index of the round in the tournament.
         """
+        open_boards = [index for index, match in enumerate(round.matches) if not match.score1 + match.score2]
+        if open_boards:
+            self.play_round_results(round, new_tournament, round_index, open_boards)
         for match_index, match in enumerate(round.matches):
+            if match.score1 + match.score2:
+                continue
             self.view.display(round, round_index)
-            self.play_match(match, match_index)
+            self.play_match(match, match_index, new_tournament)
+            self.repository.save_match(new_tournament.as_dict(), round_index, match_index)
         round.end_date_time = datetime.now()
         new_tournament.current_round += 1
 
-    def play_match(self, match, match_index):
+    def play_round_results(self, round, new_tournament, round_index, open_boards):
+        """
+        Asks for the results of the round in a single entry, validates all of them, then applies
+        them to the scores and checkpoints them at once. An empty entry skips to match by match entry.
+
+        Args:
+            round (Round): The round being played.
+            new_tournament (Tournament): The tournament of the round.
+            round_index (int): The index of the round in the tournament.
+            open_boards (list): The indexes of the matches still to be played.
+        """
+        self.view.display(round, round_index)
+        while True:
+            entry = self.view.ask_round_results(round, open_boards, new_tournament.players_by_id)
+            if not entry.strip():
+                return
+            results = self.input_validator.validate_round_results(entry, open_boards)
+            if results:
+                break
+        for match_index, result in results.items():
+            self.record_result(round.matches[match_index], new_tournament, result)
+        self.repository.save_matches(new_tournament.as_dict(), round_index, list(results))
+        self.utils.display_success(f"{len(results)} résultats enregistrés.")
+
+    def play_match(self, match, match_index, new_tournament):
         """
         Plays a match and updates the scores based on the winner.
 
         Args:
             match (Match): The match to be played.
             match_index (int): The index of the match in the round.
+            new_tournament (Tournament): The tournament of the match.
         """
+        player1 = new_tournament.get_player(match.player1_id)
+        player2 = new_tournament.get_player(match.player2_id)
         while True:
-            ask_winner_match = self.input_validator.validate_match(self.view.ask_validate_match(match, match_index))
+            ask_winner_match = self.input_validator.validate_match(
+                self.view.ask_validate_match(match, match_index, player1, player2)
+            )
             if ask_winner_match:
-                if ask_winner_match == "1":
-                    match.set_score(1, 0)
-                    match.player1["score"] += 1
-                elif ask_winner_match == "2":
-                    match.set_score(0, 1)
-                    match.player2["score"] += 1
-                elif ask_winner_match == "0":
-                    match.set_score(0.5, 0.5)
-                    match.player1["score"] += 0.5
-                    match.player2["score"] += 0.5
+                self.record_result(match, new_tournament, ask_winner_match)
                 break
 
+    def record_result(self, match, new_tournament, result):
+        """
+        Records the result of a match and updates the scores of its players.
+
+        Args:
+            match (Match): The match.
+            new_tournament (Tournament): The tournament of the match.
+            result (str): "1" if player 1 wins, "2" if player 2 wins, "0" for a draw.
+        """
+        scores = {"1": (1, 0), "2": (0, 1), "0": (0.5, 0.5)}
+        if result in scores:
+            score1, score2 = scores[result]
+            match.set_score(score1, score2)
+            new_tournament.add_points(match.player1_id, score1)
+            new_tournament.add_points(match.player2_id, score2)
+
     def prepare_next_round(self, new_tournament):
+        """
+        Ends the tournament after its last round, or creates and pairs the next round if the user continues.
+
+        Args:
+            new_tournament (Tournament): The tournament.
+
+        Returns:
+            bool: True if the next round is ready to be played, False otherwise.
+        """
         if new_tournament.current_round >= new_tournament.number_of_rounds:
-            new_tournament.status = True
-            self.end_tournament(new_tournament)
+            self.finish_tournament(new_tournament)
             return False
 
         next_round_input = self.input_validator.validate_input(self.view.ask_next_round)
         if next_round_input == "o":
-            if new_tournament.current_round <= new_tournament.number_of_rounds:
+            if new_tournament.current_round < new_tournament.number_of_rounds - 1:
                 self.utils.display_success("Tour suivant...")
-                if not new_tournament.list_rounds[new_tournament.current_round].matches:
-                    self.generate_matches(new_tournament, new_tournament.list_rounds[new_tournament.current_round])
             else:
-                # Si c'est le dernier round, jouer les matchs sans incrémenter le round
                 self.utils.display_success("Dernier tour...")
-                if not new_tournament.list_rounds[new_tournament.current_round].matches:
-                    self.generate_matches(new_tournament, new_tournament.list_rounds[new_tournament.current_round])
+            round = self.get_round(new_tournament)
+            if not round.matches:
+                self.generate_matches(new_tournament, round)
             return True
         elif next_round_input == "n":
             self.utils.display_success("Retour au menu principal...")
@@ -500,26 +507,117 @@ class TournamentManagerController:
         """
         Ends the tournament, finalizing the results and cleaning up.
 
+        The save is checked: if another process saved the tournament since it was read, the arbiter is
+        asked to reload it instead.
+
         Args:
             new_tournament (Tournament): The tournament that is being ended.
+
+        Returns:
+            bool: True if the tournament was saved, False otherwise.
         """
         new_tournament.end_date = datetime.now()
-        Tournament.save(self.db_tournament, new_tournament.as_dict())
+        self.repository.save_tournament(new_tournament.as_dict())
+        try:
+            self.repository.check_tournament_saved(new_tournament.name)
+        except Exception as e:
+            self.utils.display_error(f"{e}. Rechargez le tournoi depuis le menu de reprise.")
+            return False
         self.utils.display_success("Fin du tournoi !")
+        return True
+
+    def finish_tournament(self, new_tournament):
+        """
+        Marks the tournament as finished after its last round, ends it and rates its games.
+
+        A tournament paused between rounds is only ended: it is rated once, when it finishes.
+
+        If the tournament could not be saved, it stays in progress and is not rated.
+
+        Args:
+            new_tournament (Tournament): The tournament whose last round has been played.
+
+        Returns:
+            bool: True if the tournament was saved as finished, False otherwise.
+        """
+        new_tournament.status = True
+        if not self.end_tournament(new_tournament):
+            new_tournament.status = None
+            return False
+        if any(change for change, _ in self.update_ratings(new_tournament).values()):
+            self.utils.display_success("Classements Elo mis à jour.")
+        else:
+            self.utils.display_success("Aucun classement Elo modifié.")
+        return True
+
+    def update_ratings(self, new_tournament):
+        """
+        Rates the games of a finished tournament and saves the new ratings of its players in the roster.
+
+        Tournaments still in progress are not rated, so that their games are rated once, against the
+        ratings the players had before the tournament.
+
+        Only the players found in the roster are rated from, and saved to, their roster entry, see roster_ids.
+        The others start at the default rating and are not saved.
+
+        Args:
+            new_tournament (Tournament): The finished tournament.
+
+        Returns:
+            dict: The (rating change, number of rated games) saved for each roster id.
+        """
+        if not new_tournament.status:
+            return {}
+        roster = {player["id"]: player for player in self.repository.read_players()}
+        roster_ids = self.roster_ids(new_tournament, roster)
+        elo_rating = EloRating(dict(roster[roster_id], id=player_id) for player_id, roster_id in roster_ids.items())
+        changes = elo_rating.rate_tournament(new_tournament)
+        rated_ids = [player_id for player_id in changes if player_id in roster_ids]
+        saved = {
+            roster_ids[player_id]: change
+            for player_id, change in EloRating.roster_changes(changes, rated_ids).items()
+        }
+        if saved:
+            self.repository.save_ratings(saved)
+        return saved
+
+    @staticmethod
+    def roster_ids(new_tournament, roster):
+        """
+        Finds the roster entry of each player of a tournament.
+
+        The players added from the roster keep their roster id: they are their roster entry with the same id
+        (see Player.is_roster_player). The players of tournaments saved before player ids existed received
+        ids local to their tournament when migrated: they are found by their national ID, if they have one.
+
+        Args:
+            new_tournament (Tournament): The tournament.
+            roster (dict): The player dictionaries of the roster, by id.
+
+        Returns:
+            dict: The roster id of each player id of the tournament found in the roster.
+        """
+        ids_by_national_id = {}
+        for player in roster.values():
+            if player.get("national_id"):
+                ids_by_national_id.setdefault(player["national_id"], player["id"])
+        roster_ids = {}
+        for player in new_tournament.players:
+            if Player.is_roster_player(player, roster.get(player["id"])):
+                roster_ids[player["id"]] = player["id"]
+            elif player.get("national_id") in ids_by_national_id:
+                roster_ids[player["id"]] = ids_by_national_id[player["national_id"]]
+        return roster_ids
 
     def get_tournament_by_name(self):
         """
         Retrieves and displays details of tournaments with 'None' status.
 
-        The method retrieves all tournaments, filters the ones with a 'None' status,
-        and displays their details. If a tournament name is found, it attempts to start that tournament.
+        The method reads the headers of the tournaments with a 'None' status only, and displays
+        their details. If a tournament is selected, it is loaded and resumed.
         """
-        tournaments = Tournament.read(self.db_tournament)
-        none_status_tournaments = {
-            key + 1: tournament
-            for key, tournament in enumerate(tournaments.items())
-            if tournament[1].get("status") is None
-        }
+        headers = self.repository.find_tournaments_by_status(None)
+        none_status_tournaments = dict(enumerate(headers.items(), start=1))
         if not none_status_tournaments:
             self.utils.display_success("Aucun tournois en cour ! ")
             return
@@ -531,12 +629,13 @@ class TournamentManagerController:
             self.transform_to_obj(tournament_index, none_status_tournaments)
 
     def transform_to_obj(self, tournament_index, none_status_tournaments):
-        selected_tournament = none_status_tournaments[tournament_index]
-        tournament = Tournament(**selected_tournament[1])
-        rounds = []
-        for round_dict in tournament.list_rounds:
-            round = Round(**round_dict)
-            round.matches = [Match.from_tuple(match) for match in round_dict["matches"]]
-            rounds.append(round)
-        tournament.list_rounds = rounds
+        """
+        Rebuilds the selected tournament, with its checkpointed results, and resumes it.
+
+        Args:
+            tournament_index (int): The index of the selected tournament.
+            none_status_tournaments (dict): The (key, header) of the tournaments in progress, by index.
+        """
+        tournament_key, _ = none_status_tournaments[tournament_index]
+        tournament = Tournament.from_dict(self.repository.read_tournament(tournament_key))
         self.start_tournament(tournament)
@@ -3,50 +3,54 @@ class Match:
     Represents a match between two players.
 
     Attributes:
-        player1 (dict): Dictionary containing information about the first player.
+        player1_id (int): The id of the first player.
         score1 (int): Score of the first player.
-        player2 (dict): Dictionary containing information about the second player.
+        player2_id (int): The id of the second player.
         score2 (int): Score of the second player.
+
+    Matches reference their players by id and are stored in slots, without an instance dictionary.
     """
 
-    def __init__(self, player1, player2, score1=0, score2=0):
+    __slots__ = ("player1_id", "player2_id", "score1", "score2")
+
+    def __init__(self, player1_id, player2_id, score1=0, score2=0):
         """
         Initializes a new match.
 
         Args:
-            player1 (dict): Dictionary containing information about the first player.
-            player2 (dict): Dictionary containing information about the second player.
+            player1_id (int): The id of the first player.
+            player2_id (int): The id of the second player.
         """
-        self.player1 = player1
-        self.player2 = player2
+        self.player1_id = player1_id
+        self.player2_id = player2_id
         self.score1 = score1
         self.score2 = score2
 
     @classmethod
-    def create(cls, player1, player2):
+    def create(cls, player1_id, player2_id):
         """
         Creates a new instance of Match.
 
         Args:
-            player1 (dict): Dictionary containing information about the first player.
-            player2 (dict): Dictionary containing information about the second player.
+            player1_id (int): The id of the first player.
+            player2_id (int): The id of the second player.
 
         Returns:
             Match: A new instance of the Match class.
         """
-        return cls(player1, player2)
+        return cls(player1_id, player2_id)
 
     def __str__(self):
         """
         Returns a string representation of the Match object.
 
         Returns:
-            str: A formatted string representing the match with player names and scores.
+            str: A formatted string representing the match with player ids and scores.
         """
         return (
-            f"{self.player1['first_name']} {self.player1['last_name']}\n"
+            f"Joueur {self.player1_id}\n"
             f"Score: {self.score1:>2} - {self.score2:<2}\n"
-            f"{self.player2['first_name']} {self.player2['last_name']}"
+            f"Joueur {self.player2_id}"
         )
 
     def set_score(self, score1, score2):
@@ -65,19 +69,28 @@ class Match:
         Returns a tuple representation of the match.
 
         Returns:
-            tuple: A tuple containing two lists, each with a player's full name and score.
+            tuple: A tuple containing two lists, each with a player's id and score.
         """
         return (
-            [f"{self.player1['last_name']} {self.player1['first_name']}", self.score1],
-            [f"{self.player2['last_name']} {self.player2['first_name']}", self.score2],
+            [self.player1_id, self.score1],
+            [self.player2_id, self.score2],
         )
 
     @classmethod
     def from_tuple(cls, match_tuple):
-        player1_name, score1 = match_tuple[0]
-        player2_name, score2 = match_tuple[1]
-        player1_last_name, player1_first_name = player1_name.split()
-        player2_last_name, player2_first_name = player2_name.split()
-        player1 = {"last_name": player1_last_name, "first_name": player1_first_name}
-        player2 = {"last_name": player2_last_name, "first_name": player2_first_name}
-        return cls(player1, player2, score1, score2)
+        """
+        Creates a Match from its tuple representation.
+
+        Matches saved before player ids existed referenced players by their "last_name first_name":
+        the version 1 to 2 migration of the stored tournaments resolves these names to ids, so the
+        pairs always hold player ids here.
+
+        Args:
+            match_tuple (tuple): Two [player id, score] pairs.
+
+        Returns:
+            Match: The match.
+        """
+        player1_id, score1 = match_tuple[0]
+        player2_id, score2 = match_tuple[1]
+        return cls(player1_id, player2_id, score1, score2)
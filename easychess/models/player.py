@@ -1,16 +1,58 @@
 from datetime import datetime
 import json
+import os
+
+from easychess.storage.file_lock import FileLock
+from easychess.storage.journal import Journal
 
 
 class Player:
     """
-    Represents a player with personal information and a score.
+    Represents a player with personal information, a score and an Elo rating.
 
     This class handles player data, including creation, reading from and saving to JSON files,
     and score updates.
+
+    New players are appended to a JSON Lines journal next to the players file, and the journal
+    is periodically compacted into the JSON file. Registrations, compactions and rating updates
+    hold the lock of the players file, so that concurrent processes lose none of them.
+
+    Every player has a stable integer id: its position in the roster, starting at 1.
+
+    Players are stored in slots, without an instance dictionary, and the birthdate is only parsed
+    when it is first read, so that loading a large roster stays cheap.
     """
 
-    def __init__(self, last_name, first_name, birthdate, national_id, score=0):
+    __slots__ = (
+        "player_id",
+        "last_name",
+        "first_name",
+        "_birthdate",
+        "national_id",
+        "score",
+        "rating",
+        "rated_games",
+    )
+
+    JOURNAL_COMPACTION_SIZE = 1024 * 1024
+
+    # Rating of a player who has not played a rated game yet
+    DEFAULT_RATING = 1500
+
+    # Fields identifying a player of a tournament as a player of the roster with the same id
+    IDENTITY_FIELDS = ("last_name", "first_name", "national_id")
+
+    def __init__(
+        self,
+        last_name,
+        first_name,
+        birthdate,
+        national_id,
+        score=0,
+        player_id=None,
+        rating=DEFAULT_RATING,
+        rated_games=0,
+    ):
         """
         Initialize a Player object.
 
@@ -20,12 +62,30 @@ class Player:
             birthdate (str): The player's birthdate in 'dd/mm/yyyy' format.
             national_id (str): The player's national ID.
             score (float, optional): The player's score. Defaults to 0.
+            player_id (int, optional): The player's id in the roster. Defaults to None (not saved yet).
+            rating (float, optional): The player's Elo rating. Defaults to DEFAULT_RATING.
+            rated_games (int, optional): The number of rated games played. Defaults to 0.
         """
+        self.player_id = player_id
         self.last_name = last_name
         self.first_name = first_name
-        self.birthdate = datetime.strptime(birthdate, "%d/%m/%Y")
+        self._birthdate = birthdate
         self.national_id = national_id
         self.score = score
+        self.rating = rating
+        self.rated_games = rated_games
+
+    @property
+    def birthdate(self):
+        """
+        The player's birthdate, parsed from its 'dd/mm/yyyy' text on first access.
+
+        Returns:
+            datetime: The birthdate.
+        """
+        if isinstance(self._birthdate, str):
+            self._birthdate = datetime.strptime(self._birthdate, "%d/%m/%Y")
+        return self._birthdate
 
     def __str__(self):
         """
@@ -55,42 +115,142 @@ class Player:
         first_name, last_name, birthdate, national_id = player_info
         return cls(first_name, last_name, birthdate, national_id)
 
+    @classmethod
+    def journal(cls, file_path):
+        """
+        Return the journal holding the players registered since the last compaction.
+
+        The journal lives next to the players file, e.g. 'data_players.jsonl' for 'data_players.json'.
+
+        Args:
+            file_path (str): The path to the JSON file.
+
+        Returns:
+            Journal: The journal of the players file.
+        """
+        return Journal(os.path.splitext(str(file_path))[0] + ".jsonl")
+
     @classmethod
     def read(cls, file_path):
         """
-        Read player data from a JSON file.
+        Read player data from a JSON file and its journal.
 
         Args:
             file_path (str): The path to the JSON file.
 
         Returns:
-            dict: A dictionary of player data, or an empty dict if the file is not found.
+            list: A list of player data (compacted players followed by journaled ones),
+            or an empty list if neither file exists.
         """
         try:
             with open(file_path, "r") as json_file:
-                return json.load(json_file)
+                players = json.load(json_file)
         except FileNotFoundError:
-            return {}
+            players = []
+        for position, player in enumerate(players, start=1):
+            # Players saved before ids existed are identified by their position in the roster
+            player.setdefault("id", position)
+        players.extend(cls.journal(file_path).read())
+        return players
 
     @classmethod
     def save(cls, file_path, player_data):
         """
-        Save player data to a JSON file.
+        Save player data by appending it to the journal of the JSON file.
+
+        The player receives the next id of the roster, found from the last journaled player
+        (or from the JSON file when the journal is empty).
+        The journal is folded back into the JSON file once it grows beyond JOURNAL_COMPACTION_SIZE.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            player_data (dict): The player data to save. Its "id" is set.
+
+        Returns:
+            int: The id of the saved player, or None if the player could not be saved.
+        """
+        try:
+            with FileLock(file_path):
+                journal = cls.journal(file_path)
+                last_player = journal.last() or max(
+                    cls.read(file_path), key=lambda player: player["id"], default=None
+                )
+                player_data["id"] = last_player["id"] + 1 if last_player else 1
+                journal.append(player_data)
+                if journal.size() > cls.JOURNAL_COMPACTION_SIZE:
+                    cls.fold_journal(file_path)
+            return player_data["id"]
+        except Exception as e:
+            print(f"An error occurred while saving data to {file_path}: {e}")
+            return None
+
+    @classmethod
+    def compact(cls, file_path):
+        """
+        Fold the journal into the JSON file and delete the journal.
+
+        Args:
+            file_path (str): The path to the JSON file.
+        """
+        with FileLock(file_path):
+            cls.fold_journal(file_path)
+
+    @classmethod
+    def fold_journal(cls, file_path):
+        """
+        Fold the journal into the JSON file and delete the journal, the lock of the file being held.
+
+        Args:
+            file_path (str): The path to the JSON file.
+        """
+        journal = cls.journal(file_path)
+        if not journal.size():
+            return
+        Journal.write_json_atomic(file_path, cls.read(file_path), indent=4)
+        journal.clear()
+
+    @classmethod
+    def save_ratings(cls, file_path, changes):
+        """
+        Apply rating changes to players in the roster, folding the journal into the JSON file.
+
+        The changes are applied to the ratings read under the lock of the file, so that the ratings
+        saved meanwhile by another process are kept.
 
         Args:
             file_path (str): The path to the JSON file.
-            player_data (dict): The player data to save.
+            changes (dict): The (rating change, number of rated games) of each player id.
         """
         try:
-            existing_data = cls.read(file_path)
-            if not existing_data:
-                existing_data = []
-            existing_data.append(player_data)
-            with open(file_path, "w") as json_file:
-                json.dump(existing_data, json_file, indent=4)
+            with FileLock(file_path):
+                players = cls.read(file_path)
+                for player in players:
+                    if player["id"] in changes:
+                        change, games = changes[player["id"]]
+                        player["rating"] = round(player.get("rating", cls.DEFAULT_RATING) + change, 1)
+                        player["rated_games"] = player.get("rated_games", 0) + games
+                Journal.write_json_atomic(file_path, players, indent=4)
+                cls.journal(file_path).clear()
         except Exception as e:
             print(f"An error occurred while saving data to {file_path}: {e}")
 
+    @classmethod
+    def is_roster_player(cls, player, roster_player):
+        """
+        Checks if a player of a tournament is a player of the roster: the tournament references the roster
+        player by its id, and they have the same name and national ID.
+
+        Args:
+            player (dict): The player of the tournament.
+            roster_player (dict): The player of the roster with the same id, or None.
+
+        Returns:
+            bool: True if the tournament player is the roster player.
+        """
+        return roster_player is not None and all(
+            roster_player.get(field) == player.get(field) for field in cls.IDENTITY_FIELDS
+        )
+
     def update_score(self, points):
         """
         Update the player's score.
@@ -117,6 +277,9 @@ class Player:
             birthdate=data["birthdate"],
             national_id=data["national_id"],
             score=data["score"],
+            player_id=data.get("id"),
+            rating=data.get("rating", cls.DEFAULT_RATING),
+            rated_games=data.get("rated_games", 0),
         )
 
     def as_dict(self):
@@ -127,9 +290,12 @@ class Player:
             dict: A dictionary representation of the Player object.
         """
         return {
+            "id": self.player_id,
             "last_name": self.last_name,
             "first_name": self.first_name,
             "birthdate": self.birthdate.strftime("%d/%m/%Y"),
             "national_id": self.national_id if self.national_id else None,
             "score": self.score,
+            "rating": self.rating,
+            "rated_games": self.rated_games,
         }
@@ -0,0 +1,230 @@
+from array import array
+
+from easychess.models.standings import Standings
+
+
+class ResultsMatrix:
+    """
+    Represents a tournament in a compact form, for the reports and the queries over large histories.
+
+    Instead of Round and Match objects, the matches of all the rounds are stored in flat arrays of
+    player indexes (positions in the player list) and of scores in half points. Together they form a
+    sparse players × players results matrix, queried through the same methods as a Tournament:
+    standings, opponent, colour and bye histories and the results of the rounds. It can be built
+    from tournament data without creating any object per match, and converted back to the same data.
+
+    Attributes:
+        fields (dict): The tournament data other than its players and rounds (name, dates, status...).
+        players (list): The player dictionaries of the tournament.
+        players_by_id (dict): The players of the tournament, by id.
+        index (dict): The position of each player id in players.
+        rounds (list): The (name, start date, end date) of each round, as saved.
+        offsets (array): The position of the first match of each round in the match arrays, then their length.
+        player1 (array): The index of the first player (white) of each match, -1 if it is not in the tournament.
+        player2 (array): The index of the second player (black) of each match, -1 if it is not in the tournament.
+        scores (array): The scores of the two players of each match, in half points.
+        bye_indexes (array): The index of the player exempted from each round, -1 if there is none.
+        standings (Standings): The players ranked by score.
+    """
+
+    def __init__(self, fields, players):
+        """
+        Initializes an empty results matrix.
+
+        Args:
+            fields (dict): The tournament data other than its players and rounds.
+            players (list): The player dictionaries, with their id and score.
+        """
+        self.fields = fields
+        self.players = players
+        self.players_by_id = {player["id"]: player for player in players}
+        self.index = {player["id"]: position for position, player in enumerate(players)}
+        self.rounds = []
+        self.offsets = array("l", [0])
+        self.player1 = array("l")
+        self.player2 = array("l")
+        self.scores = array("b")
+        self.bye_indexes = array("l")
+        self.standings = Standings((player["id"], player["score"]) for player in players)
+        self._met = None
+        self._colours = None
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Builds the results matrix of tournament data, in the current layout.
+
+        Args:
+            data (dict): The tournament data.
+
+        Returns:
+            ResultsMatrix: The results matrix.
+        """
+        matrix = cls(
+            {key: value for key, value in data.items() if key not in ("players", "list_rounds")}, data["players"]
+        )
+        index = matrix.index
+        for round_data in data["list_rounds"]:
+            matrix.rounds.append((round_data["name"], round_data["start_date_time"], round_data["end_date_time"]))
+            for (player1_id, score1), (player2_id, score2) in round_data["matches"]:
+                matrix.player1.append(index.get(player1_id, -1))
+                matrix.player2.append(index.get(player2_id, -1))
+                matrix.scores.append(int(score1 * 2))
+                matrix.scores.append(int(score2 * 2))
+            matrix.offsets.append(len(matrix.player1))
+            matrix.bye_indexes.append(index.get(round_data.get("bye"), -1))
+        return matrix
+
+    @classmethod
+    def from_tournament(cls, tournament):
+        """
+        Builds the results matrix of a tournament.
+
+        Args:
+            tournament (Tournament): The tournament.
+
+        Returns:
+            ResultsMatrix: The results matrix.
+        """
+        return cls.from_dict(tournament.as_dict())
+
+    def as_dict(self):
+        """
+        Converts the results matrix back into tournament data, in the format saved by Tournament.as_dict.
+
+        Returns:
+            dict: The tournament data.
+        """
+        data = dict(self.fields)
+        data["players"] = self.players
+        data["list_rounds"] = [
+            {
+                "name": name,
+                "start_date_time": start_date_time,
+                "end_date_time": end_date_time,
+                "matches": [
+                    [[player1_id, score1], [player2_id, score2]]
+                    for player1_id, player2_id, score1, score2 in self.round_results(round_index)
+                ],
+                "bye": self.player_id(self.bye_indexes[round_index]),
+            }
+            for round_index, (name, start_date_time, end_date_time) in enumerate(self.rounds)
+        ]
+        return data
+
+    def player_id(self, player_index):
+        """
+        Returns the id of a player from its index.
+
+        Args:
+            player_index (int): The index of the player, -1 for a player missing from the tournament.
+
+        Returns:
+            int: The id of the player, or None.
+        """
+        return self.players[player_index]["id"] if player_index >= 0 else None
+
+    @staticmethod
+    def points(half_points):
+        """
+        Converts a score in half points, keeping whole scores as integers as Match does.
+
+        Args:
+            half_points (int): The score, in half points.
+
+        Returns:
+            int | float: The score.
+        """
+        return half_points // 2 if half_points % 2 == 0 else half_points / 2
+
+    def round_results(self, round_index):
+        """
+        Returns the results of the matches of a round.
+
+        Args:
+            round_index (int): The index of the round.
+
+        Returns:
+            list: The (player 1 id, player 2 id, score 1, score 2) of each match.
+        """
+        return [
+            (
+                self.player_id(self.player1[position]),
+                self.player_id(self.player2[position]),
+                self.points(self.scores[2 * position]),
+                self.points(self.scores[2 * position + 1]),
+            )
+            for position in range(self.offsets[round_index], self.offsets[round_index + 1])
+        ]
+
+    def rounds_results(self):
+        """
+        Iterates over the results of the rounds, as Tournament.rounds_results.
+
+        Yields:
+            tuple: The (player 1 id, player 2 id, score 1, score 2) of each match of a round, and the id of
+            the player exempted from the round (None if there is none).
+        """
+        for round_index in range(len(self.rounds)):
+            yield self.round_results(round_index), self.player_id(self.bye_indexes[round_index])
+
+    @property
+    def byes(self):
+        """
+        The ids of the players who have already been exempted from a round.
+        """
+        return {self.player_id(bye_index) for bye_index in self.bye_indexes if bye_index >= 0}
+
+    @property
+    def colours(self):
+        """
+        The colour history of each player id, as a string of "W" (player 1) and "B" (player 2), as Tournament.colours.
+        """
+        if self._colours is None:
+            colours = {}
+            for player1, player2 in zip(self.player1, self.player2):
+                player1_id, player2_id = self.player_id(player1), self.player_id(player2)
+                colours[player1_id] = colours.get(player1_id, "") + "W"
+                colours[player2_id] = colours.get(player2_id, "") + "B"
+            self._colours = colours
+        return self._colours
+
+    def have_players_met(self, player1_id, player2_id):
+        """
+        Checks in constant time if two players have already faced each other in the tournament.
+
+        The matrix cells of the matches played are indexed on first use.
+
+        Args:
+            player1_id (int): The id of the first player.
+            player2_id (int): The id of the second player.
+
+        Returns:
+            bool: True if the players have met, False otherwise.
+        """
+        size = len(self.players)
+        if self._met is None:
+            self._met = set()
+            for player1, player2 in zip(self.player1, self.player2):
+                if player1 >= 0 and player2 >= 0:
+                    self._met.add(player1 * size + player2)
+                    self._met.add(player2 * size + player1)
+        player1, player2 = self.index.get(player1_id), self.index.get(player2_id)
+        return player1 is not None and player2 is not None and player1 * size + player2 in self._met
+
+    def opponents(self, player_id):
+        """
+        Returns the opponents of a player, in round order.
+
+        Args:
+            player_id (int): The id of the player.
+
+        Returns:
+            list: The ids of the opponents of the player.
+        """
+        player = self.index[player_id]
+        return [
+            self.player_id(player2 if player1 == player else player1)
+            for player1, player2 in zip(self.player1, self.player2)
+            if player in (player1, player2)
+        ]
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 
 from easychess.models.match import Match
 
@@ -11,7 +12,7 @@ class Round:
     and converting to dictionary format.
     """
 
-    def __init__(self, name, start_date_time, end_date_time, matches=None):
+    def __init__(self, name, start_date_time, end_date_time, matches=None, bye=None):
         """
         Initialize a Round object.
 
@@ -19,11 +20,14 @@ class Round:
             name (str): The name of the round.
             start_date_time (datetime): The start date and time of the round.
             end_date_time (datetime): The end date and time of the round.
+            matches (list, optional): The matches of the round. Defaults to an empty list.
+            bye (int, optional): The id of the player exempted from this round. Defaults to None.
         """
         self.name = name
         self.start_date_time = start_date_time
         self.end_date_time = end_date_time
         self.matches = matches if matches is not None else []
+        self.bye = bye
 
     def add_match(self, match):
         """
@@ -57,6 +61,7 @@ class Round:
             "start_date_time": format_datetime(self.start_date_time),
             "end_date_time": format_datetime(self.end_date_time),
             "matches": [match.as_tuple() for match in self.matches] if self.matches else [],
+            "bye": self.bye,
         }
 
     def __repr__(self):
@@ -70,19 +75,30 @@ class Round:
             f"Round(name={self.name!r}, "
             f"start_date_time={self.start_date_time!r}, "
             f"end_date_time={self.end_date_time if self.end_date_time else None!r}, "
-            f"matches=[{', '.join(repr(match) for match in self.matches)}])"
+            f"matches=[{', '.join(repr(match) for match in self.matches)}], "
+            f"bye={self.bye!r})"
         )
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse_date_time(value):
+        """
+        Parses a saved date and time. Rounds share few distinct timestamps, so the results are memoized.
+
+        Args:
+            value (str): The date and time, as "dd/mm/yyyy HH:MM", or None.
+
+        Returns:
+            datetime: The date and time, or None.
+        """
+        return datetime.strptime(value, "%d/%m/%Y %H:%M") if value else None
+
     @classmethod
     def from_dict(cls, data):
-        start_date_time = (
-            datetime.strptime(data["start_date_time"], "%d/%m/%Y %H:%M") if data["start_date_time"] else None
-        )
-        end_date_time = datetime.strptime(data["end_date_time"], "%d/%m/%Y %H:%M") if data["end_date_time"] else None
-
         return cls(
             name=data["name"],
-            start_date_time=start_date_time,
-            end_date_time=end_date_time,
+            start_date_time=cls.parse_date_time(data["start_date_time"]),
+            end_date_time=cls.parse_date_time(data["end_date_time"]),
             matches=[Match.from_tuple(match) for match in data["matches"]],
+            bye=data.get("bye"),
         )
@@ -0,0 +1,215 @@
+from bisect import bisect_left, insort
+
+
+class Standings:
+    """
+    Represents the standings of a tournament: its players ranked by score, then by id (their pairing number).
+
+    The standings are updated incrementally when a score changes instead of being sorted again.
+    Scores are counted in half points and the players are kept in one sorted list of ids per score,
+    with a Fenwick tree counting the players of each score. The rank of a player and the player at
+    a given rank are found in O(log n), the first k players in O(k) and the score groups without sorting.
+
+    Attributes:
+        slots (dict): The score of each player id, in half points.
+        groups (dict): The sorted list of player ids of each score, in half points.
+        counts (list): The Fenwick tree of the number of players of each score, in half points.
+        size (int): The number of players.
+    """
+
+    def __init__(self, scores=()):
+        """
+        Initializes the standings.
+
+        Args:
+            scores (iterable, optional): The (player id, score) pairs of the players. Defaults to no players.
+        """
+        self.slots = {}
+        self.groups = {}
+        self.counts = [0]
+        self.size = 0
+        for player_id, score in scores:
+            slot = self.slot(score)
+            self.slots[player_id] = slot
+            self.groups.setdefault(slot, []).append(player_id)
+        for group in self.groups.values():
+            group.sort()
+        self.rebuild(max(self.groups, default=0) + 1)
+
+    @staticmethod
+    def slot(score):
+        """
+        Converts a score into half points.
+
+        Args:
+            score (float): The score.
+
+        Returns:
+            int: The score in half points.
+        """
+        return int(round(score * 2))
+
+    def rebuild(self, capacity):
+        """
+        Rebuilds the Fenwick tree for scores up to capacity - 1 half points.
+
+        Args:
+            capacity (int): The number of scores counted by the tree.
+        """
+        self.counts = [0] * (capacity + 1)
+        self.size = 0
+        for slot, group in self.groups.items():
+            self.count(slot, len(group))
+
+    def count(self, slot, delta):
+        """
+        Adds delta to the number of players of a score.
+
+        Args:
+            slot (int): The score, in half points.
+            delta (int): The number of players added (negative if removed).
+        """
+        self.size += delta
+        index = slot + 1
+        while index < len(self.counts):
+            self.counts[index] += delta
+            index += index & -index
+
+    def count_below(self, slot):
+        """
+        Returns the number of players with a score lower than or equal to a score.
+
+        Args:
+            slot (int): The score, in half points.
+
+        Returns:
+            int: The number of players.
+        """
+        total = 0
+        index = min(slot + 1, len(self.counts) - 1)
+        while index > 0:
+            total += self.counts[index]
+            index -= index & -index
+        return total
+
+    def add(self, player_id, score=0):
+        """
+        Adds a player to the standings.
+
+        Args:
+            player_id (int): The id of the player.
+            score (float, optional): The score of the player. Defaults to 0.
+        """
+        slot = self.slot(score)
+        if slot >= len(self.counts) - 1:
+            self.rebuild(2 * slot + 2)
+        self.slots[player_id] = slot
+        insort(self.groups.setdefault(slot, []), player_id)
+        self.count(slot, 1)
+
+    def update(self, player_id, score):
+        """
+        Moves a player to its new score.
+
+        Args:
+            player_id (int): The id of the player.
+            score (float): The new score of the player.
+        """
+        slot = self.slot(score)
+        previous = self.slots[player_id]
+        if slot == previous:
+            return
+        group = self.groups[previous]
+        del group[bisect_left(group, player_id)]
+        if not group:
+            del self.groups[previous]
+        self.count(previous, -1)
+        del self.slots[player_id]
+        self.add(player_id, score)
+
+    def score(self, player_id):
+        """
+        Returns the score of a player.
+
+        Args:
+            player_id (int): The id of the player.
+
+        Returns:
+            float: The score.
+        """
+        return self.slots[player_id] / 2
+
+    def rank(self, player_id):
+        """
+        Returns the rank of a player, starting at 1.
+
+        Args:
+            player_id (int): The id of the player.
+
+        Returns:
+            int: The rank.
+        """
+        slot = self.slots[player_id]
+        return self.size - self.count_below(slot) + bisect_left(self.groups[slot], player_id) + 1
+
+    def player_at(self, rank):
+        """
+        Returns the player at a given rank, starting at 1.
+
+        Args:
+            rank (int): The rank.
+
+        Returns:
+            int: The id of the player.
+
+        Raises:
+            IndexError: If there is no player at this rank.
+        """
+        if not 1 <= rank <= self.size:
+            raise IndexError(f"Pas de joueur au rang {rank}")
+        # Descend the tree to the lowest score with more than size - rank players below or equal to it
+        target = self.size - rank
+        index = 0
+        step = 1 << (len(self.counts) - 1).bit_length()
+        while step:
+            if index + step < len(self.counts) and self.counts[index + step] <= target:
+                index += step
+                target -= self.counts[index]
+            step >>= 1
+        group = self.groups[index]
+        return group[len(group) - 1 - target]
+
+    def top(self, k):
+        """
+        Returns the first k players of the standings.
+
+        Args:
+            k (int): The number of players.
+
+        Returns:
+            list: The ids of the players, in rank order.
+        """
+        players = []
+        for slot in sorted(self.groups, reverse=True):
+            players.extend(self.groups[slot][:k - len(players)])
+            if len(players) >= k:
+                break
+        return players
+
+    def score_groups(self):
+        """
+        Returns the score groups, from the highest score to the lowest.
+
+        Returns:
+            list: The (score, ids of the players in rank order) pairs.
+        """
+        return [(slot / 2, list(self.groups[slot])) for slot in sorted(self.groups, reverse=True)]
+
+    def ranked(self):
+        """
+        Returns all the players of the standings.
+
+        Returns:
+            list: The ids of the players, in rank order.
+        """
+        return [player_id for slot in sorted(self.groups, reverse=True) for player_id in self.groups[slot]]
@@ -0,0 +1,83 @@
+class Tiebreaks:
+    """
+    Represents the tiebreak scores of the players of a tournament, separating the players of equal score.
+
+    All the tiebreaks are computed together in a single pass over the matches, then one pass over the
+    players, in O(players × rounds) instead of walking the rounds again for every player.
+    Matches without a result are ignored, and a bye brings no opponent.
+
+    Attributes:
+        buchholz (dict): The sum of the scores of the opponents of each player id.
+        median_buchholz (dict): The Buchholz without the highest and lowest opponent scores, from three opponents.
+        sonneborn_berger (dict): The scores of the opponents beaten, plus half the scores of the opponents drawn.
+        progressive (dict): The sum of the running scores of each player id after each round.
+    """
+
+    # Order in which the tiebreaks separate players of equal score
+    ORDER = ("buchholz", "median_buchholz", "sonneborn_berger", "progressive")
+
+    def __init__(self, tournament):
+        """
+        Computes the tiebreaks of the players of a tournament.
+
+        Args:
+            tournament (Tournament | ResultsMatrix): The tournament, with its standings and rounds.
+        """
+        self.tournament = tournament
+        scores = {player_id: player["score"] for player_id, player in tournament.players_by_id.items()}
+        games = {player_id: [] for player_id in scores}
+        running = dict.fromkeys(scores, 0)
+        self.progressive = dict.fromkeys(scores, 0)
+        for matches, bye in tournament.rounds_results():
+            for player1_id, player2_id, score1, score2 in matches:
+                if not score1 + score2 or player1_id not in games or player2_id not in games:
+                    continue
+                games[player1_id].append((player2_id, score1))
+                games[player2_id].append((player1_id, score2))
+                running[player1_id] += score1
+                running[player2_id] += score2
+            if bye in running:
+                running[bye] += 0.5
+            for player_id, score in running.items():
+                self.progressive[player_id] += score
+
+        self.buchholz = {}
+        self.median_buchholz = {}
+        self.sonneborn_berger = {}
+        for player_id, player_games in games.items():
+            opponent_scores = [scores[opponent_id] for opponent_id, _ in player_games]
+            buchholz = sum(opponent_scores)
+            self.buchholz[player_id] = buchholz
+            if len(opponent_scores) > 2:
+                buchholz -= max(opponent_scores) + min(opponent_scores)
+            self.median_buchholz[player_id] = buchholz
+            self.sonneborn_berger[player_id] = sum(
+                points * scores[opponent_id] for opponent_id, points in player_games
+            )
+
+    def values(self, player_id):
+        """
+        Returns the tiebreaks of a player.
+
+        Args:
+            player_id (int): The id of the player.
+
+        Returns:
+            tuple: The tiebreaks of the player, in ORDER.
+        """
+        return tuple(getattr(self, name)[player_id] for name in self.ORDER)
+
+    def ranked_players(self):
+        """
+        Ranks the players by score, then by tiebreaks, then by id.
+
+        Only the players of a same score group are compared, the groups coming from the standings.
+
+        Returns:
+            list: The players, in rank order.
+        """
+        ranking = []
+        for _, group in self.tournament.standings.score_groups():
+            group.sort(key=lambda player_id: tuple(-value for value in self.values(player_id)))
+            ranking.extend(self.tournament.players_by_id[player_id] for player_id in group)
+        return ranking
@@ -1,8 +1,5 @@
-import json
-import logging
-
-from easychess.models.player import Player
 from easychess.models.round import Round
+from easychess.models.standings import Standings
 
 
 class Tournament:
@@ -19,8 +16,21 @@ class Tournament:
         list_rounds (list): A list of rounds in the tournament.
         players (list): A list of players participating in the tournament.
         description (str): A description of the tournament.
+        players_by_id (dict): The players of the tournament, by id.
+        opponents (dict): The opponent history, mapping each player id to the set of ids of the players met.
+        colours (dict): The colour history of each player id, as a string of "W" (player 1) and "B" (player 2).
+        byes (set): The ids of the players who have already been exempted from a round.
+        pairing_system (str): The pairing system, SWISS or ROUND_ROBIN.
+        schedule (BergerTable): The round-robin schedule, computed once when first needed.
+        standings (Standings): The players ranked by score, updated by add_points.
+        revision (int): The stored revision the tournament was read from, None for a new tournament.
+
+    Tournaments are saved and read by the storage backends, as dictionaries (see as_dict and from_dict).
     """
 
+    SWISS = "swiss"
+    ROUND_ROBIN = "round_robin"
+
     def __init__(
         self,
         name,
@@ -30,9 +40,11 @@ class Tournament:
         end_date=None,
         number_of_rounds=None,
         current_round=0,
-        list_rounds=[],
-        players=[],
+        list_rounds=None,
+        players=None,
         status=None,
+        pairing_system=SWISS,
+        revision=None,
     ):
         """
         Initializes a new tournament with specified details.
@@ -41,6 +53,8 @@ class Tournament:
             name (str): The name of the tournament.
             location (str): The location where the tournament is held.
             description (str): A description of the tournament.
+            pairing_system (str, optional): The pairing system. Defaults to SWISS.
+            revision (int, optional): The stored revision the tournament was read from. Defaults to None.
         """
         self.name = name
         self.location = location
@@ -48,10 +62,23 @@ class Tournament:
         self.end_date = end_date
         self.number_of_rounds = number_of_rounds
         self.current_round = current_round
-        self.list_rounds = list_rounds
-        self.players = players
+        self.list_rounds = list_rounds if list_rounds is not None else []
+        self.players = players if players is not None else []
         self.description = description
         self.status = status
+        self.pairing_system = pairing_system
+        self.revision = revision
+        self.schedule = None
+        self.players_by_id = {player["id"]: player for player in self.players}
+        self.opponents = {}
+        self.colours = {}
+        self.byes = set()
+        self.standings = Standings((player["id"], player["score"]) for player in self.players)
+        for round_ in self.list_rounds:
+            for match in round_.matches:
+                self.record_match(match)
+            if round_.bye is not None:
+                self.byes.add(round_.bye)
 
     def __str__(self):
         """
@@ -69,60 +96,89 @@ class Tournament:
             f"Players: {self.players}"
         )
 
-    @classmethod
-    def create(cls, new_tournament):
+    def add_player(self, player):
         """
-        Creates a new Tournament instance from given tournament details.
+        Registers a player in the tournament.
+
+        Args:
+            player (dict): The player, with its roster id.
+        """
+        self.players.append(player)
+        self.players_by_id[player["id"]] = player
+        self.standings.add(player["id"], player["score"])
+
+    def get_player(self, player_id):
+        """
+        Returns a player of the tournament from its id.
 
         Args:
-            new_tournament (tuple): A tuple containing the tournament's name, location, and description.
+            player_id (int): The id of the player.
 
         Returns:
-            Tournament: An instance of the Tournament class.
+            dict: The player.
         """
-        name, location, description = new_tournament
-        return cls(name, location, description)
+        return self.players_by_id[player_id]
 
-    @classmethod
-    def read(cls, file_path):
+    def add_points(self, player_id, points):
         """
-        Reads tournament data from a specified JSON file.
+        Adds points to the score of a player and moves the player in the standings.
 
         Args:
-            file_path (str): The path to the JSON file.
+            player_id (int): The id of the player.
+            points (float): The points won.
+        """
+        player = self.players_by_id[player_id]
+        player["score"] += points
+        self.standings.update(player_id, player["score"])
+
+    def ranked_players(self):
+        """
+        Returns the players ranked by score, then by id.
 
         Returns:
-            dict: The tournament data as a dictionary, or an empty dictionary if the file is not found.
+            list: The players, in rank order.
         """
-        try:
-            with open(file_path, "r") as json_file:
-                return json.load(json_file)
-        except FileNotFoundError:
-            return {}
+        return [self.players_by_id[player_id] for player_id in self.standings.ranked()]
+
+    def record_match(self, match):
+        """
+        Records in the opponent and colour histories that the two players of a match have met.
+
+        Args:
+            match (Match): The match between the two players, player 1 having the white pieces.
+        """
+        self.opponents.setdefault(match.player1_id, set()).add(match.player2_id)
+        self.opponents.setdefault(match.player2_id, set()).add(match.player1_id)
+        self.colours[match.player1_id] = self.colours.get(match.player1_id, "") + "W"
+        self.colours[match.player2_id] = self.colours.get(match.player2_id, "") + "B"
+
+    def have_players_met(self, player1_id, player2_id):
+        """
+        Checks in constant time if two players have already faced each other in the tournament.
+
+        Args:
+            player1_id (int): The id of the first player.
+            player2_id (int): The id of the second player.
+
+        Returns:
+            bool: True if the players have met, False otherwise.
+        """
+        return player2_id in self.opponents.get(player1_id, ())
 
     @classmethod
-    def save(cls, file_path, tournament_data):
+    def create(cls, new_tournament):
         """
-        Saves tournament data to a specified JSON file.
+        Creates a new Tournament instance from given tournament details.
 
         Args:
-            file_path (str): The path to the JSON file.
-            tournament_data (dict): The tournament data to be saved.
-        """
-        try:
-            existing_data = cls.read(file_path)
-            tournament_name = tournament_data["name"]
-            for key, existing_tournament in existing_data.items():
-                if existing_tournament["name"] == tournament_name:
-                    existing_data[key] = tournament_data
-                    break
-            else:
-                tournament_key = f"tournament{len(existing_data) + 1}"
-                existing_data[tournament_key] = tournament_data
-            with open(file_path, "w") as json_file:
-                json.dump(existing_data, json_file)
-        except Exception as e:
-            logging.error(f"An error occurred while saving data to {file_path}: {e}")
+            new_tournament (tuple): A tuple containing the tournament's name, location, description,
+                pairing system and number of rounds (None to compute it from the number of players).
+
+        Returns:
+            Tournament: An instance of the Tournament class.
+        """
+        name, location, description, pairing_system, number_of_rounds = new_tournament
+        return cls(name, location, description, number_of_rounds=number_of_rounds, pairing_system=pairing_system)
 
     def as_dict(self):
         """
@@ -142,21 +198,50 @@ class Tournament:
             "list_rounds": [round_.as_dict() for round_ in self.list_rounds] if self.list_rounds else [],
             "description": self.description,
             "status": self.status,
+            "pairing_system": self.pairing_system,
+            "revision": self.revision,
         }
 
+    def rounds_results(self):
+        """
+        Iterates over the results of the rounds.
+
+        Yields:
+            tuple: The (player 1 id, player 2 id, score 1, score 2) of each match of a round, and the id of
+            the player exempted from the round (None if there is none).
+        """
+        for round_ in self.list_rounds:
+            matches = [(match.player1_id, match.player2_id, match.score1, match.score2) for match in round_.matches]
+            yield matches, round_.bye
+
     @classmethod
     def from_dict(cls, data):
+        """
+        Creates a Tournament instance from its dictionary representation.
+
+        Players are kept as dictionaries. The data must be in the current layout: tournaments stored
+        in an older format are upgraded by the migrations of the storage when they are read.
+
+        Args:
+            data (dict): The tournament data.
+
+        Returns:
+            Tournament: The tournament instance.
+        """
         if not isinstance(data, dict):
             raise ValueError("La donnée doit être un dictionnaire")
+
         return cls(
             name=data["name"],
             location=data["location"],
-            start_date=data["start_date"],
-            end_date=data["end_date"],
+            start_date=Round.parse_date_time(data["start_date"]),
+            end_date=Round.parse_date_time(data["end_date"]),
             number_of_rounds=data["number_of_rounds"],
             current_round=data["current_round"],
-            players=[Player.from_dict(player) for player in data["players"]],
+            players=data["players"],
             list_rounds=[Round.from_dict(round) for round in data["list_rounds"]],
             description=data["description"],
             status=data["status"],
+            pairing_system=data["pairing_system"],
+            revision=data.get("revision"),
         )
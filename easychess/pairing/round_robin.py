@@ -0,0 +1,57 @@
+############################################################################################################
+#  ROUND ROBIN                                                                                             #
+############################################################################################################
+
+
+class BergerTable:
+    """
+    Round-robin schedule following the Berger tables.
+
+    The whole schedule is computed once, in O(n²), from the pairing order of the players: every
+    pair of players meets exactly once, colours alternate, and pairing a round is a table lookup.
+    With an odd number of players, the player drawn against the missing last position is exempted.
+
+    Attributes:
+        rounds (list): For each round, the list of (white id, black id) pairs and the id of the exempted player.
+    """
+
+    def __init__(self, player_ids):
+        """
+        Computes the Berger tables for the players.
+
+        Args:
+            player_ids (list): The ids of the players, in pairing order.
+        """
+        positions = list(player_ids)
+        if len(positions) % 2:
+            positions.append(None)
+        size = len(positions)
+        last = positions[-1]
+        self.rounds = []
+        for round_index in range(size - 1):
+            # The player facing the last position on the first board moves by half the circle every round
+            first = (round_index * size // 2) % (size - 1)
+            if round_index % 2:
+                boards = [(last, positions[first])]
+            else:
+                boards = [(positions[first], last)]
+            for board in range(1, size // 2):
+                boards.append(
+                    (positions[(first + board) % (size - 1)], positions[(first - board) % (size - 1)])
+                )
+            pairs = [pair for pair in boards if None not in pair]
+            bye = next((white if black is None else black for white, black in boards if None in (white, black)), None)
+            self.rounds.append((pairs, bye))
+
+    def pair_round(self, round_index):
+        """
+        Returns the pairing of a round.
+
+        Args:
+            round_index (int): The index of the round.
+
+        Returns:
+            tuple: The list of (white id, black id) pairs in board order, and the id of the
+            player exempted from the round (None if the number of players is even).
+        """
+        return self.rounds[round_index]
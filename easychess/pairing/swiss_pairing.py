@@ -0,0 +1,321 @@
+############################################################################################################
+#  SWISS PAIRING                                                                                           #
+############################################################################################################
+import math
+
+from easychess.pairing.weighted_matching import max_weight_matching
+
+
+class SwissPairing:
+    """
+    Swiss pairing engine in the spirit of the Dutch system.
+
+    Players are taken from the standings of the tournament, ranked by score then by id (their
+    pairing number), and split into score groups.
+    Each group, completed by the players floating down from the group above, is paired top half
+    against bottom half. When this pairing contains a rematch or two players requiring the same
+    colour, the bottom half is transposed; if a player cannot be paired this way, the group is
+    solved as a maximum weight matching. Players left unpaired float down to the next group, and if the
+    lowest group cannot be completed, it is merged with the groups above until a pairing without
+    rematches is found. Rematches are only played when no such pairing exists.
+
+    Attributes:
+        tournament (Tournament): The tournament, providing the standings and the opponent, colour and bye histories.
+        rematches (int): The number of rematches in the last paired round.
+        forced_pairings (int): The number of pairs of the last paired round breaking an absolute
+            criterion: a rematch, or two players requiring the same colour.
+    """
+
+    # Weights of the matching: score difference first, then colours, then the Dutch order
+    SCORE_DIFFERENCE_COST = 1000000
+    ABSOLUTE_COLOUR_COST = 100000
+    COLOUR_COST = 1000
+    FLOATER_BONUS = 20
+    TRANSPOSITION_COST = 10
+
+    # Rounds played in addition to ⌈log2 n⌉, the number of rounds needed to separate a single winner
+    EXTRA_ROUNDS = 2
+
+    def __init__(self, tournament):
+        """
+        Initializes the SwissPairing.
+
+        Args:
+            tournament (Tournament): The tournament to pair.
+        """
+        self.tournament = tournament
+        self.rematches = 0
+        self.forced_pairings = 0
+        self.scores = {}
+        self.ranks = {}
+        self.preferences = {}
+
+    @classmethod
+    def round_count(cls, number_of_players):
+        """
+        Returns the default number of rounds of a Swiss tournament.
+
+        Args:
+            number_of_players (int): The number of players.
+
+        Returns:
+            int: ⌈log2 n⌉ + EXTRA_ROUNDS.
+        """
+        return math.ceil(math.log2(max(number_of_players, 2))) + cls.EXTRA_ROUNDS
+
+    def pair_round(self):
+        """
+        Pairs the players for the next round, from the standings of the tournament.
+
+        Returns:
+            tuple: The list of (white id, black id) pairs in board order, and the id of the
+            player exempted from the round (None if the number of players is even).
+        """
+        score_groups = self.tournament.standings.score_groups()
+        ranked_ids = [player_id for _, group in score_groups for player_id in group]
+        self.scores = {player_id: score for score, group in score_groups for player_id in group}
+        self.ranks = {player_id: rank for rank, player_id in enumerate(ranked_ids)}
+        self.preferences = {}
+
+        bye = None
+        groups = [group for _, group in score_groups]
+        if len(ranked_ids) % 2:
+            bye = self.choose_bye(ranked_ids)
+            ranked_ids.remove(bye)
+            for group in groups:
+                if bye in group:
+                    group.remove(bye)
+            groups = [group for group in groups if group]
+
+        results = []
+        floaters = []
+        for group in groups:
+            pairs, floaters = self.pair_group(floaters + group)
+            results.append(pairs)
+
+        # The lowest players could not be paired: merge them with the groups above
+        index = len(results) - 1
+        while floaters and index >= 0:
+            pool = floaters + [player_id for pair in results[index] for player_id in pair]
+            results[index], floaters = self.match_pool(sorted(pool, key=self.ranks.get))
+            index -= 1
+        if floaters:
+            results = [[]]
+            pairs, floaters = self.match_pool(ranked_ids)
+            results[0] = pairs
+
+        # No pairing without rematches exists: pair the remaining players in order
+        for position in range(0, len(floaters) - 1, 2):
+            results[-1].append((floaters[position], floaters[position + 1]))
+
+        pairs = sorted(
+            (pair for pairs in results for pair in pairs),
+            key=lambda pair: min(self.ranks[pair[0]], self.ranks[pair[1]]),
+        )
+        self.rematches = sum(not self.have_not_met(*pair) for pair in pairs)
+        self.forced_pairings = sum(not self.is_compatible(*pair) for pair in pairs)
+        return [self.allocate_colours(*pair) for pair in pairs], bye
+
+    def choose_bye(self, ranked_ids):
+        """
+        Chooses the player exempted from the round: the lowest ranked player who has not had a bye yet.
+
+        Args:
+            ranked_ids (list): The player ids, in rank order.
+
+        Returns:
+            int: The id of the exempted player.
+        """
+        for player_id in reversed(ranked_ids):
+            if player_id not in self.tournament.byes:
+                return player_id
+        return ranked_ids[-1]
+
+    def pair_group(self, pool):
+        """
+        Pairs a score group (with its floaters) top half against bottom half.
+
+        Each player of the top half takes the first player of the remaining bottom half it can play
+        with its preferred colours, or else the first one it has not met yet, which transposes the
+        bottom half as little as possible. When none is left, it exchanges opponents with an earlier
+        pair. The group is solved as a matching if this fails.
+
+        Args:
+            pool (list): The player ids of the group, in rank order.
+
+        Returns:
+            tuple: The list of pairs, and the list of ids of the players floating down.
+        """
+        half = len(pool) // 2
+        bottom = pool[half:2 * half]
+        pairs = []
+        for player_id in pool[:half]:
+            opponent = self.first_opponent(player_id, bottom, self.is_compatible)
+            if opponent is None:
+                opponent = self.first_opponent(player_id, bottom, self.have_not_met)
+            if opponent is not None:
+                pairs.append((player_id, bottom.pop(opponent)))
+                continue
+            # Exchange opponents with an earlier pair of the group
+            for position, (other_id, other_opponent) in enumerate(pairs):
+                if self.have_not_met(player_id, other_opponent):
+                    opponent = self.first_opponent(other_id, bottom, self.have_not_met)
+                    if opponent is not None:
+                        pairs[position] = (other_id, bottom.pop(opponent))
+                        pairs.append((player_id, other_opponent))
+                        break
+            else:
+                return self.match_pool(pool)
+        return pairs, pool[2 * half:]
+
+    def first_opponent(self, player_id, candidates, can_play):
+        """
+        Returns the position of the first candidate a player can play against.
+
+        Args:
+            player_id (int): The id of the player.
+            candidates (list): The ids of the candidate opponents, in order of preference.
+            can_play (callable): Checks if two player ids can be paired.
+
+        Returns:
+            int: The position of the opponent in the candidates, or None if there is none.
+        """
+        for position, candidate in enumerate(candidates):
+            if can_play(player_id, candidate):
+                return position
+        return None
+
+    def match_pool(self, pool):
+        """
+        Pairs a pool of players as a maximum weight matching without rematches.
+
+        Args:
+            pool (list): The player ids, in rank order.
+
+        Returns:
+            tuple: The list of pairs, and the list of ids of the players left unpaired.
+        """
+        size = len(pool)
+        edges = []
+        for i in range(size):
+            for j in range(i + 1, size):
+                player1, player2 = pool[i], pool[j]
+                if self.tournament.have_players_met(player1, player2):
+                    continue
+                score_difference = int(abs(self.scores[player1] - self.scores[player2]) * 2)
+                weight = (
+                    self.FLOATER_BONUS * (2 * size - i - j)
+                    - self.SCORE_DIFFERENCE_COST * score_difference * score_difference
+                    - self.colour_cost(player1, player2)
+                    - self.TRANSPOSITION_COST * abs(j - i - size // 2)
+                )
+                edges.append((i, j, weight))
+        if edges:
+            # Maximum cardinality matchings all have the same number of edges: shifting the weights is neutral
+            lowest = min(weight for _, _, weight in edges)
+            edges = [(i, j, weight - lowest + 1) for i, j, weight in edges]
+        mate = max_weight_matching(edges, maxcardinality=True)
+        pairs = [(pool[i], pool[mate[i]]) for i in range(len(mate)) if mate[i] > i]
+        unpaired = [pool[i] for i in range(size) if i >= len(mate) or mate[i] == -1]
+        return pairs, unpaired
+
+    def is_compatible(self, player1, player2):
+        """
+        Checks if two players can be paired: they have not met and do not both require the same colour.
+
+        Args:
+            player1 (int): The id of the first player.
+            player2 (int): The id of the second player.
+
+        Returns:
+            bool: True if the players can be paired.
+        """
+        if not self.have_not_met(player1, player2):
+            return False
+        colour1, strength1 = self.colour_preference(player1)
+        colour2, strength2 = self.colour_preference(player2)
+        return not (colour1 == colour2 and strength1 == strength2 == 2)
+
+    def have_not_met(self, player1, player2):
+        """
+        Checks if two players have not faced each other yet.
+
+        Args:
+            player1 (int): The id of the first player.
+            player2 (int): The id of the second player.
+
+        Returns:
+            bool: True if the players have not met.
+        """
+        return not self.tournament.have_players_met(player1, player2)
+
+    def colour_cost(self, player1, player2):
+        """
+        Returns the cost of pairing two players with the same colour preference.
+
+        Args:
+            player1 (int): The id of the first player.
+            player2 (int): The id of the second player.
+
+        Returns:
+            int: The colour cost.
+        """
+        colour1, strength1 = self.colour_preference(player1)
+        colour2, strength2 = self.colour_preference(player2)
+        if colour1 is None or colour1 != colour2:
+            return 0
+        if strength1 == strength2 == 2:
+            return self.ABSOLUTE_COLOUR_COST
+        return self.COLOUR_COST
+
+    def colour_preference(self, player_id):
+        """
+        Returns the colour preference of a player from its colour history.
+
+        The preference is absolute (2) when the player has two more games with one colour,
+        or has played the same colour twice in a row; it is mild (1) otherwise.
+
+        Args:
+            player_id (int): The id of the player.
+
+        Returns:
+            tuple: The preferred colour ("W", "B" or None) and the strength of the preference (0, 1 or 2).
+        """
+        preference = self.preferences.get(player_id)
+        if preference is None:
+            history = self.tournament.colours.get(player_id, "")
+            balance = history.count("W") - history.count("B")
+            if not history:
+                preference = (None, 0)
+            elif balance <= -2 or history.endswith("BB"):
+                preference = ("W", 2)
+            elif balance >= 2 or history.endswith("WW"):
+                preference = ("B", 2)
+            elif balance:
+                preference = ("W" if balance < 0 else "B", 1)
+            else:
+                preference = ("W" if history[-1] == "B" else "B", 1)
+            self.preferences[player_id] = preference
+        return preference
+
+    def allocate_colours(self, player1, player2):
+        """
+        Allocates the colours of a pair, satisfying the strongest preference, then the higher ranked player.
+
+        Args:
+            player1 (int): The id of a player of the pair.
+            player2 (int): The id of the other player.
+
+        Returns:
+            tuple: The (white id, black id) pair.
+        """
+        if self.ranks[player2] < self.ranks[player1]:
+            player1, player2 = player2, player1
+        colour1, strength1 = self.colour_preference(player1)
+        colour2, strength2 = self.colour_preference(player2)
+        if colour1 is None and colour2 is None:
+            # Neither player has played: alternate colours down the boards
+            return (player1, player2) if self.ranks[player1] % 2 == 0 else (player2, player1)
+        if colour1 is None or (colour1 == colour2 and strength2 > strength1):
+            return (player2, player1) if colour2 == "W" else (player1, player2)
+        return (player1, player2) if colour1 == "W" else (player2, player1)
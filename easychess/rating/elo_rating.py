@@ -0,0 +1,182 @@
+############################################################################################################
+#  ELO RATING                                                                                              #
+############################################################################################################
+import math
+
+from easychess.models.player import Player
+
+
+class EloRating:
+    """
+    Elo rating engine in the spirit of the FIDE rating regulations.
+
+    A tournament is rated as one batch: every game is scored against the ratings the players had
+    at the start of the tournament, and the rating changes of all the players are applied together
+    at the end. Tournaments are rated one after another, so a history is imported in a single pass
+    over its games.
+
+    Attributes:
+        ratings (dict): The current rating of each player id.
+        rated_games (dict): The number of rated games of each player id.
+    """
+
+    # K-factor: new players until NEW_PLAYER_GAMES games, then players below TOP_RATING, then the others
+    NEW_PLAYER_K = 40
+    K = 20
+    TOP_K = 10
+    NEW_PLAYER_GAMES = 30
+    TOP_RATING = 2400
+
+    # Largest rating difference taken into account in the expected score
+    MAX_DIFFERENCE = 400
+
+    # Performance above or below the average rating of the opponents for a perfect or a null score
+    MAX_PERFORMANCE_DIFFERENCE = 800
+
+    def __init__(self, players=()):
+        """
+        Initializes the EloRating from the roster.
+
+        Args:
+            players (iterable, optional): The player dictionaries of the roster. Players without
+                a rating start at Player.DEFAULT_RATING. Defaults to no players.
+        """
+        self.ratings = {}
+        self.rated_games = {}
+        for player in players:
+            self.ratings[player["id"]] = player.get("rating", Player.DEFAULT_RATING)
+            self.rated_games[player["id"]] = player.get("rated_games", 0)
+
+    def k_factor(self, player_id):
+        """
+        Returns the K-factor of a player.
+
+        Args:
+            player_id (int): The id of the player.
+
+        Returns:
+            int: The K-factor.
+        """
+        if self.rated_games.get(player_id, 0) < self.NEW_PLAYER_GAMES:
+            return self.NEW_PLAYER_K
+        if self.ratings.get(player_id, Player.DEFAULT_RATING) >= self.TOP_RATING:
+            return self.TOP_K
+        return self.K
+
+    @classmethod
+    def expected_score(cls, rating, opponent_rating):
+        """
+        Returns the expected score of a player against an opponent.
+
+        Args:
+            rating (float): The rating of the player.
+            opponent_rating (float): The rating of the opponent.
+
+        Returns:
+            float: The expected score, between 0 and 1.
+        """
+        difference = max(-cls.MAX_DIFFERENCE, min(cls.MAX_DIFFERENCE, opponent_rating - rating))
+        return 1 / (1 + 10 ** (difference / 400))
+
+    @classmethod
+    def performance(cls, opponent_ratings, score):
+        """
+        Returns the performance rating of a player: the average rating of its opponents, plus the
+        rating difference for which its score would have been the expected one.
+
+        Args:
+            opponent_ratings (list): The ratings of the opponents.
+            score (float): The score of the player.
+
+        Returns:
+            int: The performance rating.
+        """
+        fraction = score / len(opponent_ratings)
+        if fraction in (0, 1):
+            difference = cls.MAX_PERFORMANCE_DIFFERENCE * (2 * fraction - 1)
+        else:
+            difference = max(
+                -cls.MAX_PERFORMANCE_DIFFERENCE,
+                min(cls.MAX_PERFORMANCE_DIFFERENCE, 400 * math.log10(fraction / (1 - fraction))),
+            )
+        return round(sum(opponent_ratings) / len(opponent_ratings) + difference)
+
+    def rate_tournament(self, tournament):
+        """
+        Rates the played games of a tournament and applies the rating changes.
+
+        Matches without a result and byes are not rated.
+
+        Args:
+            tournament (Tournament | ResultsMatrix): The tournament.
+
+        Returns:
+            dict: For each player id who played, a dictionary with its rating before the tournament,
+            its number of games, score, expected score, rating change and performance rating.
+        """
+        ratings = self.ratings
+        results = {}
+        for matches, _ in tournament.rounds_results():
+            for player1_id, player2_id, score1, score2 in matches:
+                if not score1 + score2:
+                    continue
+                rating1 = ratings.setdefault(player1_id, Player.DEFAULT_RATING)
+                rating2 = ratings.setdefault(player2_id, Player.DEFAULT_RATING)
+                expected1 = self.expected_score(rating1, rating2)
+                for player_id, opponent_rating, score, expected in (
+                    (player1_id, rating2, score1, expected1),
+                    (player2_id, rating1, score2, 1 - expected1),
+                ):
+                    result = results.get(player_id)
+                    if result is None:
+                        result = results[player_id] = [0, 0, []]
+                    result[0] += score
+                    result[1] += expected
+                    result[2].append(opponent_rating)
+
+        changes = {}
+        for player_id, (score, expected, opponent_ratings) in results.items():
+            changes[player_id] = {
+                "rating": ratings[player_id],
+                "games": len(opponent_ratings),
+                "score": score,
+                "expected": round(expected, 2),
+                "change": round(self.k_factor(player_id) * (score - expected), 1),
+                "performance": self.performance(opponent_ratings, score),
+            }
+        for player_id, change in changes.items():
+            ratings[player_id] = round(change["rating"] + change["change"], 1)
+            self.rated_games[player_id] = self.rated_games.get(player_id, 0) + change["games"]
+        return changes
+
+    def rate_history(self, tournaments):
+        """
+        Rates several tournaments in order.
+
+        Args:
+            tournaments (iterable): The tournaments, in chronological order.
+
+        Returns:
+            int: The number of rated games.
+        """
+        return sum(
+            change["games"] for tournament in tournaments for change in self.rate_tournament(tournament).values()
+        ) // 2
+
+    @staticmethod
+    def roster_changes(changes, player_ids=None):
+        """
+        Returns the rating changes to apply to the roster.
+
+        The roster is updated by changes rather than new ratings, so that the ratings saved meanwhile,
+        e.g. by another tournament finishing at the same time, are not overwritten.
+
+        Args:
+            changes (dict): The rating change of each player id, see rate_tournament.
+            player_ids (iterable, optional): The ids of the players. Defaults to every rated player.
+
+        Returns:
+            dict: The (rating change, number of rated games) of each player id.
+        """
+        player_ids = changes if player_ids is None else player_ids
+        return {player_id: (changes[player_id]["change"], changes[player_id]["games"]) for player_id in player_ids}
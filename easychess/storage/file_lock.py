@@ -0,0 +1,74 @@
+############################################################################################################
+#  FILE LOCK                                                                                               #
+############################################################################################################
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """
+    Advisory lock of a data file, shared between the processes of the application.
+
+    The lock is taken on a '<file>.lock' file next to the data file, since the data file itself is
+    replaced by atomic renames. Writers hold it exclusively for the duration of a read-modify-write
+    of the file only, readers share it, so processes working on different tournaments only wait for
+    each other while a file is written. On Windows, where fcntl is not available, the lock is taken
+    with msvcrt and is always exclusive.
+
+    Attributes:
+        path (str): The path to the lock file.
+        shared (bool): Whether the lock is shared (reading) or exclusive (writing).
+    """
+
+    def __init__(self, file_path, shared=False):
+        """
+        Initializes the lock of a data file, without taking it.
+
+        Args:
+            file_path (str): The path to the data file.
+            shared (bool, optional): Whether to take a shared lock, for reading. Defaults to False.
+        """
+        self.path = f"{file_path}.lock"
+        self.shared = shared
+        self._file = None
+
+    def __enter__(self):
+        """
+        Takes the lock, waiting for the other processes to release it.
+
+        Returns:
+            FileLock: The lock.
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = open(self.path, "a+b")
+        if fcntl:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX)
+        else:
+            self._file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after 10 seconds: keep waiting
+                    continue
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Releases the lock.
+        """
+        try:
+            if fcntl:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,155 @@
+############################################################################################################
+#  JOURNAL                                                                                                 #
+############################################################################################################
+import json
+import os
+
+
+class Journal:
+    """
+    Append-only JSON Lines file.
+
+    Each record is written as a single line, so adding a record costs the size of that record
+    instead of the size of the whole data set. A truncated last line (interrupted write) is ignored on read.
+
+    Attributes:
+        path (str): The path to the journal file.
+        durable (bool): If True, every append is flushed to disk with fsync.
+    """
+
+    def __init__(self, path, durable=False):
+        """
+        Initializes the Journal.
+
+        Args:
+            path (str): The path to the journal file.
+            durable (bool, optional): Whether to fsync after every append. Defaults to False.
+        """
+        self.path = path
+        self.durable = durable
+
+    def append(self, record):
+        """
+        Appends a record at the end of the journal.
+
+        If an interrupted append left a partial last line, the record starts on a new line,
+        so that the partial line stays a single unreadable line, skipped on read.
+
+        Args:
+            record (dict): The JSON-serializable record to append.
+        """
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        with open(self.path, "a+b") as journal_file:
+            if journal_file.seek(0, os.SEEK_END) > 0:
+                journal_file.seek(-1, os.SEEK_END)
+                if journal_file.read(1) != b"\n":
+                    line = b"\n" + line
+            journal_file.write(line)
+            if self.durable:
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+
+    def read(self):
+        """
+        Reads every complete record of the journal.
+
+        Lines left partial by an interrupted append are skipped, and the records appended after them are read.
+
+        Returns:
+            list: The records in append order, or an empty list if the journal does not exist.
+        """
+        records = []
+        try:
+            with open(self.path, "r", encoding="utf-8") as journal_file:
+                for line in journal_file:
+                    if not line.endswith("\n"):
+                        # Partial last line, left by an interrupted append
+                        break
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # Partial line, ended by the next append
+                        continue
+        except FileNotFoundError:
+            pass
+        return records
+
+    def last(self):
+        """
+        Reads the last complete record of the journal without reading the whole file.
+
+        Returns:
+            dict: The last record, or None if the journal is empty or does not exist.
+        """
+        try:
+            with open(self.path, "rb") as journal_file:
+                end = journal_file.seek(0, os.SEEK_END)
+                block_size = 4096
+                position = end
+                tail = b""
+                while position > 0:
+                    position = max(0, position - block_size)
+                    journal_file.seek(position)
+                    tail = journal_file.read(end - position)
+                    if tail.count(b"\n") > 1 or position == 0:
+                        break
+        except FileNotFoundError:
+            return None
+        lines = tail.split(b"\n")
+        # The last element follows the last newline: empty, or a partial line left by an interrupted append
+        for line in reversed(lines[:-1]):
+            try:
+                return json.loads(line)
+            except json.JSONDecodeError:
+                continue
+        return None
+
+    def size(self):
+        """
+        Returns the size of the journal in bytes.
+
+        Returns:
+            int: The size of the journal file, or 0 if it does not exist.
+        """
+        try:
+            return os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+
+    def clear(self):
+        """
+        Deletes the journal file.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def write_json_atomic(path, data, indent=None):
+        """
+        Writes data to a JSON file through a temporary file and an atomic rename,
+        so readers never see a half-written file.
+
+        Args:
+            path (str): The path to the JSON file.
+            data (dict | list): The data to write.
+            indent (int, optional): The JSON indentation. Defaults to None.
+        """
+        Journal.write_text_atomic(path, json.dumps(data, indent=indent))
+
+    @staticmethod
+    def write_text_atomic(path, text):
+        """
+        Writes text to a file through a temporary file and an atomic rename.
+
+        Args:
+            path (str): The path to the file.
+            text (str): The content to write.
+        """
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as text_file:
+            text_file.write(text)
+            text_file.flush()
+            os.fsync(text_file.fileno())
+        os.replace(temp_path, path)
@@ -0,0 +1,319 @@
+############################################################################################################
+#  JSON REPOSITORY                                                                                         #
+############################################################################################################
+import logging
+import os
+
+from easychess.models.player import Player
+from easychess.storage.read_cache import READ_CACHE
+from easychess.storage.tournament_store import TournamentStore
+from easychess.storage.write_behind import WRITER
+
+
+class JsonRepository:
+    """
+    Repository storing players and tournaments in JSON files, the tournaments through TournamentStore.
+
+    Attributes:
+        players_file (str): The path to the players JSON file.
+        tournaments_file (str): The path to the tournaments JSON file.
+
+    Players and tournaments are read through the shared READ_CACHE: as long as their files are unchanged,
+    reading them again returns a copy of the data already parsed instead of parsing the files again,
+    including at the next launch, from the on-disk cache.
+
+    Tournaments and ratings are saved by the shared background WRITER, if enabled: saving returns at once,
+    and reading waits for the pending writes first. The error of a failed save is kept until
+    check_tournament_saved reports it. Match results are checkpointed synchronously, so that
+    they are on disk when saving them returns.
+    """
+
+    def __init__(self, players_file, tournaments_file):
+        """
+        Initializes the JsonRepository.
+
+        Args:
+            players_file (str): The path to the players JSON file.
+            tournaments_file (str): The path to the tournaments JSON file.
+        """
+        self.players_file = players_file
+        self.tournaments_file = tournaments_file
+        self.failed_writes = {}
+
+    def read_players(self):
+        """
+        Reads every registered player.
+
+        Returns:
+            list: A list of player dictionaries.
+        """
+        self.flush()
+        return READ_CACHE.get(
+            (self.players_file, "players"),
+            self.players_sources(),
+            lambda: Player.read(self.players_file),
+            copy=lambda players: [dict(player) for player in players],
+            persist=True,
+        )
+
+    def save_player(self, player_data):
+        """
+        Registers a new player.
+
+        Args:
+            player_data (dict): The player data to save.
+
+        Returns:
+            int: The id given to the player.
+        """
+        self.flush()
+        try:
+            return Player.save(self.players_file, player_data)
+        finally:
+            self.invalidate_players()
+
+    def save_ratings(self, changes):
+        """
+        Applies rating changes to players in the roster.
+
+        Args:
+            changes (dict): The (rating change, number of rated games) of each player id.
+        """
+        self.write((self.players_file, "ratings"), Player.save_ratings, self.players_file, changes)
+
+    def roster(self):
+        """
+        Reads the roster referenced by the stored tournaments.
+
+        Returns:
+            dict: The player dictionaries, by id. Shared by every read until the players change: not to be modified.
+        """
+        return READ_CACHE.get(
+            (self.players_file, "roster"),
+            self.players_sources(),
+            lambda: {player["id"]: player for player in Player.read(self.players_file)},
+            persist=True,
+        )
+
+    def players_sources(self):
+        """
+        Returns the files the players are read from.
+
+        Returns:
+            list: The paths to the players JSON file and its journal.
+        """
+        return [self.players_file, Player.journal(self.players_file).path]
+
+    def tournaments_sources(self):
+        """
+        Returns the files the tournaments are read from, including the roster they reference.
+
+        Returns:
+            list: The paths to the tournaments JSON file, its checkpoint journals and the players files.
+        """
+        checkpoints_dir = TournamentStore.checkpoints_dir(self.tournaments_file)
+        try:
+            checkpoints = sorted(os.path.join(checkpoints_dir, name) for name in os.listdir(checkpoints_dir))
+        except FileNotFoundError:
+            checkpoints = []
+        return [self.tournaments_file, *checkpoints, *self.players_sources()]
+
+    def flush(self):
+        """
+        Waits for the pending writes of the background writer, if enabled.
+        """
+        if WRITER:
+            WRITER.flush()
+
+    def write(self, key, function, *args, replace=False):
+        """
+        Performs a write, then invalidates the cached data of the written file.
+
+        The write is queued to the background writer if enabled, coalesced with the pending writes
+        of the same key, and performed immediately otherwise. Its error, if any, is logged and kept in
+        failed_writes until the next write of the key succeeds.
+
+        Args:
+            key (tuple): The written file, then what is written in it (e.g. the name of a tournament).
+            function (callable): The function performing the write.
+            *args: The arguments of the function, not to be modified afterwards.
+            replace (bool, optional): Whether the write supersedes the pending writes of the key. Defaults to False.
+        """
+
+        def write_and_invalidate():
+            try:
+                function(*args)
+                self.failed_writes.pop(key, None)
+            except Exception as e:
+                logging.error(f"An error occurred while writing {key}: {e}")
+                self.failed_writes[key] = e
+            finally:
+                if key[0] == self.players_file:
+                    self.invalidate_players()
+                else:
+                    READ_CACHE.invalidate(key[0])
+
+        if WRITER:
+            WRITER.submit(key, write_and_invalidate, replace=replace)
+        else:
+            write_and_invalidate()
+
+    def invalidate_players(self):
+        """
+        Removes the cached players, and the cached tournaments referencing them.
+        """
+        READ_CACHE.invalidate(self.players_file)
+        READ_CACHE.invalidate(self.tournaments_file)
+
+    def read_tournaments(self):
+        """
+        Reads every tournament.
+
+        Returns:
+            dict: The tournaments keyed by their storage key ('tournament1', 'tournament2', ...).
+        """
+        self.flush()
+        return READ_CACHE.get(
+            (self.tournaments_file, "tournaments"),
+            self.tournaments_sources(),
+            lambda: TournamentStore.read(self.tournaments_file, self.roster()),
+            copy=lambda tournaments: {key: TournamentStore.copy_data(data) for key, data in tournaments.items()},
+            persist=True,
+        )
+
+    def read_tournament_headers(self):
+        """
+        Reads the headers of every tournament, without their rounds and players.
+
+        Returns:
+            dict: The tournament headers keyed by their storage key.
+        """
+        self.flush()
+        return TournamentStore.read_headers(self.tournaments_file)
+
+    def read_tournament(self, key):
+        """
+        Reads a single tournament.
+
+        Args:
+            key (str): The storage key of the tournament.
+
+        Returns:
+            dict: The tournament data, or None if there is no tournament with this key.
+        """
+        self.flush()
+        return READ_CACHE.get(
+            (self.tournaments_file, "tournament", key),
+            self.tournaments_sources(),
+            lambda: TournamentStore.read_one(self.tournaments_file, key, self.roster()),
+            copy=lambda tournament_data: tournament_data and TournamentStore.copy_data(tournament_data),
+            persist=True,
+        )
+
+    def find_tournament(self, name):
+        """
+        Finds a tournament by its name.
+
+        Args:
+            name (str): The name of the tournament.
+
+        Returns:
+            dict: The tournament data, or None if no tournament has this name.
+        """
+        for key, header in self.read_tournament_headers().items():
+            if header["name"] == name:
+                return self.read_tournament(key)
+        return None
+
+    def find_tournaments_by_status(self, status):
+        """
+        Finds the headers of the tournaments having the given status, from the manifest only.
+
+        Args:
+            status (bool): The status to filter on (None for tournaments in progress).
+
+        Returns:
+            dict: The headers of the matching tournaments keyed by their storage key.
+        """
+        return {key: header for key, header in self.read_tournament_headers().items() if header["status"] == status}
+
+    def save_tournament(self, tournament_data):
+        """
+        Saves a tournament, replacing the stored tournament with the same name.
+
+        As a full snapshot, it supersedes the pending saves and checkpoints of the tournament.
+
+        Args:
+            tournament_data (dict): The tournament data to save.
+        """
+        self.write(
+            (self.tournaments_file, tournament_data["name"]),
+            TournamentStore.save,
+            self.tournaments_file,
+            TournamentStore.copy_data(tournament_data),
+            self.roster(),
+            replace=True,
+        )
+
+    def check_tournament_saved(self, name):
+        """
+        Waits for the pending saves of a tournament, and reports whether the last one failed.
+
+        Args:
+            name (str): The name of the tournament.
+
+        Raises:
+            RevisionConflictError: If another process saved the tournament since it was read.
+            Exception: The error of the last save of the tournament, if it failed otherwise.
+        """
+        self.flush()
+        error = self.failed_writes.pop((self.tournaments_file, name), None)
+        if error is not None:
+            raise error
+
+    def save_match(self, tournament_data, round_index, match_index):
+        """
+        Checkpoints the result of a single match of a tournament.
+
+        The result is appended to the checkpoint journal of the tournament, flushed to disk before returning,
+        and replayed on read until the next call to save_tournament writes a full snapshot. The pending writes
+        are performed first, so that the result is checkpointed on top of the last snapshot.
+
+        Args:
+            tournament_data (dict): The tournament data containing the match.
+            round_index (int): The index of the round of the match.
+            match_index (int): The index of the match in the round.
+        """
+        self.flush()
+        try:
+            TournamentStore.save_match(self.tournaments_file, tournament_data, round_index, match_index)
+        finally:
+            READ_CACHE.invalidate(self.tournaments_file)
+
+    def save_matches(self, tournament_data, round_index, match_indexes):
+        """
+        Checkpoints the results of several matches of a round as a single record, like save_match.
+
+        Args:
+            tournament_data (dict): The tournament data containing the matches.
+            round_index (int): The index of the round of the matches.
+            match_indexes (list): The indexes of the matches in the round.
+        """
+        self.flush()
+        try:
+            TournamentStore.save_matches(self.tournaments_file, tournament_data, round_index, list(match_indexes))
+        finally:
+            READ_CACHE.invalidate(self.tournaments_file)
+
+    def migrate(self):
+        """
+        Upgrades and rewrites at once every tournament stored in an older format.
+
+        Returns:
+            int: The number of tournaments migrated.
+        """
+        self.flush()
+        try:
+            return TournamentStore.migrate(self.tournaments_file, self.roster())
+        finally:
+            READ_CACHE.invalidate(self.tournaments_file)
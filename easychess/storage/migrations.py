@@ -0,0 +1,99 @@
+############################################################################################################
+#  MIGRATIONS                                                                                              #
+############################################################################################################
+
+
+class MigrationRegistry:
+    """
+    Registry of the migrations of a stored record format.
+
+    Each migration upgrades a record from one version to the next, so a record of any older version
+    is brought to the current version by applying the migrations in turn. Records are upgraded one
+    by one when they are read, instead of converting all the stored data at once.
+
+    Attributes:
+        current_version (int): The version of the records written by the application.
+        default_version (int): The version of the records stored without a version.
+        migrations (dict): The migration upgrading a record from each version to the next.
+    """
+
+    def __init__(self, current_version, default_version=1):
+        """
+        Initializes an empty registry.
+
+        Args:
+            current_version (int): The version of the records written by the application.
+            default_version (int, optional): The version of the records stored without a version. Defaults to 1.
+        """
+        self.current_version = current_version
+        self.default_version = default_version
+        self.migrations = {}
+
+    def register(self, version):
+        """
+        Registers the migration from a version to the next one.
+
+        Args:
+            version (int): The version upgraded by the migration.
+
+        Returns:
+            callable: A decorator registering a function taking the record and the arguments given
+            to upgrade, and returning the record at the next version.
+        """
+
+        def decorator(migration):
+            if version in self.migrations:
+                raise ValueError(f"Une migration depuis la version {version} existe déjà")
+            self.migrations[version] = migration
+            return migration
+
+        return decorator
+
+    def version(self, record):
+        """
+        Returns the version of a stored record.
+
+        Args:
+            record (dict): The stored record.
+
+        Returns:
+            int: The version of the record.
+        """
+        return record.get("version", self.default_version)
+
+    def is_current(self, record):
+        """
+        Checks if a stored record is at the current version.
+
+        Args:
+            record (dict): The stored record.
+
+        Returns:
+            bool: True if the record does not need to be upgraded.
+        """
+        return self.version(record) == self.current_version
+
+    def upgrade(self, record, *args):
+        """
+        Upgrades a stored record to the current version.
+
+        Args:
+            record (dict): The stored record.
+            *args: The arguments passed to each migration after the record.
+
+        Returns:
+            dict: The record at the current version, with its "version" set.
+
+        Raises:
+            ValueError: If the record is newer than the application, or a migration is missing.
+        """
+        version = self.version(record)
+        if version > self.current_version:
+            raise ValueError(f"Version {version} inconnue (version actuelle : {self.current_version})")
+        while version < self.current_version:
+            if version not in self.migrations:
+                raise ValueError(f"Aucune migration depuis la version {version}")
+            record = self.migrations[version](record, *args)
+            version += 1
+            record["version"] = version
+        return record
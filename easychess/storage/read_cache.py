@@ -0,0 +1,154 @@
+############################################################################################################
+#  READ CACHE                                                                                              #
+############################################################################################################
+from contextlib import contextmanager
+import gc
+import os
+
+from easychess.storage.warm_cache import WarmCache
+from settings import WARM_CACHE
+
+
+@contextmanager
+def gc_paused():
+    """
+    Pauses the cyclic garbage collector while building large data.
+
+    Parsing, unpickling or copying the data allocates many containers, each allocation counting towards
+    a collection which then traverses everything already built, although the data holds no reference
+    cycle. Reference counting still frees the data as usual.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class ReadCache:
+    """
+    In-process read-through cache of the data parsed from files.
+
+    Each entry is stored with the signature (modification time and size) of the files it was read from,
+    and is only returned while these files are unchanged, so a file written by another process or
+    edited by hand is read again. Writers of the application also invalidate the entries of the files
+    they save explicitly, since two writes within the resolution of the file timestamps may leave the
+    same signature.
+
+    Entries missing from memory, at launch, can be loaded from a WarmCache kept on disk.
+
+    Attributes:
+        entries (dict): The (signature, value) of each cached key.
+        warm_cache (WarmCache): The on-disk cache of the persistent entries, or None.
+        hits (int): The number of reads served from memory.
+        warm_hits (int): The number of reads served from the on-disk cache.
+        misses (int): The number of reads loading the files.
+    """
+
+    def __init__(self, warm_cache=None):
+        """
+        Initializes an empty cache.
+
+        Args:
+            warm_cache (WarmCache, optional): The on-disk cache of the persistent entries. Defaults to None.
+        """
+        self.entries = {}
+        self.warm_cache = warm_cache
+        self.hits = 0
+        self.warm_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def signature(paths):
+        """
+        Returns the signature of files: their modification time and size, None for a missing file.
+
+        Args:
+            paths (iterable): The paths of the files.
+
+        Returns:
+            tuple: The (path, modification time in nanoseconds, size) of each file, or (path, None).
+        """
+        signature = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                signature.append((str(path), None))
+            else:
+                signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def get(self, key, paths, load, copy=None, persist=False):
+        """
+        Returns the cached value of a key, or loads it if its files have changed since it was cached.
+
+        The signature is taken before loading, so files written during the load are read again next time.
+        The garbage collector is paused while the value is loaded and copied.
+
+        Args:
+            key (tuple): The key of the value, starting with the path of the file it is read from.
+            paths (iterable): The paths of every file the value is read from.
+            load (callable): The function reading the value from the files.
+            copy (callable, optional): The function copying the value, so that each read returns a copy
+                which the caller may modify. If None, the cached value itself is returned and must not be
+                modified. Defaults to None.
+            persist (bool, optional): Whether to keep the value in the on-disk cache too. Defaults to False.
+
+        Returns:
+            The value read from the files.
+        """
+        signature = self.signature(paths)
+        entry = self.entries.get(key)
+        with gc_paused():
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                value = entry[1]
+            else:
+                warm = self.warm_cache.load(key, signature) if persist and self.warm_cache else None
+                if warm is not None:
+                    self.warm_hits += 1
+                    value = warm[0]
+                else:
+                    self.misses += 1
+                    value = load()
+                    if persist and self.warm_cache:
+                        self.warm_cache.store(key, signature, value)
+                self.entries[key] = (signature, value)
+            return value if copy is None else copy(value)
+
+    def invalidate(self, path):
+        """
+        Removes the entries read from a file, in memory and on disk.
+
+        Args:
+            path (str): The path of the file, as the first element of the keys.
+        """
+        if self.warm_cache:
+            self.warm_cache.invalidate(path)
+        path = str(path)
+        self.entries = {key: entry for key, entry in self.entries.items() if str(key[0]) != path}
+
+    def clear(self):
+        """
+        Removes every entry from memory, as at launch, and resets the counters. The on-disk cache is kept.
+        """
+        self.entries = {}
+        self.hits = 0
+        self.warm_hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Returns the counters of the cache.
+
+        Returns:
+            dict: The number of hits (in memory and on disk), misses and entries.
+        """
+        return {"hits": self.hits, "warm_hits": self.warm_hits, "misses": self.misses, "entries": len(self.entries)}
+
+
+# Shared by every repository of the process, each controller creating its own
+READ_CACHE = ReadCache(WarmCache() if WARM_CACHE else None)
@@ -0,0 +1,26 @@
+############################################################################################################
+#  REPOSITORY                                                                                              #
+############################################################################################################
+from easychess.storage.json_repository import JsonRepository
+from easychess.storage.sqlite_repository import SqliteRepository
+from settings import DATABASE_FILE, PLAYERS_FILE, STORAGE_BACKEND, TOURNAMENTS_FILE
+
+
+def get_repository(backend=STORAGE_BACKEND):
+    """
+    Returns the repository of the storage backend selected in the settings.
+
+    Args:
+        backend (str, optional): "json" or "sqlite". Defaults to settings.STORAGE_BACKEND.
+
+    Returns:
+        JsonRepository | SqliteRepository: The repository used to read and save players and tournaments.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend == "json":
+        return JsonRepository(PLAYERS_FILE, TOURNAMENTS_FILE)
+    if backend == "sqlite":
+        return SqliteRepository(DATABASE_FILE)
+    raise ValueError(f"Backend de stockage inconnu : {backend}")
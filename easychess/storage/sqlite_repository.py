@@ -0,0 +1,578 @@
+############################################################################################################
+#  SQLITE REPOSITORY                                                                                       #
+############################################################################################################
+import sqlite3
+
+from easychess.models.player import Player
+from easychess.models.tournament import Tournament
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    last_name TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    birthdate TEXT,
+    national_id TEXT,
+    score REAL NOT NULL DEFAULT 0,
+    rating REAL NOT NULL DEFAULT 1500,
+    rated_games INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_players_last_name ON players (last_name, first_name);
+CREATE INDEX IF NOT EXISTS idx_players_national_id ON players (national_id);
+
+CREATE TABLE IF NOT EXISTS tournaments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL UNIQUE,
+    location TEXT,
+    description TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    number_of_rounds INTEGER,
+    current_round INTEGER NOT NULL DEFAULT 0,
+    status INTEGER,
+    pairing_system TEXT NOT NULL DEFAULT 'swiss'
+);
+CREATE INDEX IF NOT EXISTS idx_tournaments_status ON tournaments (status);
+
+CREATE TABLE IF NOT EXISTS tournament_players (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    last_name TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    birthdate TEXT,
+    national_id TEXT,
+    score REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (tournament_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_tournament_players_player_id ON tournament_players (player_id);
+
+CREATE TABLE IF NOT EXISTS rounds (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    round_index INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    start_date_time TEXT,
+    end_date_time TEXT,
+    bye INTEGER,
+    PRIMARY KEY (tournament_id, round_index)
+);
+
+CREATE TABLE IF NOT EXISTS matches (
+    tournament_id INTEGER NOT NULL,
+    round_index INTEGER NOT NULL,
+    match_index INTEGER NOT NULL,
+    player1_id INTEGER NOT NULL,
+    score1 REAL NOT NULL DEFAULT 0,
+    player2_id INTEGER NOT NULL,
+    score2 REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (tournament_id, round_index, match_index),
+    FOREIGN KEY (tournament_id, round_index) REFERENCES rounds (tournament_id, round_index) ON DELETE CASCADE
+);
+"""
+
+PLAYER_COLUMNS = ("last_name", "first_name", "birthdate", "national_id", "score")
+
+# Columns of the roster only, not copied with the players of a tournament
+RATING_COLUMNS = ("rating", "rated_games")
+
+# Columns added after the creation of the schema, added to older databases when they are opened
+ADDED_COLUMNS = {
+    "players": (("rating", "REAL NOT NULL DEFAULT 1500"), ("rated_games", "INTEGER NOT NULL DEFAULT 0")),
+    "tournaments": (("pairing_system", "TEXT NOT NULL DEFAULT 'swiss'"),),
+    "rounds": (("bye", "INTEGER"),),
+}
+
+
+class SqliteRepository:
+    """
+    Repository storing players and tournaments in a SQLite database.
+
+    Tournaments are split into tournaments, tournament_players, rounds and matches tables.
+    Every write is an upsert which only rewrites the rows whose values changed, so saving a
+    tournament after a result touches a handful of rows instead of the whole data set.
+
+    Attributes:
+        database_file (str): The path to the SQLite database.
+        connection (sqlite3.Connection): The open database connection.
+    """
+
+    def __init__(self, database_file):
+        """
+        Initializes the SqliteRepository and creates the schema if needed.
+
+        Args:
+            database_file (str): The path to the SQLite database.
+        """
+        self.database_file = database_file
+        self.connection = sqlite3.connect(str(database_file))
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+        self._add_missing_columns()
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self.connection.close()
+
+    ############################################################################################################
+    #                                                PLAYERS                                                   #
+    ############################################################################################################
+    def read_players(self):
+        """
+        Reads every registered player, in registration order.
+
+        Returns:
+            list: A list of player dictionaries.
+        """
+        rows = self.connection.execute(
+            f"SELECT id, {', '.join(PLAYER_COLUMNS + RATING_COLUMNS)} FROM players ORDER BY id"
+        )
+        return [dict(row) for row in rows]
+
+    def save_player(self, player_data):
+        """
+        Registers a new player.
+
+        Args:
+            player_data (dict): The player data to save. Its "id" is kept if set, and set otherwise.
+
+        Returns:
+            int: The id of the player.
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                f"INSERT INTO players (id, {', '.join(PLAYER_COLUMNS + RATING_COLUMNS)}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [player_data.get("id")]
+                + [player_data.get(column) for column in PLAYER_COLUMNS[:-1]]
+                + [
+                    player_data.get("score", 0),
+                    player_data.get("rating", Player.DEFAULT_RATING),
+                    player_data.get("rated_games", 0),
+                ],
+            )
+        player_data["id"] = cursor.lastrowid
+        return cursor.lastrowid
+
+    def save_ratings(self, changes):
+        """
+        Applies rating changes to players in the roster, in a single transaction.
+
+        Args:
+            changes (dict): The (rating change, number of rated games) of each player id.
+        """
+        with self.connection:
+            self.connection.executemany(
+                "UPDATE players SET rating = ROUND(rating + ?, 1), rated_games = rated_games + ? WHERE id = ?",
+                [(change, games, player_id) for player_id, (change, games) in changes.items()],
+            )
+
+    ############################################################################################################
+    #                                                TOURNAMENTS                                               #
+    ############################################################################################################
+    def read_tournaments(self):
+        """
+        Reads every tournament.
+
+        Returns:
+            dict: The tournaments keyed by their storage key ('tournament1', 'tournament2', ...).
+        """
+        rows = self.connection.execute("SELECT * FROM tournaments ORDER BY id").fetchall()
+        return {row["key"]: self._load_tournament(row) for row in rows}
+
+    def read_tournament_headers(self):
+        """
+        Reads the headers of every tournament, without their rounds and players.
+
+        Returns:
+            dict: The tournament headers keyed by their storage key.
+        """
+        return self._read_headers()
+
+    def read_tournament(self, key):
+        """
+        Reads a single tournament.
+
+        Args:
+            key (str): The storage key of the tournament.
+
+        Returns:
+            dict: The tournament data, or None if there is no tournament with this key.
+        """
+        row = self.connection.execute("SELECT * FROM tournaments WHERE key = ?", (key,)).fetchone()
+        return self._load_tournament(row) if row else None
+
+    def find_tournament(self, name):
+        """
+        Finds a tournament by its name.
+
+        Args:
+            name (str): The name of the tournament.
+
+        Returns:
+            dict: The tournament data, or None if no tournament has this name.
+        """
+        row = self.connection.execute("SELECT * FROM tournaments WHERE name = ?", (name,)).fetchone()
+        return self._load_tournament(row) if row else None
+
+    def find_tournaments_by_status(self, status):
+        """
+        Finds the headers of the tournaments having the given status, using the status index.
+
+        Args:
+            status (bool): The status to filter on (None for tournaments in progress).
+
+        Returns:
+            dict: The headers of the matching tournaments keyed by their storage key.
+        """
+        if status is None:
+            return self._read_headers("WHERE tournaments.status IS NULL")
+        return self._read_headers("WHERE tournaments.status = ?", (int(status),))
+
+    def save_tournament(self, tournament_data):
+        """
+        Saves a tournament, replacing the stored tournament with the same name.
+
+        Only the rows whose values changed are rewritten.
+
+        Args:
+            tournament_data (dict): The tournament data to save.
+        """
+        with self.connection:
+            tournament_id = self._save_tournament_row(tournament_data)
+            self._save_players_rows(tournament_id, tournament_data["players"])
+            rounds = tournament_data["list_rounds"]
+            self.connection.executemany(
+                """
+                INSERT INTO rounds (tournament_id, round_index, name, start_date_time, end_date_time, bye)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (tournament_id, round_index) DO UPDATE SET
+                    name = excluded.name,
+                    start_date_time = excluded.start_date_time,
+                    end_date_time = excluded.end_date_time,
+                    bye = excluded.bye
+                WHERE name IS NOT excluded.name
+                    OR start_date_time IS NOT excluded.start_date_time
+                    OR end_date_time IS NOT excluded.end_date_time
+                    OR bye IS NOT excluded.bye
+                """,
+                [
+                    (
+                        tournament_id,
+                        round_index,
+                        round_["name"],
+                        round_["start_date_time"],
+                        round_["end_date_time"],
+                        round_.get("bye"),
+                    )
+                    for round_index, round_ in enumerate(rounds)
+                ],
+            )
+            self.connection.execute(
+                "DELETE FROM rounds WHERE tournament_id = ? AND round_index >= ?", (tournament_id, len(rounds))
+            )
+            for round_index, round_ in enumerate(rounds):
+                self._save_matches_rows(tournament_id, round_index, round_["matches"])
+                self.connection.execute(
+                    "DELETE FROM matches WHERE tournament_id = ? AND round_index = ? AND match_index >= ?",
+                    (tournament_id, round_index, len(round_["matches"])),
+                )
+
+    def check_tournament_saved(self, name):
+        """
+        Reports whether the last save of a tournament failed: saves are performed at once in a transaction,
+        so a failed save has already raised its error.
+
+        Unlike the JSON backend, tournaments have no revision: a tournament saved by another process since it
+        was read is overwritten, so several instances must not work on the same tournament.
+
+        Args:
+            name (str): The name of the tournament.
+        """
+
+    def save_match(self, tournament_data, round_index, match_index):
+        """
+        Saves the result of a single match of a tournament.
+
+        Only the match row, the tournament row and the scores of the players are updated.
+
+        Args:
+            tournament_data (dict): The tournament data containing the match.
+            round_index (int): The index of the round of the match.
+            match_index (int): The index of the match in the round.
+        """
+        self.save_matches(tournament_data, round_index, [match_index])
+
+    def save_matches(self, tournament_data, round_index, match_indexes):
+        """
+        Saves the results of several matches of a round in a single transaction.
+
+        Only the match rows, the tournament row and the scores of the players are updated.
+
+        Args:
+            tournament_data (dict): The tournament data containing the matches.
+            round_index (int): The index of the round of the matches.
+            match_indexes (list): The indexes of the matches in the round.
+        """
+        row = self.connection.execute(
+            "SELECT id FROM tournaments WHERE name = ?", (tournament_data["name"],)
+        ).fetchone()
+        if row is None:
+            self.save_tournament(tournament_data)
+            return
+        with self.connection:
+            tournament_id = self._save_tournament_row(tournament_data)
+            self._save_players_rows(tournament_id, tournament_data["players"])
+            matches = tournament_data["list_rounds"][round_index]["matches"]
+            self.connection.executemany(
+                """
+                UPDATE matches SET score1 = ?, score2 = ?
+                WHERE tournament_id = ? AND round_index = ? AND match_index = ?
+                """,
+                [
+                    (matches[match_index][0][1], matches[match_index][1][1], tournament_id, round_index, match_index)
+                    for match_index in match_indexes
+                ],
+            )
+
+    def migrate(self):
+        """
+        Migrates the stored tournaments to the normalized format. The tables already reference
+        the players of the matches by id, so there is nothing to rewrite.
+
+        Returns:
+            int: The number of tournaments migrated, always 0.
+        """
+        return 0
+
+    def import_json(self, json_repository):
+        """
+        Copies every player and tournament of a JSON repository into the database.
+
+        Players keep their ids. Tournaments are loaded through the model first, so that tournaments
+        saved in an older format are upgraded.
+
+        Args:
+            json_repository (JsonRepository): The repository to import.
+
+        Returns:
+            tuple: The number of players added and the number of tournaments imported.
+        """
+        known_ids = {player["id"] for player in self.read_players()}
+        players = [player for player in json_repository.read_players() if player["id"] not in known_ids]
+        for player in players:
+            self.save_player(player)
+        tournaments = json_repository.read_tournaments()
+        for tournament in tournaments.values():
+            self.save_tournament(Tournament.from_dict(tournament).as_dict())
+        return len(players), len(tournaments)
+
+    ############################################################################################################
+    #                                                ROWS                                                      #
+    ############################################################################################################
+    def _read_headers(self, where="", parameters=()):
+        """
+        Reads the headers of the tournaments, without their rounds and players.
+
+        Args:
+            where (str, optional): The WHERE clause selecting the tournaments. Defaults to every tournament.
+            parameters (tuple, optional): The parameters of the WHERE clause. Defaults to none.
+
+        Returns:
+            dict: The tournament headers keyed by their storage key.
+        """
+        rows = self.connection.execute(
+            f"""
+            SELECT tournaments.*, COUNT(tournament_players.position) AS number_of_players
+            FROM tournaments LEFT JOIN tournament_players ON tournament_players.tournament_id = tournaments.id
+            {where}
+            GROUP BY tournaments.id ORDER BY tournaments.id
+            """,
+            parameters,
+        )
+        return {
+            row["key"]: {
+                "name": row["name"],
+                "location": row["location"],
+                "description": row["description"],
+                "status": None if row["status"] is None else bool(row["status"]),
+                "start_date": row["start_date"],
+                "end_date": row["end_date"],
+                "number_of_rounds": row["number_of_rounds"],
+                "current_round": row["current_round"],
+                "number_of_players": row["number_of_players"],
+            }
+            for row in rows
+        }
+
+    def _save_tournament_row(self, tournament_data):
+        """
+        Inserts or updates the tournaments row of a tournament.
+
+        Args:
+            tournament_data (dict): The tournament data.
+
+        Returns:
+            int: The id of the tournament row.
+        """
+        row = self.connection.execute(
+            "SELECT id FROM tournaments WHERE name = ?", (tournament_data["name"],)
+        ).fetchone()
+        status = None if tournament_data.get("status") is None else int(tournament_data["status"])
+        values = (
+            tournament_data["location"],
+            tournament_data["description"],
+            tournament_data["start_date"],
+            tournament_data["end_date"],
+            tournament_data["number_of_rounds"],
+            tournament_data["current_round"],
+            status,
+            tournament_data.get("pairing_system", Tournament.SWISS),
+        )
+        if row is None:
+            count = self.connection.execute("SELECT COUNT(*) FROM tournaments").fetchone()[0]
+            cursor = self.connection.execute(
+                """
+                INSERT INTO tournaments (key, name, location, description, start_date, end_date,
+                                         number_of_rounds, current_round, status, pairing_system)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (f"tournament{count + 1}", tournament_data["name"]) + values,
+            )
+            return cursor.lastrowid
+        self.connection.execute(
+            """
+            UPDATE tournaments SET location = ?, description = ?, start_date = ?, end_date = ?,
+                                   number_of_rounds = ?, current_round = ?, status = ?, pairing_system = ?
+            WHERE id = ?
+            """,
+            values + (row["id"],),
+        )
+        return row["id"]
+
+    def _save_players_rows(self, tournament_id, players):
+        """
+        Upserts the players of a tournament, rewriting only the changed rows.
+
+        Args:
+            tournament_id (int): The id of the tournament row.
+            players (list): The player dictionaries of the tournament.
+        """
+        self.connection.executemany(
+            """
+            INSERT INTO tournament_players
+                (tournament_id, position, player_id, last_name, first_name, birthdate, national_id, score)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (tournament_id, position) DO UPDATE SET
+                player_id = excluded.player_id,
+                last_name = excluded.last_name,
+                first_name = excluded.first_name,
+                birthdate = excluded.birthdate,
+                national_id = excluded.national_id,
+                score = excluded.score
+            WHERE player_id IS NOT excluded.player_id
+                OR last_name IS NOT excluded.last_name
+                OR first_name IS NOT excluded.first_name
+                OR score IS NOT excluded.score
+            """,
+            [
+                (tournament_id, position, player["id"]) + tuple(player.get(column) for column in PLAYER_COLUMNS)
+                for position, player in enumerate(players)
+            ],
+        )
+        self.connection.execute(
+            "DELETE FROM tournament_players WHERE tournament_id = ? AND position >= ?", (tournament_id, len(players))
+        )
+
+    def _save_matches_rows(self, tournament_id, round_index, matches):
+        """
+        Upserts the matches of a round, rewriting only the changed rows.
+
+        Args:
+            tournament_id (int): The id of the tournament row.
+            round_index (int): The index of the round.
+            matches (list): The matches of the round as tuples of [player id, score] pairs.
+        """
+        self.connection.executemany(
+            """
+            INSERT INTO matches (tournament_id, round_index, match_index, player1_id, score1, player2_id, score2)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (tournament_id, round_index, match_index) DO UPDATE SET
+                player1_id = excluded.player1_id,
+                score1 = excluded.score1,
+                player2_id = excluded.player2_id,
+                score2 = excluded.score2
+            WHERE player1_id IS NOT excluded.player1_id
+                OR score1 IS NOT excluded.score1
+                OR player2_id IS NOT excluded.player2_id
+                OR score2 IS NOT excluded.score2
+            """,
+            [
+                (tournament_id, round_index, match_index, match[0][0], match[0][1], match[1][0], match[1][1])
+                for match_index, match in enumerate(matches)
+            ],
+        )
+
+    def _load_tournament(self, row):
+        """
+        Rebuilds the dictionary of a tournament from its rows.
+
+        Args:
+            row (sqlite3.Row): The tournaments row.
+
+        Returns:
+            dict: The tournament data, in the same format as the JSON repository.
+        """
+        players = self.connection.execute(
+            f"""
+            SELECT player_id AS id, {', '.join(PLAYER_COLUMNS)} FROM tournament_players
+            WHERE tournament_id = ? ORDER BY position
+            """,
+            (row["id"],),
+        )
+        rounds = self.connection.execute(
+            "SELECT * FROM rounds WHERE tournament_id = ? ORDER BY round_index", (row["id"],)
+        ).fetchall()
+        matches = {}
+        for match in self.connection.execute(
+            "SELECT * FROM matches WHERE tournament_id = ? ORDER BY round_index, match_index", (row["id"],)
+        ):
+            matches.setdefault(match["round_index"], []).append(
+                ([match["player1_id"], match["score1"]], [match["player2_id"], match["score2"]])
+            )
+        return {
+            "name": row["name"],
+            "location": row["location"],
+            "start_date": row["start_date"],
+            "end_date": row["end_date"],
+            "number_of_rounds": row["number_of_rounds"],
+            "current_round": row["current_round"],
+            "players": [dict(player) for player in players],
+            "list_rounds": [
+                {
+                    "name": round_["name"],
+                    "start_date_time": round_["start_date_time"],
+                    "end_date_time": round_["end_date_time"],
+                    "matches": matches.get(round_["round_index"], []),
+                    "bye": round_["bye"],
+                }
+                for round_ in rounds
+            ],
+            "description": row["description"],
+            "status": None if row["status"] is None else bool(row["status"]),
+            "pairing_system": row["pairing_system"],
+        }
+
+    def _add_missing_columns(self):
+        """
+        Adds the columns created after the first version of the schema to an older database.
+        """
+        with self.connection:
+            for table, columns in ADDED_COLUMNS.items():
+                existing = {row["name"] for row in self.connection.execute(f"PRAGMA table_info({table})")}
+                for name, definition in columns:
+                    if name not in existing:
+                        self.connection.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
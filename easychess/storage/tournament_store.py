@@ -0,0 +1,731 @@
+############################################################################################################
+#  TOURNAMENT STORE                                                                                        #
+############################################################################################################
+import hashlib
+import json
+import logging
+import os
+import re
+
+from easychess.models.player import Player
+from easychess.models.tournament import Tournament
+from easychess.storage.file_lock import FileLock
+from easychess.storage.journal import Journal
+from easychess.storage.migrations import MigrationRegistry
+
+
+class RevisionConflictError(ValueError):
+    """
+    Raised when a tournament is saved over a revision written by another process since it was read.
+    """
+
+
+class TournamentStore:
+    """
+    Storage of the tournaments in JSON files, used by JsonRepository.
+
+    Match results entered while a tournament is running are checkpointed as small deltas in a
+    per-tournament journal, replayed on read on top of the last saved snapshot.
+
+    Tournaments are stored normalized (FORMAT_VERSION 2): the players of the roster are referenced
+    by their id with their score in the tournament, and matches are (id, id, result) triples. They
+    are expanded back into full player dictionaries and [[id, score], [id, score]] matches on read.
+    Tournaments stored in an older format are upgraded by the migrations of TOURNAMENT_MIGRATIONS
+    when they are first read, and rewritten in the current format.
+
+    Each tournament is stored in its own shard, '<file>_shards/<key>.json', and the JSON file itself is a small
+    manifest holding the header of every tournament: saving or reading a tournament only writes or parses its
+    shard and the manifest, whatever the number of tournaments. Files in the former single-file layout are split
+    into shards when first read.
+
+    Several processes may work on the same file: it is only written under an exclusive FileLock and read
+    under a shared one. Each save increments the revision of the tournament, and a tournament is not saved
+    over a revision written by another process since it was read, so that no update is lost.
+    """
+
+    # Version of the stored format of the tournaments; tournaments without a version are stored expanded
+    FORMAT_VERSION = 2
+
+    # Layout of the tournaments file: a manifest of the headers, the tournaments being stored in shards
+    LAYOUT = "shards"
+
+    # Last revision saved by this process of each (file, tournament name)
+    saved_revisions = {}
+
+    @classmethod
+    def read(cls, file_path, roster):
+        """
+        Reads every tournament from the shards of a specified JSON file and replays the checkpointed match results.
+
+        Tournaments stored in an older format are upgraded and rewritten in the current format.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            roster (dict): The player dictionaries of the roster, by id, referenced by the stored tournaments.
+
+        Returns:
+            dict: The tournament data as a dictionary, or an empty dictionary if the file is not found.
+        """
+        with FileLock(file_path, shared=True):
+            headers = cls.load_headers(file_path)
+            if headers is not None:
+                records = {key: cls.read_shard(file_path, key) for key in headers}
+        if headers is None:
+            # Single-file layout: split the tournaments into shards, then read again
+            cls.read_headers(file_path)
+            return cls.read(file_path, roster)
+        outdated = {
+            key: TOURNAMENT_MIGRATIONS.upgrade(record, roster)
+            for key, record in records.items()
+            if not TOURNAMENT_MIGRATIONS.is_current(record)
+        }
+        if outdated:
+            records.update(outdated)
+            cls.rewrite_upgraded(file_path, outdated, headers)
+        tournaments = {key: cls.expand(record, roster) for key, record in records.items()}
+        checkpoints_dir = cls.checkpoints_dir(file_path)
+        if os.path.isdir(checkpoints_dir) and os.listdir(checkpoints_dir):
+            for tournament_data in tournaments.values():
+                cls.replay_checkpoints(file_path, tournament_data)
+        return tournaments
+
+    @classmethod
+    def read_headers(cls, file_path):
+        """
+        Reads the manifest of the tournaments: name, location, description, status, dates,
+        rounds, number of players and revision of each tournament.
+
+        A file in the former single-file layout is split into shards first.
+
+        Args:
+            file_path (str): The path to the JSON file.
+
+        Returns:
+            dict: The tournament headers keyed by their storage key, or an empty dictionary if the file is not found.
+        """
+        with FileLock(file_path, shared=True):
+            headers = cls.load_headers(file_path)
+        if headers is None:
+            with FileLock(file_path):
+                headers = cls.current_headers(file_path)
+        return headers
+
+    @classmethod
+    def load_headers(cls, file_path):
+        """
+        Reads the manifest of the tournaments.
+
+        Args:
+            file_path (str): The path to the JSON file.
+
+        Returns:
+            dict: The tournament headers keyed by their storage key, an empty dictionary if the file is not found,
+            or None if the file is in the former single-file layout.
+        """
+        try:
+            with open(file_path, "r") as manifest_file:
+                manifest = json.load(manifest_file)
+        except FileNotFoundError:
+            return {}
+        if manifest.get("layout") != cls.LAYOUT:
+            return None
+        return manifest["tournaments"]
+
+    @classmethod
+    def current_headers(cls, file_path):
+        """
+        Reads the manifest of the tournaments, splitting a file in the former single-file layout into shards.
+
+        The shards are written before the manifest replaces the single file, so an interrupted split
+        leaves the single file. The caller must hold the exclusive lock of the file.
+
+        Args:
+            file_path (str): The path to the JSON file.
+
+        Returns:
+            dict: The tournament headers keyed by their storage key, or an empty dictionary if the file is not found.
+        """
+        headers = cls.load_headers(file_path)
+        if headers is not None:
+            return headers
+        with open(file_path, "r") as json_file:
+            tournaments = json.load(json_file)
+        bodies = {key: json.dumps(tournament_data) for key, tournament_data in tournaments.items()}
+        headers = {key: cls.header(tournament_data) for key, tournament_data in tournaments.items()}
+        cls.write_tournaments(file_path, bodies, headers)
+        # Header index of the single-file layout, replaced by the manifest
+        index_path = os.path.splitext(str(file_path))[0] + "_index.json"
+        if os.path.exists(index_path):
+            os.remove(index_path)
+        return headers
+
+    @classmethod
+    def read_one(cls, file_path, key, roster):
+        """
+        Reads a single tournament from its shard, and replays its checkpointed match results.
+
+        A tournament stored in an older format is upgraded and rewritten in the current format.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            key (str): The storage key of the tournament.
+            roster (dict): The player dictionaries of the roster, by id.
+
+        Returns:
+            dict: The tournament data, or None if there is no tournament with this key.
+        """
+        with FileLock(file_path, shared=True):
+            headers = cls.load_headers(file_path)
+            if headers is not None and key in headers:
+                record = cls.read_shard(file_path, key)
+        if headers is None:
+            # Single-file layout: split the tournaments into shards, then read again
+            cls.read_headers(file_path)
+            return cls.read_one(file_path, key, roster)
+        if key not in headers:
+            return None
+        if not TOURNAMENT_MIGRATIONS.is_current(record):
+            record = TOURNAMENT_MIGRATIONS.upgrade(record, roster)
+            cls.rewrite_upgraded(file_path, {key: record}, headers)
+        tournament_data = cls.expand(record, roster)
+        cls.replay_checkpoints(file_path, tournament_data)
+        return tournament_data
+
+    @classmethod
+    def save(cls, file_path, tournament_data, roster):
+        """
+        Saves tournament data to its shard, in the normalized format, and updates the manifest.
+
+        The other tournaments are neither read nor written. The saved data is a full snapshot, so the checkpointed
+        match results of the tournament are discarded, after merging those of the matches it has no result for,
+        which may have been entered by another process.
+
+        The tournament is not saved if another process saved it since it was read (or last saved by this
+        process): its stored revision must be the one the data was read from, or the one saved last.
+        Errors are raised to the caller, which reports them (see JsonRepository.check_tournament_saved).
+
+        Args:
+            file_path (str): The path to the JSON file.
+            tournament_data (dict): The tournament data to be saved.
+            roster (dict): The player dictionaries of the roster, by id.
+
+        Raises:
+            RevisionConflictError: If another process saved the tournament since it was read.
+            OSError: If the tournament could not be written.
+        """
+        with FileLock(file_path):
+            headers = cls.current_headers(file_path)
+            tournament_name = tournament_data["name"]
+            for key, header in headers.items():
+                if header["name"] == tournament_name:
+                    tournament_key = key
+                    break
+            else:
+                tournament_key = f"tournament{len(headers) + 1}"
+            revision = cls.check_revision(file_path, tournament_data, headers.get(tournament_key))
+            journal = cls.checkpoint_journal(file_path, tournament_name)
+            record = cls.normalize(cls.merge_checkpoints(tournament_data, journal.read(), revision), roster)
+            record["revision"] = revision + 1
+            cls.rewrite(file_path, {tournament_key: record}, headers)
+            journal.clear()
+            cls.saved_revisions[(str(file_path), tournament_name)] = record["revision"]
+
+    @classmethod
+    def check_revision(cls, file_path, tournament_data, header):
+        """
+        Checks that a tournament can be saved over its stored revision.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            tournament_data (dict): The tournament data to be saved.
+            header (dict): The header of the stored tournament with the same name, or None.
+
+        Returns:
+            int: The stored revision, 0 if the tournament is not stored yet.
+
+        Raises:
+            RevisionConflictError: If the stored revision was saved by another process since the data was read.
+        """
+        if header is None:
+            return 0
+        stored_revision = header.get("revision") or 0
+        saved_revision = cls.saved_revisions.get((str(file_path), tournament_data["name"]))
+        read_revision = tournament_data.get("revision")
+        if read_revision is None and saved_revision is None:
+            # A tournament created by this process replaces the stored one, as before revisions existed
+            return stored_revision
+        if stored_revision not in (read_revision, saved_revision):
+            raise RevisionConflictError(
+                f"Le tournoi {tournament_data['name']} a été modifié par un autre processus "
+                f"(révision {stored_revision}) : enregistrement refusé"
+            )
+        return stored_revision
+
+    @classmethod
+    def merge_checkpoints(cls, tournament_data, deltas, revision):
+        """
+        Applies checkpointed match results to tournament data, for the matches it has no result for.
+
+        Args:
+            tournament_data (dict): The tournament data.
+            deltas (list): The checkpoint records of the tournament.
+            revision (int): The stored revision of the tournament. Records written against another
+                revision are dropped.
+
+        Returns:
+            dict: The tournament data, copied if a result was merged.
+        """
+        merged = tournament_data
+        for delta in cls.current_checkpoints(deltas, revision):
+            for match_index, score1, score2 in cls.checkpoint_results(delta):
+                (_, played1), (_, played2) = merged["list_rounds"][delta["round"]]["matches"][match_index]
+                if not played1 + played2:
+                    if merged is tournament_data:
+                        merged = cls.copy_data(tournament_data)
+                    cls.apply_match_result(merged, delta["round"], match_index, score1, score2)
+        return merged
+
+    @classmethod
+    def rewrite_upgraded(cls, file_path, records, headers):
+        """
+        Rewrites tournaments upgraded to the current format, unless another process saved them since they were read.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            records (dict): The upgraded tournament data, keyed by storage key.
+            headers (dict): The manifest headers at the time the tournaments were read.
+        """
+        try:
+            with FileLock(file_path):
+                current = cls.current_headers(file_path)
+                records = {key: record for key, record in records.items() if current.get(key) == headers.get(key)}
+                if records:
+                    cls.rewrite(file_path, records, current)
+        except Exception as e:
+            logging.error(f"An error occurred while saving data to {file_path}: {e}")
+
+    @classmethod
+    def rewrite(cls, file_path, records, headers=None):
+        """
+        Replaces or adds stored tournaments: only their shards and the manifest are written.
+        The checkpoint journals are kept. The caller must hold the exclusive lock of the file.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            records (dict): The stored tournament data to write, keyed by storage key.
+            headers (dict, optional): The manifest headers, if already read. Defaults to reading them.
+        """
+        if headers is None:
+            headers = cls.current_headers(file_path)
+        bodies = {}
+        for key, record in records.items():
+            bodies[key] = json.dumps(record)
+            headers[key] = cls.header(record)
+        cls.write_tournaments(file_path, bodies, headers)
+
+    @classmethod
+    def write_tournaments(cls, file_path, bodies, headers):
+        """
+        Writes serialized tournaments to their shards, then the manifest with the headers of every tournament.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            bodies (dict): The serialized JSON of the tournaments to write, keyed by storage key.
+            headers (dict): The headers of every tournament, keyed by storage key.
+        """
+        os.makedirs(cls.shards_dir(file_path), exist_ok=True)
+        for key, body in bodies.items():
+            Journal.write_text_atomic(cls.shard_path(file_path, key), body)
+        Journal.write_json_atomic(file_path, {"layout": cls.LAYOUT, "tournaments": headers})
+
+    @classmethod
+    def shards_dir(cls, file_path):
+        """
+        Returns the directory holding the shards of the tournaments, e.g. 'data_tournament_shards'.
+
+        Args:
+            file_path (str): The path to the JSON file.
+
+        Returns:
+            str: The path to the shards directory.
+        """
+        return os.path.splitext(str(file_path))[0] + "_shards"
+
+    @classmethod
+    def shard_path(cls, file_path, key):
+        """
+        Returns the shard of a tournament, e.g. 'data_tournament_shards/tournament3.json'.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            key (str): The storage key of the tournament.
+
+        Returns:
+            str: The path to the shard.
+        """
+        return os.path.join(cls.shards_dir(file_path), f"{key}.json")
+
+    @classmethod
+    def read_shard(cls, file_path, key):
+        """
+        Reads the stored data of a tournament from its shard.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            key (str): The storage key of the tournament.
+
+        Returns:
+            dict: The stored tournament data.
+        """
+        with open(cls.shard_path(file_path, key), "r") as shard_file:
+            return json.load(shard_file)
+
+    @staticmethod
+    def header(tournament_data):
+        """
+        Extracts the header of a tournament: everything the menus display, without rounds and players.
+
+        Args:
+            tournament_data (dict): The tournament data.
+
+        Returns:
+            dict: The header of the tournament.
+        """
+        return {
+            "name": tournament_data["name"],
+            "location": tournament_data["location"],
+            "description": tournament_data["description"],
+            "status": tournament_data.get("status"),
+            "start_date": tournament_data["start_date"],
+            "end_date": tournament_data["end_date"],
+            "number_of_rounds": tournament_data["number_of_rounds"],
+            "current_round": tournament_data["current_round"],
+            "number_of_players": len(tournament_data["players"]),
+            "revision": tournament_data.get("revision"),
+        }
+
+    @staticmethod
+    def copy_data(tournament_data):
+        """
+        Copies tournament data, as read, so that the copy can be modified without changing the original.
+
+        Faster than a deep copy, as it relies on the layout of the data: flat player dictionaries,
+        and rounds of [[id, score], [id, score]] matches.
+
+        Args:
+            tournament_data (dict): The tournament data.
+
+        Returns:
+            dict: The copy of the tournament data.
+        """
+        return dict(
+            tournament_data,
+            players=[dict(player) for player in tournament_data["players"]],
+            list_rounds=[
+                dict(round_data, matches=[[list(side1), list(side2)] for side1, side2 in round_data["matches"]])
+                for round_data in tournament_data["list_rounds"]
+            ],
+        )
+
+    @classmethod
+    def normalize(cls, tournament_data, roster):
+        """
+        Converts tournament data into the stored format.
+
+        The players found in the roster with the same id, name and national ID are replaced by their
+        [id, score] pair; the others, such as the players of tournaments saved before player ids existed,
+        are kept in full. Each match becomes a [player 1 id, player 2 id, result] triple, the result being
+        the score of player 1, or None if the match has not been played.
+
+        Args:
+            tournament_data (dict): The tournament data, with players and matches referenced by id.
+            roster (dict): The player dictionaries of the roster, by id.
+
+        Returns:
+            dict: The normalized tournament data.
+        """
+        record = {key: value for key, value in tournament_data.items() if key not in ("players", "list_rounds")}
+        record["version"] = cls.FORMAT_VERSION
+        record["players"] = []
+        for player in tournament_data["players"]:
+            if Player.is_roster_player(player, roster.get(player["id"])):
+                record["players"].append([player["id"], player["score"]])
+            else:
+                record["players"].append(player)
+        record["list_rounds"] = [
+            dict(
+                round_data,
+                matches=[
+                    [player1[0], player2[0], player1[1] if player1[1] + player2[1] else None]
+                    for player1, player2 in round_data["matches"]
+                ],
+            )
+            for round_data in tournament_data["list_rounds"]
+        ]
+        return record
+
+    @classmethod
+    def expand(cls, record, roster):
+        """
+        Converts stored tournament data, in the current format, back into full tournament data.
+
+        Args:
+            record (dict): The stored tournament data.
+            roster (dict): The player dictionaries of the roster, by id.
+
+        Returns:
+            dict: The tournament data, with full player dictionaries and [[id, score], [id, score]] matches,
+            and the stored revision.
+        """
+        tournament_data = {
+            key: value for key, value in record.items() if key not in ("version", "players", "list_rounds")
+        }
+        # Tournaments saved before revisions existed are at revision 0
+        tournament_data["revision"] = record.get("revision") or 0
+        players = []
+        for entry in record["players"]:
+            if isinstance(entry, list):
+                player_id, score = entry
+                roster_player = roster.get(player_id) or {
+                    "last_name": "Joueur",
+                    "first_name": str(player_id),
+                    "birthdate": None,
+                    "national_id": None,
+                }
+                entry = dict(roster_player, id=player_id, score=score)
+            players.append(entry)
+        tournament_data["players"] = players
+        tournament_data["list_rounds"] = [
+            dict(
+                round_data,
+                matches=[
+                    [[player1_id, 0], [player2_id, 0]]
+                    if result is None
+                    else [[player1_id, result], [player2_id, 1 - result]]
+                    for player1_id, player2_id, result in round_data["matches"]
+                ],
+            )
+            for round_data in record["list_rounds"]
+        ]
+        return tournament_data
+
+    @classmethod
+    def migrate(cls, file_path, roster):
+        """
+        Upgrades and rewrites at once every tournament stored in an older format, instead of on first read.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            roster (dict): The player dictionaries of the roster, by id.
+
+        Returns:
+            int: The number of tournaments migrated.
+        """
+        with FileLock(file_path):
+            headers = cls.current_headers(file_path)
+            outdated = {}
+            for key in headers:
+                record = cls.read_shard(file_path, key)
+                if not TOURNAMENT_MIGRATIONS.is_current(record):
+                    outdated[key] = TOURNAMENT_MIGRATIONS.upgrade(record, roster)
+            if outdated:
+                cls.rewrite(file_path, outdated, headers)
+        return len(outdated)
+
+    @classmethod
+    def save_match(cls, file_path, tournament_data, round_index, match_index):
+        """
+        Checkpoints the result of a single match by appending it to the journal of the tournament.
+
+        The append is flushed to disk before returning, so an entered result survives a crash.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            tournament_data (dict): The tournament data containing the match.
+            round_index (int): The index of the round of the match.
+            match_index (int): The index of the match in the round.
+        """
+        (_, score1), (_, score2) = tournament_data["list_rounds"][round_index]["matches"][match_index]
+        delta = {"round": round_index, "match": match_index, "score1": score1, "score2": score2}
+        cls.append_checkpoint(file_path, tournament_data, delta)
+
+    @classmethod
+    def save_matches(cls, file_path, tournament_data, round_index, match_indexes):
+        """
+        Checkpoints the results of several matches of a round as a single journal record,
+        so they are replayed all together or not at all.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            tournament_data (dict): The tournament data containing the matches.
+            round_index (int): The index of the round of the matches.
+            match_indexes (list): The indexes of the matches in the round.
+        """
+        matches = tournament_data["list_rounds"][round_index]["matches"]
+        cls.append_checkpoint(
+            file_path,
+            tournament_data,
+            {
+                "round": round_index,
+                "matches": [
+                    [match_index, matches[match_index][0][1], matches[match_index][1][1]]
+                    for match_index in match_indexes
+                ],
+            },
+        )
+
+    @classmethod
+    def append_checkpoint(cls, file_path, tournament_data, delta):
+        """
+        Appends a checkpoint record to the durable journal of a tournament.
+
+        The record holds the revision of the snapshot the results were entered on, so that it is dropped
+        if the tournament was saved with other pairings since (e.g. a tournament recreated with the same name).
+
+        Args:
+            file_path (str): The path to the JSON file.
+            tournament_data (dict): The tournament data.
+            delta (dict): The checkpoint record.
+        """
+        saved_revision = cls.saved_revisions.get((str(file_path), tournament_data["name"]))
+        revisions = [rev for rev in (tournament_data.get("revision"), saved_revision) if rev is not None]
+        delta = dict(delta, revision=max(revisions, default=0))
+        try:
+            os.makedirs(cls.checkpoints_dir(file_path), exist_ok=True)
+            cls.checkpoint_journal(file_path, tournament_data["name"]).append(delta)
+        except Exception as e:
+            logging.error(f"An error occurred while saving data to {file_path}: {e}")
+
+    @classmethod
+    def checkpoints_dir(cls, file_path):
+        """
+        Returns the directory holding the checkpoint journals, e.g. 'data_tournament_checkpoints'.
+
+        Args:
+            file_path (str): The path to the JSON file.
+
+        Returns:
+            str: The path to the checkpoints directory.
+        """
+        return os.path.splitext(str(file_path))[0] + "_checkpoints"
+
+    @classmethod
+    def checkpoint_journal(cls, file_path, tournament_name):
+        """
+        Returns the durable journal of the match results of a tournament.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            tournament_name (str): The name of the tournament.
+
+        Returns:
+            Journal: The checkpoint journal of the tournament.
+        """
+        slug = re.sub(r"[^0-9A-Za-z-]+", "_", tournament_name)
+        digest = hashlib.sha1(tournament_name.encode("utf-8")).hexdigest()[:8]
+        return Journal(os.path.join(cls.checkpoints_dir(file_path), f"{slug}-{digest}.jsonl"), durable=True)
+
+    @classmethod
+    def replay_checkpoints(cls, file_path, tournament_data):
+        """
+        Applies the checkpointed match results of a tournament on top of its saved snapshot.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            tournament_data (dict): The tournament data. Updated in place.
+        """
+        deltas = cls.checkpoint_journal(file_path, tournament_data["name"]).read()
+        for delta in cls.current_checkpoints(deltas, tournament_data.get("revision") or 0):
+            for match_index, score1, score2 in cls.checkpoint_results(delta):
+                cls.apply_match_result(tournament_data, delta["round"], match_index, score1, score2)
+
+    @staticmethod
+    def current_checkpoints(deltas, revision):
+        """
+        Filters the checkpoint records written against a stored revision of a tournament.
+
+        Records written before revisions were checkpointed have none, and are kept.
+
+        Args:
+            deltas (list): The checkpoint records of the tournament.
+            revision (int): The stored revision of the tournament.
+
+        Returns:
+            list: The checkpoint records of that revision.
+        """
+        return [delta for delta in deltas if delta.get("revision", revision) == revision]
+
+    @staticmethod
+    def checkpoint_results(delta):
+        """
+        Returns the match results of a checkpoint record.
+
+        Args:
+            delta (dict): The checkpoint record, for one match or several matches of a round.
+
+        Returns:
+            list: The (match index, score of player 1, score of player 2) results.
+        """
+        if "matches" in delta:
+            return delta["matches"]
+        return [(delta["match"], delta["score1"], delta["score2"])]
+
+    @staticmethod
+    def apply_match_result(tournament_data, round_index, match_index, score1, score2):
+        """
+        Sets the result of a match in tournament data and updates the players' scores accordingly.
+
+        Applying the same result twice has no further effect.
+
+        Args:
+            tournament_data (dict): The tournament data containing the match.
+            round_index (int): The index of the round of the match.
+            match_index (int): The index of the match in the round.
+            score1 (float): The score of the first player.
+            score2 (float): The score of the second player.
+        """
+        match = tournament_data["list_rounds"][round_index]["matches"][match_index]
+        players = {}
+        for player in tournament_data["players"]:
+            players[player.get("id")] = player
+            players[f"{player['last_name']} {player['first_name']}"] = player
+        for side, score in ((match[0], score1), (match[1], score2)):
+            player = players.get(side[0])
+            if player is not None:
+                player["score"] += score - side[1]
+            side[1] = score
+
+
+TOURNAMENT_MIGRATIONS = MigrationRegistry(TournamentStore.FORMAT_VERSION)
+
+
+@TOURNAMENT_MIGRATIONS.register(1)
+def normalize_tournament(record, roster):
+    """
+    Upgrades a tournament stored expanded (version 1) to the normalized format (version 2).
+
+    Tournaments saved before player ids existed receive ids local to the tournament, and their matches,
+    which reference players by "last_name first_name", are resolved to these ids. Tournaments saved
+    before byes and pairing systems existed are Swiss tournaments without byes.
+
+    Args:
+        record (dict): The stored tournament data, in version 1.
+        roster (dict): The player dictionaries of the roster, by id.
+
+    Returns:
+        dict: The stored tournament data, in version 2.
+    """
+    players = record["players"]
+    next_id = max((player["id"] for player in players if player.get("id") is not None), default=0) + 1
+    for player in players:
+        if player.get("id") is None:
+            player["id"] = next_id
+            next_id += 1
+    players_by_name = {f"{player['last_name']} {player['first_name']}": player["id"] for player in players}
+    for round_data in record["list_rounds"]:
+        round_data.setdefault("bye", None)
+        for side in (side for match in round_data["matches"] for side in match):
+            if isinstance(side[0], str):
+                side[0] = players_by_name.get(side[0], side[0])
+    record.setdefault("pairing_system", Tournament.SWISS)
+    return TournamentStore.normalize(record, roster)
@@ -0,0 +1,106 @@
+############################################################################################################
+#  WARM CACHE                                                                                              #
+############################################################################################################
+import logging
+import os
+import pickle
+import re
+
+
+class WarmCache:
+    """
+    On-disk cache of the data parsed from files, kept across launches of the application.
+
+    The data read from a file is pickled next to it, in a '<file>_cache' directory, with the signature
+    of the files it was read from. At the next launch it is unpickled instead of parsing and expanding
+    the files again, as long as they still have the same signature. The cache only holds data written
+    by the application itself: like the data files next to it, it must not come from an untrusted source.
+    """
+
+    @staticmethod
+    def cache_dir(path):
+        """
+        Returns the directory holding the cached data read from a file, e.g. 'data_tournament_cache'.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            str: The path to the cache directory.
+        """
+        return os.path.splitext(str(path))[0] + "_cache"
+
+    @classmethod
+    def cache_file(cls, key):
+        """
+        Returns the file holding the cached data of a key, e.g. 'data_tournament_cache/tournament-tournament3.pickle'.
+
+        Args:
+            key (tuple): The key of the data, starting with the path of the file it is read from.
+
+        Returns:
+            str: The path to the cache file.
+        """
+        name = re.sub(r"[^0-9A-Za-z-]+", "_", "-".join(str(part) for part in key[1:]))
+        return os.path.join(cls.cache_dir(key[0]), f"{name}.pickle")
+
+    def load(self, key, signature):
+        """
+        Loads the cached data of a key, if it was read from files with the given signature.
+
+        Args:
+            key (tuple): The key of the data.
+            signature (tuple): The current signature of the files the data is read from.
+
+        Returns:
+            tuple: The data, in a one-element tuple, or None if it is not cached or outdated.
+        """
+        try:
+            with open(self.cache_file(key), "rb") as cache_file:
+                cached_signature, value = pickle.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"Ignoring the unreadable cache of {key[0]}: {e}")
+            return None
+        return (value,) if cached_signature == signature else None
+
+    def store(self, key, signature, value):
+        """
+        Stores the data of a key with the signature of the files it was read from.
+
+        The file is written atomically, so a launch interrupted while writing leaves the previous cache.
+        The cache being an optimization only, failing to write it is logged and ignored.
+
+        Args:
+            key (tuple): The key of the data.
+            signature (tuple): The signature of the files, taken before reading them.
+            value: The data read from the files.
+        """
+        path = self.cache_file(key)
+        temporary_path = path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temporary_path, "wb") as cache_file:
+                pickle.dump((signature, value), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, path)
+        except OSError as e:
+            logging.warning(f"Unable to write the cache of {key[0]}: {e}")
+
+    def invalidate(self, path):
+        """
+        Removes the cached data read from a file.
+
+        Args:
+            path (str): The path of the file.
+        """
+        cache_dir = self.cache_dir(path)
+        try:
+            names = os.listdir(cache_dir)
+        except FileNotFoundError:
+            return
+        for name in names:
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,92 @@
+############################################################################################################
+#  WRITE BEHIND                                                                                            #
+############################################################################################################
+import atexit
+import logging
+import queue
+import threading
+
+from settings import WRITE_BEHIND
+
+
+class WriteBehind:
+    """
+    Background writer, so that saving never makes the interactive thread wait on the disk.
+
+    Writes are queued by key, e.g. one key per tournament, and performed in order by a single thread.
+    While a key waits in the queue, its writes are coalesced: a full snapshot replaces the writes still
+    pending for the same key, so saving a tournament several times in a row writes it once. The writes
+    themselves go through temporary files and atomic renames, so an interrupted write leaves the previous
+    file. Pending writes are flushed before reading, and at exit.
+
+    Attributes:
+        pending (dict): The (function, arguments) of the writes waiting for each key, in order.
+        queue (queue.Queue): The keys having pending writes, in the order they were submitted.
+        lock (threading.Lock): Protects pending.
+        thread (threading.Thread): The writer thread, started on the first write.
+    """
+
+    def __init__(self):
+        """
+        Initializes the writer, without starting its thread.
+        """
+        self.pending = {}
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def submit(self, key, function, *args, replace=False):
+        """
+        Queues a write.
+
+        The arguments are used when the write is performed: the caller must not modify them afterwards.
+
+        Args:
+            key (tuple): The key of the written data, e.g. the file and the name of a tournament.
+            function (callable): The function performing the write.
+            *args: The arguments of the function.
+            replace (bool, optional): Whether the write supersedes the writes pending for the key,
+                as a full snapshot does. Defaults to False.
+        """
+        with self.lock:
+            writes = self.pending.get(key)
+            if writes is None:
+                writes = self.pending[key] = []
+                self.queue.put(key)
+            if replace:
+                writes.clear()
+            writes.append((function, args))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="write-behind", daemon=True)
+                self.thread.start()
+
+    def run(self):
+        """
+        Performs the queued writes, forever. Errors are logged, and do not stop the writer.
+        """
+        while True:
+            key = self.queue.get()
+            try:
+                with self.lock:
+                    writes = self.pending.pop(key)
+                for function, args in writes:
+                    try:
+                        function(*args)
+                    except Exception as e:
+                        logging.error(f"An error occurred while writing {key}: {e}")
+            finally:
+                self.queue.task_done()
+
+    def flush(self):
+        """
+        Waits until every queued write has been performed.
+        """
+        if self.thread is not None:
+            self.queue.join()
+
+
+# Shared by every repository of the process, so that the writes to a file stay ordered
+WRITER = WriteBehind() if WRITE_BEHIND else None
+
+if WRITER:
+    atexit.register(WRITER.flush)
@@ -40,7 +40,7 @@ class ReportsInputValidator:
 
         Args:
             input_function (callable): A function to get user input.
-            tournaments (dict): A dictionary containing tournament data.
+            tournaments (dict): A dictionary containing tournament headers.
 
         Returns:
             str: The valid tournament name if found; keeps prompting until valid.
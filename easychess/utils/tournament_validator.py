@@ -2,19 +2,22 @@
 #  TOURNAMENT INPUT VALIDATOR                                                                              #
 ############################################################################################################
 import re
+import unicodedata
 
 
 class TournamentInputValidator:
-    def __init__(self, utils, file_player, sanitize):
+    ROUND_RESULTS_HEADER = "echiquier,resultat"
+
+    def __init__(self, utils, repository, sanitize):
         """
         Initialize the TournamentInputValidator.
 
         :param utils: Utility functions for displaying messages and errors.
-        :param file_player: Path to the player file.
+        :param repository: The storage of players and tournaments.
         :param sanitize: An instance of the Sanitize class for text sanitization.
         """
         self.utils = utils
-        self.file_player = file_player
+        self.repository = repository
         self.sanitize = sanitize
 
     ############################################################################################################
@@ -96,6 +99,46 @@ class TournamentInputValidator:
             else:
                 return self.sanitize.sanitize_text(description)
 
+    ############################################################################################################
+    #                                             VALID PAIRING SYSTEM                                         #
+    ############################################################################################################
+    def validate_pairing_system(self, input_function):
+        """
+        Validate the choice of the pairing system.
+
+        :param input_function: Function to get user input.
+        :return: "1" (Swiss), "2" (round-robin) or False to go back.
+        """
+        while True:
+            pairing_system = input_function().strip()
+            if pairing_system in ["1", "2"]:
+                return pairing_system
+            elif pairing_system == "0":
+                return False
+            else:
+                self.utils.display_error("Veuillez choisir une option valide : 1, 2 ou 0.")
+
+    ############################################################################################################
+    #                                             VALID NUMBER OF ROUNDS                                       #
+    ############################################################################################################
+    def validate_number_of_rounds(self, input_function):
+        """
+        Validate the number of rounds of a Swiss tournament.
+
+        :param input_function: Function to get user input.
+        :return: The number of rounds, None for the automatic number, or False to go back.
+        """
+        while True:
+            number_of_rounds = input_function().strip()
+            if not number_of_rounds:
+                return None
+            elif number_of_rounds == "0":
+                return False
+            elif number_of_rounds.isdigit() and int(number_of_rounds) <= 99:
+                return int(number_of_rounds)
+            else:
+                self.utils.display_error("Veuillez saisir un nombre de rounds entre 1 et 99 !")
+
     ############################################################################################################
     #                                           VALID REGISTRATION METHOD                                      #
     ############################################################################################################
@@ -212,6 +255,65 @@ class TournamentInputValidator:
                 self.utils.display_error("Erreur de saisi ! Gagnant : Joueur1 (1) ou Joueur2 (2) ou match nul (0)")
                 return False
 
+    ############################################################################################################
+    #                                                VALID ROUND RESULTS                                       #
+    ############################################################################################################
+    def validate_round_results(self, results_input, open_boards):
+        """
+        Validate the results of a whole round, entered at once.
+
+        The input is either one code per open board, in board order, separated by spaces
+        (e.g. "1 0 2 1"), or "board,result" lines for any of the open boards. A first line
+        "échiquier,résultat" is ignored as a header, whatever its case and accents.
+        Every result is checked before any is returned, so invalid input changes nothing.
+
+        :param results_input: The entered results.
+        :param open_boards: The indexes of the matches still to be played.
+        :return: The result code of each match, by match index, or False if invalid.
+        """
+        codes = ("0", "1", "2")
+        results = {}
+        if "," in results_input:
+            lines = [line.strip() for line in results_input.splitlines() if line.strip()]
+            if lines and self.is_round_results_header(lines[0]):
+                lines = lines[1:]
+            for line in lines:
+                fields = [field.strip() for field in line.split(",")]
+                if len(fields) != 2 or not fields[0].isdigit():
+                    self.utils.display_error(f"Ligne invalide : '{line}' (échiquier,résultat attendu)")
+                    return False
+                match_index = int(fields[0]) - 1
+                if match_index not in open_boards:
+                    self.utils.display_error(f"L'échiquier {fields[0]} n'existe pas ou a déjà un résultat !")
+                    return False
+                if match_index in results:
+                    self.utils.display_error(f"L'échiquier {fields[0]} est saisi deux fois !")
+                    return False
+                results[match_index] = fields[1]
+        else:
+            entered = results_input.split()
+            if len(entered) != len(open_boards):
+                self.utils.display_error(f"{len(entered)} résultats saisis pour {len(open_boards)} échiquiers !")
+                return False
+            results = dict(zip(open_boards, entered))
+        invalid = [result for result in results.values() if result not in codes]
+        if invalid or not results:
+            self.utils.display_error("Erreur de saisi ! Gagnant : Joueur1 (1) ou Joueur2 (2) ou match nul (0)")
+            return False
+        return results
+
+    @classmethod
+    def is_round_results_header(cls, line):
+        """
+        Check whether a line is the "échiquier,résultat" header of round results, ignoring case and accents.
+
+        :param line: A line of round results.
+        :return: True if the line is the header.
+        """
+        header = ",".join(field.strip() for field in line.split(",")).casefold()
+        header = "".join(char for char in unicodedata.normalize("NFD", header) if not unicodedata.combining(char))
+        return header == cls.ROUND_RESULTS_HEADER
+
     ############################################################################################################
     #                                                VALID TOURNAMENT INDEX INPUT                              #
     ############################################################################################################
@@ -7,16 +7,31 @@ import time
 
 
 class Utils:
+    # False in batch mode: no screen clears and no pauses
+    interactive = True
+
     @staticmethod
     def clear_terminal():
         """
         Clear the terminal screen based on the operating system.
         """
+        if not Utils.interactive:
+            return
         if platform.system() == "Windows":
             os.system("cls")
         else:
             os.system("clear")
 
+    @staticmethod
+    def pause(seconds):
+        """
+        Pause so the user can read a message, in interactive mode only.
+
+        :param seconds: The duration of the pause.
+        """
+        if Utils.interactive:
+            time.sleep(seconds)
+
     def display_error(self, message):
         """
         Display an error message in a formatted manner.
@@ -27,7 +42,7 @@ class Utils:
         menu += f"⚠️  ERREUR: {message}\n"
         menu += "=" * 47 + "\n"
         print(menu)
-        time.sleep(1)
+        Utils.pause(1)
 
     def display_success(self, message):
         """
@@ -39,4 +54,4 @@ class Utils:
         menu += f"✔️  SUCCÈS: {message}\n"
         menu += "=" * 47 + "\n"
         print(menu)
-        time.sleep(1)
+        Utils.pause(1)
@@ -115,7 +115,7 @@ class ReportView:
         tournament_name = input("Veuillez saisir le Nom du tournoi : ")
         return tournament_name
 
-    def display_tournament_details(self, tournament, ranking_players):
+    def display_tournament_details(self, tournament, ranking_players, tiebreaks):
         """
         Clears the terminal and displays the details of a specific tournament.
 
@@ -123,6 +123,7 @@ class ReportView:
 
         :param tournament: A dictionary containing details of the tournament.
         :param ranking_players: A list of players with their ranking and scores.
+        :param tiebreaks: The tiebreaks of the players (Buchholz, median Buchholz, Sonneborn-Berger, cumulative).
         """
         Utils.clear_terminal()
         menu = "=" * 47 + "\n"
@@ -141,14 +142,21 @@ class ReportView:
         for player in tournament["players"]:
             menu += f"    - {player['last_name']} {player['first_name']}\n"
         menu += "  Liste des tours:\n"
+        names = {player.get("id"): f"{player['last_name']} {player['first_name']}" for player in tournament["players"]}
         for round in tournament["list_rounds"]:
             menu += f"    - {round['name']}\n"
             menu += "      Matchs:\n"
             for match in round["matches"]:
-                menu += f"        - {match[0][0]} vs {match[1][0]} - Score: {match[0][1]}-{match[1][1]}\n"
-        menu += "  Classement des joueurs:\n"
-        for player in ranking_players:
-            menu += f"    - {player['last_name']} {player['first_name']} -  Score: {player['score']}\n"
+                player1 = names.get(match[0][0], match[0][0])
+                player2 = names.get(match[1][0], match[1][0])
+                menu += f"        - {player1} vs {player2} - Score: {match[0][1]}-{match[1][1]}\n"
+        menu += "  Classement des joueurs (départages : Buchholz, Buchholz médian, Sonneborn-Berger, cumulatif):\n"
+        for rank, player in enumerate(ranking_players, start=1):
+            departages = " / ".join(f"{value:g}" for value in tiebreaks.values(player["id"]))
+            menu += (
+                f"    {rank}. {player['last_name']} {player['first_name']} -  Score: {player['score']}"
+                f" - Départages: {departages}\n"
+            )
 
         menu += f"  Description: {tournament['description']}\n"
         print(menu)
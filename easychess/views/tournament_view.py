@@ -86,6 +86,46 @@ class TournamentView:
         description = input("Entrez une description du tournoi : ")
         return description
 
+    def ask_pairing_system(self):
+        """
+        Prompts the user to choose the pairing system of the tournament.
+
+        :return: The selected pairing system as a string.
+        """
+        Utils.clear_terminal()
+        menu = "=" * 47 + "\n"
+        menu += "         ♛ ♚ ♜ ♝ ♞ ♟ ♔ ♕ ♖ ♗ ♘ ♙ \n"
+        menu += "                 EASYCHESS \n"
+        menu += "=" * 47 + "\n"
+        menu += "╔═════════════════════════════════════════════╗\n"
+        menu += "║               MENU TOURNOIS                 ║\n"
+        menu += "╚═════════════════════════════════════════════╝\n"
+        menu += "0. Revenir au menu tournois\n"
+        menu += "1. Système suisse\n"
+        menu += "2. Toutes rondes (tables de Berger)\n"
+        print(menu)
+        pairing_system = input("Choisissez le système d'appariement (0, 1 ou 2) : ")
+        return pairing_system
+
+    def ask_number_of_rounds(self):
+        """
+        Prompts the user to enter the number of rounds of a Swiss tournament.
+
+        :return: The number of rounds as a string, empty for the automatic number.
+        """
+        Utils.clear_terminal()
+        menu = "=" * 47 + "\n"
+        menu += "         ♛ ♚ ♜ ♝ ♞ ♟ ♔ ♕ ♖ ♗ ♘ ♙ \n"
+        menu += "                 EASYCHESS \n"
+        menu += "=" * 47 + "\n"
+        menu += "╔═════════════════════════════════════════════╗\n"
+        menu += "║               MENU TOURNOIS                 ║\n"
+        menu += "╚═════════════════════════════════════════════╝\n"
+        menu += "0. Revenir au menu tournois\n"
+        print(menu)
+        number_of_rounds = input("Entrez le nombre de rounds (Entrée pour le calculer selon le nombre de joueurs) : ")
+        return number_of_rounds
+
     def ask_add_another_player(self):
         """
         Asks the user if they want to add another player to the tournament.
@@ -193,7 +233,7 @@ class TournamentView:
         go_menu = input("Voulez vous revenir au menu tournoi ? '0' ")
         return go_menu
 
-    def ask_validate_match(self, match, match_index):
+    def ask_validate_match(self, match, match_index, player1, player2):
         """
         Asks the user to validate the winner of a match.
 
@@ -201,19 +241,60 @@ class TournamentView:
 
         :param match: The match for which to validate the winner.
         :param match_index: The index of the match.
+        :param player1: The first player of the match.
+        :param player2: The second player of the match.
         :return: The user's choice (1, 2, or 0).
         """
         menu = "=" * 47 + "\n"
-        menu += f"Match {match_index + 1}. {match}\n"
+        menu += f"Match {match_index + 1}.\n"
+        menu += f"{player1['first_name']} {player1['last_name']}\n"
+        menu += f"Score: {match.score1:>2} - {match.score2:<2}\n"
+        menu += f"{player2['first_name']} {player2['last_name']}\n"
         menu += "=" * 47 + "\n"
-        menu += f"1. {match.player1['first_name']} {match.player1['last_name']} (Joueur 1)\n"
-        menu += f"2. {match.player2['first_name']} {match.player2['last_name']} (Joueur 2)\n"
+        menu += f"1. {player1['first_name']} {player1['last_name']} (Joueur 1)\n"
+        menu += f"2. {player2['first_name']} {player2['last_name']} (Joueur 2)\n"
         menu += "0. Match nul\n"
         menu += "=" * 47 + "\n"
         print(menu)
         user_input = input("Entrez le numéro du gagnant (1, 2 ou 0) : ")
         return user_input
 
+    def ask_round_results(self, round, open_boards, players_by_id):
+        """
+        Displays the boards still to be played and asks for their results in a single entry.
+
+        The results are either one code per board on a single line (e.g. "1 0 2 1"),
+        or, after typing 'csv', a pasted sheet of "board,result" lines ended by an empty line.
+
+        :param round: The round being played.
+        :param open_boards: The indexes of the matches still to be played.
+        :param players_by_id: The players of the tournament, by id.
+        :return: The entered results as a string, empty for match by match entry.
+        """
+        menu = "=" * 47 + "\n"
+        for match_index in open_boards:
+            match = round.matches[match_index]
+            player1 = players_by_id[match.player1_id]
+            player2 = players_by_id[match.player2_id]
+            menu += (
+                f"{match_index + 1:>4}. {player1['first_name']} {player1['last_name']} - "
+                f"{player2['first_name']} {player2['last_name']}\n"
+            )
+        menu += "=" * 47 + "\n"
+        menu += "Résultats : 1 (joueur 1 gagne), 2 (joueur 2 gagne), 0 (match nul)\n"
+        menu += "Saisissez un résultat par échiquier dans l'ordre (ex : 1 0 2 ...),\n"
+        menu += "'csv' pour coller une feuille échiquier,résultat, ou Entrée pour saisir match par match.\n"
+        print(menu)
+        results_input = input("Résultats du round : ").strip()
+        if results_input.lower() != "csv":
+            return results_input
+        lines = []
+        while True:
+            line = input().strip()
+            if not line:
+                return "\n".join(lines)
+            lines.append(line)
+
     def display(self, round, current_round):
         """
         Clears the terminal and displays the details of the current tournament round.
@@ -260,7 +341,7 @@ class TournamentView:
             menu += f"  Date de fin: {tournament[1]['end_date']}\n"
             menu += f"  Nombre de tours: {tournament[1]['number_of_rounds']}\n"
             menu += f"  Tour actuel: {tournament[1]['current_round']}\n"
-            menu += f"  Joueurs: {len(tournament[1]['players'])}\n"
+            menu += f"  Joueurs: {tournament[1]['number_of_players']}\n"
             menu += "=" * 47 + "\n"
         print(menu)
 
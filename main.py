@@ -1,11 +1,64 @@
+import argparse
 import sys
+from easychess.controllers.batch_controller import BatchManagerController
 from easychess.controllers.main_controller import run
+from easychess.storage.repository import get_repository
+from easychess.storage.write_behind import WRITER
+
+
+def parse_args():
+    """
+    Parses the command line options.
+
+    Returns:
+        argparse.Namespace: The options, with 'batch' set to the results script to run, if any,
+        'migrate' set to upgrade at once the tournaments stored in an older format, and 'import_json'
+        set to copy the JSON data files into the SQLite database.
+    """
+    parser = argparse.ArgumentParser(description="EasyChess, gestion de tournois d'échecs.")
+    parser.add_argument(
+        "--batch",
+        metavar="FICHIER",
+        help="joue les tournois d'un script de résultats sans interaction ('-' pour l'entrée standard)",
+    )
+    parser.add_argument(
+        "--migrer",
+        dest="migrate",
+        action="store_true",
+        help="réécrit en une fois les tournois enregistrés dans un ancien format (sinon migrés à la lecture)",
+    )
+    parser.add_argument(
+        "--importer-json",
+        dest="import_json",
+        action="store_true",
+        help="copie les joueurs et les tournois des fichiers JSON dans la base SQLite (settings.DATABASE_FILE)",
+    )
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
+    args = parse_args()
     try:
-        run()
+        if args.migrate:
+            print(f"{get_repository().migrate()} tournoi(s) migré(s)")
+        elif args.import_json:
+            number_of_players, number_of_tournaments = get_repository("sqlite").import_json(get_repository("json"))
+            print(f"{number_of_players} joueur(s) et {number_of_tournaments} tournoi(s) importé(s)")
+        elif args.batch == "-":
+            BatchManagerController().run(sys.stdin)
+        elif args.batch:
+            with open(args.batch, "r", encoding="utf-8") as script:
+                BatchManagerController().run(script)
+        else:
+            run()
     except KeyboardInterrupt:
         print("Arrêt du script...")
         sys.exit(0)
     except Exception as e:
         print(f"Erreur : {e}")
+        if args.batch:
+            sys.exit(1)
+    finally:
+        # Les enregistrements encore en attente sont écrits avant de quitter
+        if WRITER:
+            WRITER.flush()
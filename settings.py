@@ -6,3 +6,14 @@ print(BASE_DIR)
 
 PLAYERS_FILE = BASE_DIR / "easychess" / "datas" / "data_players.json"
 TOURNAMENTS_FILE = BASE_DIR / "easychess" / "datas" / "data_tournament.json"
+
+# Backend de stockage : "json" (fichiers ci-dessus) ou "sqlite" (base DATABASE_FILE)
+STORAGE_BACKEND = "json"
+DATABASE_FILE = BASE_DIR / "easychess" / "datas" / "easychess.sqlite3"
+
+# Cache sur disque des données lues, réutilisé d'un lancement à l'autre tant que les fichiers sont inchangés
+WARM_CACHE = True
+
+# Enregistrement des tournois et des classements en arrière-plan, sans faire attendre la saisie
+# (les résultats des matchs restent enregistrés immédiatement)
+WRITE_BEHIND = True
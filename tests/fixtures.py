@@ -0,0 +1,106 @@
+"""
+Small players and tournaments shared by the tests.
+"""
+from datetime import datetime, timedelta
+import json
+import os
+
+from easychess.models.match import Match
+from easychess.models.round import Round
+from easychess.models.tournament import Tournament
+
+START_DATE = datetime(2024, 1, 6, 14)
+
+
+def make_player(player_id, national_id=None, **fields):
+    """
+    Builds a roster player.
+
+    Args:
+        player_id (int): The id of the player.
+        national_id (str, optional): The national ID of the player. Defaults to None.
+        **fields: Other fields, e.g. rating or score.
+
+    Returns:
+        dict: The player dictionary.
+    """
+    player = {
+        "id": player_id,
+        "last_name": f"Joueur{player_id}",
+        "first_name": "Alex",
+        "birthdate": "01/01/1990",
+        "national_id": national_id,
+    }
+    player.update(fields)
+    return player
+
+
+def make_roster(number_of_players):
+    """
+    Builds a roster of players with ids 1 to number_of_players and distinct national IDs.
+
+    Args:
+        number_of_players (int): The number of players.
+
+    Returns:
+        list: The player dictionaries.
+    """
+    return [make_player(player_id, f"AB{player_id:05d}") for player_id in range(1, number_of_players + 1)]
+
+
+def make_tournament(name, players, rounds, status=None, number_of_rounds=None):
+    """
+    Builds the data of a tournament from its results.
+
+    Args:
+        name (str): The name of the tournament.
+        players (list): The player dictionaries of the tournament.
+        rounds (list): For each round, its (player 1 id, player 2 id, score of player 1) matches, the score
+            being None if the match has not been played.
+        status (bool, optional): The status of the tournament. Defaults to None (in progress).
+        number_of_rounds (int, optional): The number of rounds. Defaults to the number of rounds given.
+
+    Returns:
+        dict: The tournament data, as saved by the application.
+    """
+    tournament = Tournament(
+        name,
+        "Paris",
+        f"Tournoi de test {name}",
+        start_date=START_DATE,
+        number_of_rounds=number_of_rounds or len(rounds),
+        players=[dict(player, score=0) for player in players],
+        status=status,
+    )
+    for round_index, results in enumerate(rounds):
+        round_ = Round(f"Round {round_index + 1}", START_DATE + timedelta(hours=3 * round_index), None)
+        for player1_id, player2_id, score1 in results:
+            match = Match(player1_id, player2_id)
+            tournament.record_match(match)
+            if score1 is not None:
+                match.set_score(score1, 1 - score1)
+                tournament.add_points(player1_id, score1)
+                tournament.add_points(player2_id, 1 - score1)
+            round_.add_match(match)
+        if all(score1 is not None for _, _, score1 in results):
+            round_.end_date_time = round_.start_date_time + timedelta(hours=2)
+            tournament.current_round += 1
+        tournament.list_rounds.append(round_)
+    return tournament.as_dict()
+
+
+def write_players(directory, players):
+    """
+    Writes a roster to the players file of a data directory.
+
+    Args:
+        directory (str): The data directory.
+        players (list): The player dictionaries.
+
+    Returns:
+        str: The path to the players file.
+    """
+    players_file = os.path.join(directory, "data_players.json")
+    with open(players_file, "w") as json_file:
+        json.dump(players, json_file)
+    return players_file
@@ -0,0 +1,89 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from easychess.controllers.batch_controller import BatchManagerController
+from easychess.models.tournament import Tournament
+from easychess.storage.json_repository import JsonRepository
+from easychess.utils.utils import Utils
+from tests.fixtures import make_roster, write_players
+
+
+class BatchManagerControllerTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.batch = BatchManagerController()
+        self.batch.repository = JsonRepository(
+            write_players(self.directory.name, make_roster(6)),
+            os.path.join(self.directory.name, "data_tournament.json"),
+        )
+        self.batch.tournament_controller.repository = self.batch.repository
+        self.output = io.StringIO()
+
+    def tearDown(self):
+        Utils.interactive = True
+        self.batch.repository.flush()
+        self.directory.cleanup()
+
+    def run_script(self, script):
+        with contextlib.redirect_stdout(self.output):
+            return self.batch.run(script.splitlines())
+
+    def create_tournament(self, players="1 2 3 4 5"):
+        infos = {"name": "Open", "location": "", "description": "", "pairing_system": Tournament.SWISS}
+        with contextlib.redirect_stdout(self.output):
+            return self.batch.create_tournament(infos, players)
+
+    def test_script_plays_and_finishes_the_tournament(self):
+        (tournament,) = self.run_script(
+            "tournoi: Open\nrounds: 2\njoueurs: 1 2 3 4 5 6\nround: 1 0 2\n"
+            "round:\npartie: 4 1 2\npartie: 2 3 0\npartie: 6 5 1\n"
+        )
+        self.assertTrue(tournament.status)
+        self.assertEqual(tournament.current_round, 2)
+        self.assertEqual(sum(player["score"] for player in tournament.players), 6)
+        self.assertIn("Fin du tournoi !", self.output.getvalue())
+        self.assertTrue(self.batch.repository.find_tournament("Open")["status"])
+
+    def test_invalid_results_change_nothing(self):
+        tournament = self.create_tournament()
+        for results in (["1"], ["1", "0", "2"], ["1", "3"]):
+            with self.assertRaises(ValueError):
+                self.batch.play_results(tournament, results)
+            self.assertEqual(tournament.list_rounds[0].matches, [])
+            self.assertEqual(tournament.byes, set())
+            self.assertEqual({player["score"] for player in tournament.players}, {0})
+        with contextlib.redirect_stdout(self.output):
+            self.batch.play_results(tournament, ["1", "2"])
+        self.assertEqual(len(tournament.list_rounds[0].matches), 2)
+        self.assertEqual(len(tournament.byes), 1)
+        self.assertEqual(tournament.current_round, 1)
+
+    def test_pairing_must_seat_every_player_once(self):
+        tournament = self.create_tournament()
+        for games, bye in (
+            ([(1, 2, "1"), (3, 4, "0")], None),
+            ([(1, 2, "1"), (3, 1, "0")], 5),
+            ([(1, 2, "1"), (3, 4, "0")], 6),
+            ([(1, 2, "1"), (3, 4, "5")], 5),
+        ):
+            with self.assertRaises(ValueError):
+                self.batch.play_pairing(tournament, games, bye)
+            self.assertEqual(tournament.list_rounds[0].matches, [])
+            self.assertEqual(tournament.byes, set())
+        with contextlib.redirect_stdout(self.output):
+            self.batch.play_pairing(tournament, [(1, 2, "1"), (3, 4, "0")], 5)
+        self.assertEqual(tournament.byes, {5})
+        self.assertEqual(tournament.current_round, 1)
+
+    def test_invalid_line_is_reported_with_its_number(self):
+        with self.assertRaisesRegex(ValueError, "Ligne 6 : joueur 3 ni apparié ni exempt"):
+            self.run_script(
+                "tournoi: Open\njoueurs: 1 2 3 4 5\nround:\npartie: 1 2 1\npartie: 4 5 0\nround: 1 0\n"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
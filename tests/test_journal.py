@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+
+from easychess.storage.journal import Journal
+
+
+class JournalTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.journal = Journal(os.path.join(self.directory.name, "journal.jsonl"))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def tear_last_append(self):
+        # Leaves a partial line, as an append interrupted by a crash
+        with open(self.journal.path, "a", encoding="utf-8") as journal_file:
+            journal_file.write('{"id": 2, "na')
+
+    def test_read_returns_records_in_append_order(self):
+        for record_id in range(3):
+            self.journal.append({"id": record_id})
+        self.assertEqual(self.journal.read(), [{"id": 0}, {"id": 1}, {"id": 2}])
+        self.assertEqual(self.journal.last(), {"id": 2})
+
+    def test_missing_journal_is_empty(self):
+        self.assertEqual(self.journal.read(), [])
+        self.assertIsNone(self.journal.last())
+        self.assertEqual(self.journal.size(), 0)
+
+    def test_partial_last_line_is_ignored(self):
+        self.journal.append({"id": 1})
+        self.tear_last_append()
+        self.assertEqual(self.journal.read(), [{"id": 1}])
+        self.assertEqual(self.journal.last(), {"id": 1})
+
+    def test_appends_after_partial_line_are_read(self):
+        self.journal.append({"id": 1})
+        self.tear_last_append()
+        self.journal.append({"id": 3})
+        self.journal.append({"id": 4})
+        self.assertEqual(self.journal.read(), [{"id": 1}, {"id": 3}, {"id": 4}])
+        self.assertEqual(self.journal.last(), {"id": 4})
+
+    def test_clear_deletes_the_journal(self):
+        self.journal.append({"id": 1})
+        self.journal.clear()
+        self.assertEqual(self.journal.read(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+
+from easychess.storage.json_repository import JsonRepository
+from easychess.storage.tournament_store import RevisionConflictError, TournamentStore
+from tests.fixtures import make_roster, make_tournament, write_players
+
+
+class JsonRepositoryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.roster = make_roster(8)
+        self.tournament_data = make_tournament(
+            "Open",
+            self.roster,
+            [[(1, 2, 1), (3, 4, 0.5), (5, 6, 0), (7, 8, 1)], [(1, 3, None), (2, 4, None), (5, 7, 1), (6, 8, None)]],
+            number_of_rounds=3,
+        )
+        self.repository = JsonRepository(
+            write_players(self.directory.name, self.roster), os.path.join(self.directory.name, "data_tournament.json")
+        )
+
+    def tearDown(self):
+        self.repository.flush()
+        self.directory.cleanup()
+
+    def unplayed_match(self, tournament_data):
+        round_index = len(tournament_data["list_rounds"]) - 1
+        matches = tournament_data["list_rounds"][round_index]["matches"]
+        for match_index, ((_, score1), (_, score2)) in enumerate(matches):
+            if not score1 + score2:
+                return round_index, match_index
+        self.fail("every match is played")
+
+    def test_match_result_is_checkpointed_on_top_of_the_pending_snapshot(self):
+        self.repository.save_tournament(self.tournament_data)
+        round_index, match_index = self.unplayed_match(self.tournament_data)
+        TournamentStore.apply_match_result(self.tournament_data, round_index, match_index, 1, 0)
+        self.repository.save_match(self.tournament_data, round_index, match_index)
+        journal = TournamentStore.checkpoint_journal(self.repository.tournaments_file, self.tournament_data["name"])
+        self.assertEqual(
+            journal.read(), [{"round": round_index, "match": match_index, "score1": 1, "score2": 0, "revision": 1}]
+        )
+        stored = self.repository.find_tournament(self.tournament_data["name"])
+        self.assertEqual(stored["list_rounds"][round_index]["matches"][match_index][0][1], 1)
+
+    def test_match_results_are_kept_by_the_next_snapshot(self):
+        self.repository.save_tournament(self.tournament_data)
+        round_index, match_index = self.unplayed_match(self.tournament_data)
+        TournamentStore.apply_match_result(self.tournament_data, round_index, match_index, 0.5, 0.5)
+        self.repository.save_matches(self.tournament_data, round_index, [match_index])
+        self.repository.save_tournament(self.repository.find_tournament(self.tournament_data["name"]))
+        self.repository.flush()
+        journal = TournamentStore.checkpoint_journal(self.repository.tournaments_file, self.tournament_data["name"])
+        self.assertEqual(journal.read(), [])
+        stored = self.repository.find_tournament(self.tournament_data["name"])
+        self.assertEqual(stored["list_rounds"][round_index]["matches"][match_index][1][1], 0.5)
+
+    def test_checkpoints_of_another_revision_are_dropped(self):
+        self.repository.save_tournament(self.tournament_data)
+        self.repository.flush()
+        round_index, match_index = self.unplayed_match(self.tournament_data)
+        # Left over by an earlier tournament of the same name, with other pairings
+        os.makedirs(TournamentStore.checkpoints_dir(self.repository.tournaments_file))
+        journal = TournamentStore.checkpoint_journal(self.repository.tournaments_file, self.tournament_data["name"])
+        journal.append({"round": round_index, "match": match_index, "score1": 1, "score2": 0, "revision": 0})
+        stored = self.repository.find_tournament(self.tournament_data["name"])
+        self.assertEqual(stored["list_rounds"][round_index]["matches"][match_index], [[1, 0], [3, 0]])
+        self.repository.save_tournament(stored)
+        self.repository.check_tournament_saved(self.tournament_data["name"])
+        stored = self.repository.find_tournament(self.tournament_data["name"])
+        self.assertEqual(stored["revision"], 2)
+        self.assertEqual(stored["list_rounds"][round_index]["matches"][match_index], [[1, 0], [3, 0]])
+        self.assertEqual(journal.read(), [])
+
+    def test_saving_over_a_revision_of_another_process_is_reported(self):
+        self.repository.save_tournament(self.tournament_data)
+        stale = self.repository.find_tournament(self.tournament_data["name"])
+        self.repository.save_tournament(self.repository.find_tournament(self.tournament_data["name"]))
+        self.repository.check_tournament_saved(self.tournament_data["name"])
+        # The second save now looks like another process's
+        TournamentStore.saved_revisions.pop((self.repository.tournaments_file, self.tournament_data["name"]))
+        with self.assertLogs(level="ERROR"), self.assertRaises(RevisionConflictError):
+            self.repository.save_tournament(stale)
+            self.repository.check_tournament_saved(self.tournament_data["name"])
+        self.assertEqual(self.repository.find_tournament(self.tournament_data["name"])["revision"], 2)
+
+    def test_failed_save_is_reported(self):
+        # A file in place of the shards directory: the shard cannot be written
+        with open(TournamentStore.shards_dir(self.repository.tournaments_file), "w"):
+            pass
+        with self.assertLogs(level="ERROR"), self.assertRaises(OSError):
+            self.repository.save_tournament(self.tournament_data)
+            self.repository.check_tournament_saved(self.tournament_data["name"])
+        self.assertIsNone(self.repository.find_tournament(self.tournament_data["name"]))
+
+    def test_tournaments_are_found_by_status(self):
+        finished = make_tournament("Blitz", self.roster[:4], [[(1, 2, 1), (3, 4, 0)]], status=True)
+        self.repository.save_tournament(self.tournament_data)
+        self.repository.save_tournament(finished)
+        self.assertEqual(
+            [header["name"] for header in self.repository.find_tournaments_by_status(None).values()],
+            [self.tournament_data["name"]],
+        )
+        self.assertEqual(
+            [header["name"] for header in self.repository.find_tournaments_by_status(True).values()],
+            [finished["name"]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
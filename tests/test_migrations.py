@@ -0,0 +1,118 @@
+import json
+import os
+import tempfile
+import unittest
+
+from easychess.storage.migrations import MigrationRegistry
+from easychess.storage.tournament_store import TOURNAMENT_MIGRATIONS, TournamentStore
+from tests.fixtures import make_roster
+
+
+def legacy_tournament():
+    """A tournament saved before player ids, byes and pairing systems existed (version 1)."""
+    return {
+        "name": "Open 2023",
+        "location": "Lyon",
+        "description": "Open historique",
+        "start_date": "07/01/2023 14:00",
+        "end_date": "07/01/2023 18:00",
+        "number_of_rounds": 1,
+        "current_round": 1,
+        "status": True,
+        "players": [
+            {"last_name": "Martin", "first_name": "Alice", "birthdate": "01/02/1990", "national_id": None, "score": 1},
+            {"last_name": "Durand", "first_name": "Bruno", "birthdate": "03/04/1985", "national_id": None, "score": 0},
+        ],
+        "list_rounds": [
+            {
+                "name": "Round 1",
+                "start_date_time": "07/01/2023 14:00",
+                "end_date_time": "07/01/2023 16:00",
+                "matches": [[["Martin Alice", 1], ["Durand Bruno", 0]]],
+            }
+        ],
+    }
+
+
+class MigrationRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = MigrationRegistry(3)
+
+        @self.registry.register(1)
+        def add_location(record):
+            return dict(record, location="")
+
+        @self.registry.register(2)
+        def rename_title(record):
+            record = dict(record, name=record["title"])
+            del record["title"]
+            return record
+
+    def test_records_without_version_are_upgraded_in_turn(self):
+        self.assertFalse(self.registry.is_current({"title": "Open"}))
+        self.assertEqual(self.registry.upgrade({"title": "Open"}), {"name": "Open", "location": "", "version": 3})
+
+    def test_current_records_are_unchanged(self):
+        record = {"name": "Open", "version": 3}
+        self.assertTrue(self.registry.is_current(record))
+        self.assertEqual(self.registry.upgrade(record), record)
+
+    def test_unknown_or_unreachable_versions_raise(self):
+        with self.assertRaises(ValueError):
+            self.registry.upgrade({"version": 4})
+        with self.assertRaises(ValueError):
+            MigrationRegistry(2).upgrade({})
+        with self.assertRaises(ValueError):
+            self.registry.register(1)(lambda record: record)
+
+
+class TournamentMigrationTest(unittest.TestCase):
+    def test_legacy_tournament_is_normalized_with_local_ids(self):
+        record = TOURNAMENT_MIGRATIONS.upgrade(legacy_tournament(), {})
+        self.assertEqual(record["version"], TournamentStore.FORMAT_VERSION)
+        self.assertEqual(record["pairing_system"], "swiss")
+        self.assertEqual([player["id"] for player in record["players"]], [1, 2])
+        self.assertEqual(record["list_rounds"][0]["matches"], [[1, 2, 1]])
+        self.assertIsNone(record["list_rounds"][0]["bye"])
+
+    def test_legacy_file_is_split_into_shards_and_upgraded_on_read(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "data_tournament.json")
+            with open(file_path, "w") as json_file:
+                json.dump({"tournament1": legacy_tournament()}, json_file)
+            tournaments = TournamentStore.read(file_path, {})
+            self.assertEqual(list(tournaments), ["tournament1"])
+            tournament_data = tournaments["tournament1"]
+            self.assertEqual(tournament_data["revision"], 0)
+            self.assertEqual(tournament_data["list_rounds"][0]["matches"], [[[1, 1], [2, 0]]])
+            self.assertEqual([player["last_name"] for player in tournament_data["players"]], ["Martin", "Durand"])
+            self.assertEqual(TournamentStore.read_headers(file_path)["tournament1"]["number_of_players"], 2)
+            with open(TournamentStore.shard_path(file_path, "tournament1")) as shard_file:
+                self.assertEqual(json.load(shard_file)["version"], TournamentStore.FORMAT_VERSION)
+            self.assertEqual(TournamentStore.migrate(file_path, {}), 0)
+
+    def test_roster_players_are_stored_by_reference(self):
+        roster = {player["id"]: player for player in make_roster(2)}
+        record = legacy_tournament()
+        for player, roster_player in zip(record["players"], roster.values()):
+            player.update(roster_player)
+        record["list_rounds"][0]["matches"] = [[["Joueur1 Alex", 0.5], ["Joueur2 Alex", 0.5]]]
+        record = TOURNAMENT_MIGRATIONS.upgrade(record, roster)
+        self.assertEqual(record["players"], [[1, 1], [2, 0]])
+        self.assertEqual(record["list_rounds"][0]["matches"], [[1, 2, 0.5]])
+
+    def test_migrate_upgrades_every_outdated_shard_at_once(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "data_tournament.json")
+            with open(file_path, "w") as json_file:
+                json.dump({"tournament1": legacy_tournament(), "tournament2": legacy_tournament()}, json_file)
+            TournamentStore.read_headers(file_path)
+            self.assertEqual(TournamentStore.read_shard(file_path, "tournament2").get("version"), None)
+            self.assertEqual(TournamentStore.migrate(file_path, {}), 2)
+            for key in ("tournament1", "tournament2"):
+                self.assertTrue(TOURNAMENT_MIGRATIONS.is_current(TournamentStore.read_shard(file_path, key)))
+            self.assertEqual(TournamentStore.migrate(file_path, {}), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
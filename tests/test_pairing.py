@@ -0,0 +1,63 @@
+import random
+import unittest
+
+from easychess.models.match import Match
+from easychess.models.tournament import Tournament
+from easychess.pairing.swiss_pairing import SwissPairing
+
+
+def new_tournament(number_of_players):
+    players = [{"id": player_id, "score": 0} for player_id in range(1, number_of_players + 1)]
+    return Tournament("Open", "Paris", "Open de test", players=players)
+
+
+def play(tournament, pairs, bye, rng):
+    for white_id, black_id in pairs:
+        match = Match(white_id, black_id)
+        tournament.record_match(match)
+        score = rng.choice((0, 0.5, 1))
+        tournament.add_points(white_id, score)
+        tournament.add_points(black_id, 1 - score)
+    if bye is not None:
+        tournament.byes.add(bye)
+        tournament.add_points(bye, 0.5)
+
+
+class SwissPairingTest(unittest.TestCase):
+    def test_first_round_pairs_top_half_against_bottom_half(self):
+        pairs, bye = SwissPairing(new_tournament(8)).pair_round()
+        self.assertIsNone(bye)
+        self.assertEqual([set(pair) for pair in pairs], [{1, 5}, {2, 6}, {3, 7}, {4, 8}])
+
+    def test_rounds_have_no_rematches_and_distinct_byes(self):
+        for number_of_players in (6, 9, 12, 15, 20):
+            rng = random.Random(number_of_players)
+            tournament = new_tournament(number_of_players)
+            met = set()
+            for _ in range(SwissPairing.round_count(number_of_players)):
+                pairing = SwissPairing(tournament)
+                pairs, bye = pairing.pair_round()
+                seated = [player_id for pair in pairs for player_id in pair] + ([bye] if bye is not None else [])
+                self.assertEqual(sorted(seated), list(range(1, number_of_players + 1)))
+                self.assertEqual(bye is None, number_of_players % 2 == 0)
+                self.assertNotIn(bye, tournament.byes)
+                self.assertEqual(pairing.rematches, 0)
+                for pair in pairs:
+                    self.assertNotIn(frozenset(pair), met)
+                    met.add(frozenset(pair))
+                play(tournament, pairs, bye, rng)
+
+    def test_colours_alternate_when_possible(self):
+        tournament = new_tournament(8)
+        rng = random.Random(0)
+        for _ in range(4):
+            pairs, bye = SwissPairing(tournament).pair_round()
+            play(tournament, pairs, bye, rng)
+        for colours in tournament.colours.values():
+            self.assertNotIn("WWW", colours)
+            self.assertNotIn("BBB", colours)
+            self.assertLessEqual(abs(colours.count("W") - colours.count("B")), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+import tempfile
+import unittest
+
+from easychess.models.player import Player
+
+
+def player_data(last_name):
+    return {"last_name": last_name, "first_name": "Alice", "birthdate": "01/02/1990", "national_id": None}
+
+
+def register(players_file, last_names):
+    return [Player.save(players_file, player_data(last_name)) for last_name in last_names]
+
+
+class PlayerStorageTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.players_file = os.path.join(self.directory.name, "data_players.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_saved_players_receive_consecutive_ids(self):
+        ids = [Player.save(self.players_file, player_data(name)) for name in ("Martin", "Durand", "Petit")]
+        self.assertEqual(ids, [1, 2, 3])
+        self.assertEqual([player["id"] for player in Player.read(self.players_file)], [1, 2, 3])
+
+    def test_players_registered_after_a_torn_append_are_kept(self):
+        Player.save(self.players_file, player_data("Martin"))
+        with open(Player.journal(self.players_file).path, "a", encoding="utf-8") as journal_file:
+            journal_file.write('{"last_name": "Dur')
+        ids = [Player.save(self.players_file, player_data(name)) for name in ("Petit", "Leroy")]
+        players = Player.read(self.players_file)
+        self.assertEqual([player["last_name"] for player in players], ["Martin", "Petit", "Leroy"])
+        self.assertEqual([player["id"] for player in players], [1] + ids)
+
+    def test_compaction_keeps_the_roster(self):
+        for name in ("Martin", "Durand"):
+            Player.save(self.players_file, player_data(name))
+        Player.compact(self.players_file)
+        self.assertEqual(Player.journal(self.players_file).size(), 0)
+        self.assertEqual([player["id"] for player in Player.read(self.players_file)], [1, 2])
+        self.assertEqual(Player.save(self.players_file, player_data("Petit")), 3)
+
+    def test_concurrent_registrations_receive_distinct_ids(self):
+        batches = [[f"Joueur{process}-{index}" for index in range(30)] for process in range(4)]
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            results = executor.map(register, [self.players_file] * len(batches), batches)
+            ids = [player_id for result in results for player_id in result]
+        self.assertEqual(sorted(ids), list(range(1, 121)))
+        self.assertEqual(sorted(player["id"] for player in Player.read(self.players_file)), list(range(1, 121)))
+
+    def test_rating_changes_are_added_to_the_saved_ratings(self):
+        register(self.players_file, ["Martin", "Durand"])
+        Player.save_ratings(self.players_file, {1: (12.5, 3), 2: (-12.5, 3)})
+        register(self.players_file, ["Petit"])
+        Player.save_ratings(self.players_file, {1: (-4.0, 2), 3: (8.0, 2)})
+        self.assertEqual(
+            [(player["rating"], player["rated_games"]) for player in Player.read(self.players_file)],
+            [(1508.5, 5), (1487.5, 3), (1508.0, 2)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import copy
+import os
+import tempfile
+import unittest
+
+from easychess.storage.read_cache import ReadCache
+
+
+class ReadCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "data.json")
+        self.write("[1, 2]")
+        self.cache = ReadCache()
+        self.loads = 0
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, content, mtime_ns=None):
+        with open(self.path, "w") as data_file:
+            data_file.write(content)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def load(self):
+        self.loads += 1
+        with open(self.path) as data_file:
+            return [int(value) for value in data_file.read().strip("[]").split(",")]
+
+    def get(self, **options):
+        return self.cache.get((self.path, "data"), [self.path], self.load, **options)
+
+    def test_unchanged_file_is_read_once(self):
+        self.assertEqual(self.get(), [1, 2])
+        self.assertEqual(self.get(), [1, 2])
+        self.assertEqual(self.loads, 1)
+        self.assertEqual(self.cache.stats(), {"hits": 1, "warm_hits": 0, "misses": 1, "entries": 1})
+
+    def test_changed_file_is_read_again(self):
+        self.write("[1, 2]", mtime_ns=1_000_000_000)
+        self.get()
+        self.write("[3, 4]", mtime_ns=2_000_000_000)
+        self.assertEqual(self.get(), [3, 4])
+        # Same size and timestamp: only an explicit invalidation shows the change
+        self.write("[5, 6]", mtime_ns=2_000_000_000)
+        self.assertEqual(self.get(), [3, 4])
+        self.cache.invalidate(self.path)
+        self.assertEqual(self.get(), [5, 6])
+        self.assertEqual(self.loads, 3)
+
+    def test_copies_can_be_modified(self):
+        value = self.get(copy=copy.deepcopy)
+        value.append(3)
+        self.assertEqual(self.get(copy=copy.deepcopy), [1, 2])
+
+    def test_missing_files_have_a_signature(self):
+        missing = os.path.join(self.directory.name, "missing.json")
+        self.assertEqual(ReadCache.signature([missing]), ((missing, None),))
+        self.assertEqual(self.cache.get((missing,), [missing], dict), {})
+        self.assertEqual(self.cache.get((missing,), [missing], dict), {})
+        self.assertEqual(self.cache.hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import json
+import unittest
+
+from easychess.models.results_matrix import ResultsMatrix
+from easychess.models.tiebreaks import Tiebreaks
+from easychess.models.tournament import Tournament
+from tests.fixtures import make_roster, make_tournament
+
+
+def saved(data):
+    """The data as read back from the JSON files: match tuples become lists."""
+    return json.loads(json.dumps(data))
+
+
+def tournament_with_byes():
+    players = make_roster(5)
+    data = make_tournament("Open", players, [[(1, 2, 1), (3, 4, 0.5)], [(5, 1, 0), (2, 3, None)]])
+    data["list_rounds"][0]["bye"] = 5
+    data["list_rounds"][1]["bye"] = 4
+    for player_id, points in ((5, 0.5), (4, 0.5)):
+        data["players"][player_id - 1]["score"] += points
+    return data
+
+
+class ResultsMatrixTest(unittest.TestCase):
+    def setUp(self):
+        self.data = tournament_with_byes()
+        self.tournament = Tournament.from_dict(self.data)
+        self.matrix = ResultsMatrix.from_dict(self.data)
+
+    def test_round_trip_keeps_the_tournament_data(self):
+        self.assertEqual(saved(self.matrix.as_dict()), saved(self.data))
+        self.assertEqual(saved(ResultsMatrix.from_tournament(self.tournament).as_dict()), saved(self.data))
+
+    def test_histories_match_the_tournament(self):
+        self.assertEqual(list(self.matrix.rounds_results()), list(self.tournament.rounds_results()))
+        self.assertEqual(self.matrix.byes, self.tournament.byes)
+        self.assertEqual(self.matrix.colours, self.tournament.colours)
+        self.assertEqual(self.matrix.opponents(1), [2, 5])
+        for player1_id in range(1, 6):
+            for player2_id in range(1, 6):
+                self.assertEqual(
+                    self.matrix.have_players_met(player1_id, player2_id),
+                    self.tournament.have_players_met(player1_id, player2_id),
+                )
+        self.assertFalse(self.matrix.have_players_met(1, 99))
+
+    def test_half_points_and_standings(self):
+        self.assertEqual(self.matrix.round_results(0), [(1, 2, 1, 0), (3, 4, 0.5, 0.5)])
+        self.assertIsInstance(self.matrix.round_results(0)[0][2], int)
+        self.assertEqual(self.matrix.standings.ranked(), self.tournament.standings.ranked())
+
+    def test_tiebreaks_match_the_tournament(self):
+        matrix_tiebreaks = Tiebreaks(self.matrix)
+        tournament_tiebreaks = Tiebreaks(self.tournament)
+        for player_id in range(1, 6):
+            self.assertEqual(matrix_tiebreaks.values(player_id), tournament_tiebreaks.values(player_id))
+        self.assertEqual(
+            [player["id"] for player in matrix_tiebreaks.ranked_players()],
+            [player["id"] for player in tournament_tiebreaks.ranked_players()],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
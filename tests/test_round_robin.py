@@ -0,0 +1,54 @@
+import unittest
+
+from easychess.pairing.round_robin import BergerTable
+
+
+class BergerTableTest(unittest.TestCase):
+    def test_six_players_follow_the_berger_table(self):
+        self.assertEqual(
+            BergerTable([1, 2, 3, 4, 5, 6]).rounds,
+            [
+                ([(1, 6), (2, 5), (3, 4)], None),
+                ([(6, 4), (5, 3), (1, 2)], None),
+                ([(2, 6), (3, 1), (4, 5)], None),
+                ([(6, 5), (1, 4), (2, 3)], None),
+                ([(3, 6), (4, 2), (5, 1)], None),
+            ],
+        )
+
+    def test_every_pair_meets_once(self):
+        for number_of_players in (4, 5, 8, 9):
+            player_ids = list(range(1, number_of_players + 1))
+            table = BergerTable(player_ids)
+            met = []
+            byes = []
+            for round_index in range(len(table.rounds)):
+                pairs, bye = table.pair_round(round_index)
+                met.extend(frozenset(pair) for pair in pairs)
+                byes.append(bye)
+            self.assertEqual(len(met), len(set(met)))
+            self.assertEqual(len(met), number_of_players * (number_of_players - 1) // 2)
+            if number_of_players % 2:
+                self.assertEqual(sorted(byes), player_ids)
+            else:
+                self.assertEqual(byes, [None] * (number_of_players - 1))
+
+    def test_colours_are_balanced(self):
+        for number_of_players in (6, 10, 11):
+            colours = {}
+            for pairs, _ in BergerTable(list(range(1, number_of_players + 1))).rounds:
+                for white_id, black_id in pairs:
+                    colours[white_id] = colours.get(white_id, "") + "W"
+                    colours[black_id] = colours.get(black_id, "") + "B"
+            for player_colours in colours.values():
+                self.assertNotIn("WWW", player_colours)
+                self.assertNotIn("BBB", player_colours)
+                self.assertLessEqual(abs(player_colours.count("W") - player_colours.count("B")), 1)
+
+    def test_players_are_paired_in_the_given_order(self):
+        pairs, bye = BergerTable([30, 10, 20]).pair_round(0)
+        self.assertEqual((pairs, bye), ([(10, 20)], 30))
+
+
+if __name__ == "__main__":
+    unittest.main()
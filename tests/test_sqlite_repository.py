@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+import unittest
+
+from easychess.storage.json_repository import JsonRepository
+from easychess.storage.sqlite_repository import SqliteRepository
+from tests.fixtures import make_roster, make_tournament, write_players
+
+
+def saved(data):
+    """The data as compared across backends: match tuples become lists, and the revisions of JSON are left out."""
+    if isinstance(data, dict):
+        data = {key: value for key, value in data.items() if key != "revision"}
+    return json.loads(json.dumps(data))
+
+
+class SqliteRepositoryTest(unittest.TestCase):
+    def setUp(self):
+        self.repository = SqliteRepository(":memory:")
+        self.roster = make_roster(4)
+        for player in self.roster:
+            self.repository.save_player(dict(player))
+        self.tournament_data = make_tournament(
+            "Open", self.roster, [[(1, 2, 1), (3, 4, 0.5)], [(1, 3, None), (2, 4, None)]], number_of_rounds=3
+        )
+
+    def tearDown(self):
+        self.repository.close()
+
+    def test_players_keep_their_ids_and_ratings_are_applied(self):
+        self.assertEqual(self.repository.save_player({"last_name": "Nouveau", "first_name": "Eva"}), 5)
+        self.repository.save_ratings({1: (12.34, 1), 2: (-12.34, 1)})
+        players = {player["id"]: player for player in self.repository.read_players()}
+        self.assertEqual(list(players), [1, 2, 3, 4, 5])
+        self.assertEqual((players[1]["rating"], players[1]["rated_games"]), (1512.3, 1))
+        self.assertEqual((players[2]["rating"], players[2]["rated_games"]), (1487.7, 1))
+        self.assertEqual(players[5]["national_id"], None)
+
+    def test_saved_tournament_is_read_back(self):
+        self.repository.save_tournament(self.tournament_data)
+        self.assertEqual(saved(self.repository.find_tournament("Open")), saved(self.tournament_data))
+        self.assertEqual(saved(self.repository.read_tournaments()), {"tournament1": saved(self.tournament_data)})
+        self.assertIsNone(self.repository.find_tournament("Blitz"))
+        self.assertIsNone(self.repository.read_tournament("tournament2"))
+
+    def test_saving_again_replaces_the_rounds_and_matches(self):
+        self.repository.save_tournament(self.tournament_data)
+        self.tournament_data["list_rounds"].pop()
+        self.tournament_data["list_rounds"][0]["matches"].pop()
+        self.tournament_data["list_rounds"][0]["bye"] = 4
+        self.repository.save_tournament(self.tournament_data)
+        self.assertEqual(saved(self.repository.find_tournament("Open")), saved(self.tournament_data))
+
+    def test_match_results_are_saved(self):
+        self.repository.save_tournament(self.tournament_data)
+        round_data = self.tournament_data["list_rounds"][1]
+        round_data["matches"] = [([1, 0], [3, 1]), ([2, 0.5], [4, 0.5])]
+        self.tournament_data["players"][2]["score"] += 1
+        self.repository.save_match(self.tournament_data, 1, 0)
+        stored = self.repository.find_tournament("Open")
+        self.assertEqual(saved(stored["list_rounds"][1]["matches"]), [[[1, 0], [3, 1]], [[2, 0], [4, 0]]])
+        self.assertEqual(stored["players"][2]["score"], 1.5)
+        self.repository.save_matches(self.tournament_data, 1, [1])
+        self.assertEqual(saved(self.repository.find_tournament("Open")), saved(self.tournament_data))
+
+    def test_headers_and_tournaments_by_status(self):
+        finished = make_tournament("Blitz", self.roster[:2], [[(1, 2, 0)]], status=True)
+        self.repository.save_tournament(self.tournament_data)
+        self.repository.save_tournament(finished)
+        headers = self.repository.read_tournament_headers()
+        self.assertEqual([header["name"] for header in headers.values()], ["Open", "Blitz"])
+        self.assertEqual(headers["tournament2"]["number_of_players"], 2)
+        self.assertEqual(list(self.repository.find_tournaments_by_status(None)), ["tournament1"])
+        self.assertEqual(list(self.repository.find_tournaments_by_status(True)), ["tournament2"])
+        self.assertEqual(self.repository.find_tournaments_by_status(False), {})
+
+    def test_json_data_is_imported(self):
+        with tempfile.TemporaryDirectory() as directory:
+            roster = make_roster(5)
+            json_repository = JsonRepository(
+                write_players(directory, roster), os.path.join(directory, "data_tournament.json")
+            )
+            json_repository.save_tournament(self.tournament_data)
+            json_repository.flush()
+            self.assertEqual(self.repository.import_json(json_repository), (1, 1))
+        self.assertEqual([player["id"] for player in self.repository.read_players()], [1, 2, 3, 4, 5])
+        self.assertEqual(saved(self.repository.find_tournament("Open")), saved(self.tournament_data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import random
+import unittest
+
+from easychess.models.standings import Standings
+from easychess.models.tournament import Tournament
+from tests.fixtures import make_roster, make_tournament
+
+
+class StandingsTest(unittest.TestCase):
+    def check(self, standings, scores):
+        expected = sorted(scores, key=lambda player_id: (-scores[player_id], player_id))
+        self.assertEqual(standings.ranked(), expected)
+        for rank, player_id in enumerate(expected, start=1):
+            self.assertEqual(standings.rank(player_id), rank)
+            self.assertEqual(standings.player_at(rank), player_id)
+            self.assertEqual(standings.score(player_id), scores[player_id])
+        for k in (0, 1, len(expected) // 2, len(expected)):
+            self.assertEqual(standings.top(k), expected[:k])
+        groups = standings.score_groups()
+        self.assertEqual([player_id for _, group in groups for player_id in group], expected)
+        self.assertEqual([score for score, _ in groups], sorted(set(scores.values()), reverse=True))
+
+    def test_initial_scores_are_ranked_by_score_then_id(self):
+        scores = {4: 1.5, 2: 2, 7: 1.5, 1: 0, 3: 2}
+        self.check(Standings(scores.items()), scores)
+
+    def test_random_updates_keep_the_order(self):
+        rng = random.Random(3)
+        scores = {player_id: 0 for player_id in range(1, 41)}
+        standings = Standings(scores.items())
+        for _ in range(500):
+            if rng.random() < 0.05:
+                player_id = max(scores) + 1
+                scores[player_id] = rng.choice((0, 0.5, 3))
+                standings.add(player_id, scores[player_id])
+            else:
+                player_id = rng.choice(list(scores))
+                scores[player_id] += rng.choice((0, 0.5, 1))
+                standings.update(player_id, scores[player_id])
+        self.check(standings, scores)
+
+    def test_missing_rank_raises(self):
+        standings = Standings([(1, 0)])
+        with self.assertRaises(IndexError):
+            standings.player_at(2)
+
+
+class TournamentStandingsTest(unittest.TestCase):
+    def test_standings_follow_the_results_of_the_tournament(self):
+        tournament = Tournament.from_dict(
+            make_tournament("Open", make_roster(4), [[(1, 2, 0), (3, 4, 0.5)], [(2, 3, 1), (4, 1, None)]])
+        )
+        self.assertEqual(tournament.standings.ranked(), [2, 3, 4, 1])
+        self.assertEqual(tournament.standings.score_groups(), [(2, [2]), (0.5, [3, 4]), (0, [1])])
+        tournament.add_points(4, 1)
+        tournament.add_points(1, 0)
+        self.assertEqual([player["id"] for player in tournament.ranked_players()], [2, 4, 3, 1])
+        tournament.add_player({"id": 5, "score": 1})
+        self.assertEqual(tournament.standings.ranked(), [2, 4, 5, 3, 1])
+        self.assertEqual(tournament.standings.rank(5), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from easychess.models.tiebreaks import Tiebreaks
+from easychess.models.tournament import Tournament
+from tests.fixtures import make_roster, make_tournament
+
+
+class TiebreaksTest(unittest.TestCase):
+    def test_tiebreaks_of_a_round_robin(self):
+        rounds = [
+            [(1, 2, 1), (3, 4, 0.5)],
+            [(1, 3, 0.5), (2, 4, 1)],
+            [(4, 1, 0), (2, 3, 0)],
+        ]
+        tiebreaks = Tiebreaks(Tournament.from_dict(make_tournament("Open", make_roster(4), rounds)))
+        self.assertEqual(tiebreaks.buchholz, {1: 3.5, 2: 5, 3: 4, 4: 5.5})
+        self.assertEqual(tiebreaks.median_buchholz, {1: 1, 2: 2, 3: 1, 4: 2})
+        self.assertEqual(tiebreaks.sonneborn_berger, {1: 2.5, 2: 0.5, 3: 2.5, 4: 1})
+        self.assertEqual(tiebreaks.progressive, {1: 5, 2: 2, 3: 3.5, 4: 1.5})
+        self.assertEqual(tiebreaks.values(3), (4, 1, 2.5, 3.5))
+
+    def test_unplayed_matches_are_ignored(self):
+        rounds = [[(1, 2, 1), (3, 4, 0.5)], [(1, 3, None), (2, 4, None)]]
+        tiebreaks = Tiebreaks(Tournament.from_dict(make_tournament("Open", make_roster(4), rounds)))
+        self.assertEqual(tiebreaks.buchholz, {1: 0, 2: 1, 3: 0.5, 4: 0.5})
+        self.assertEqual(tiebreaks.progressive, {1: 2, 2: 0, 3: 1, 4: 1})
+
+    def test_players_of_equal_score_are_ranked_by_tiebreaks(self):
+        rounds = [
+            [(1, 2, 1), (3, 4, 1), (5, 6, 1)],
+            [(1, 3, 1), (5, 2, 0.5), (4, 6, 0.5)],
+        ]
+        tiebreaks = Tiebreaks(Tournament.from_dict(make_tournament("Open", make_roster(6), rounds)))
+        self.assertEqual([player["id"] for player in tiebreaks.ranked_players()], [1, 5, 3, 2, 6, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
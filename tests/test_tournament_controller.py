@@ -0,0 +1,111 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from easychess.controllers.tournament_controller import TournamentManagerController
+from easychess.models.tournament import Tournament
+from easychess.storage.json_repository import JsonRepository
+from easychess.storage.tournament_store import TournamentStore
+from easychess.utils.utils import Utils
+from tests.fixtures import make_player, make_tournament, write_players
+
+
+def finished_tournament(players, results):
+    return Tournament.from_dict(make_tournament("Open", players, [results], status=True))
+
+
+class ControllerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        # As in the shipped data, the roster players have no national ID
+        self.roster = [
+            make_player(1, rating=1700, rated_games=40),
+            make_player(2, rating=1500, rated_games=40),
+            make_player(3, "AB00003", rating=1600, rated_games=40),
+        ]
+        self.controller = TournamentManagerController()
+        self.controller.repository = JsonRepository(
+            write_players(self.directory.name, self.roster), os.path.join(self.directory.name, "data_tournament.json")
+        )
+
+    def tearDown(self):
+        self.controller.repository.flush()
+        self.directory.cleanup()
+
+    def saved_ratings(self):
+        return {player["id"]: player["rating"] for player in self.controller.repository.read_players()}
+
+
+class UpdateRatingsTest(ControllerTestCase):
+    def test_players_added_from_the_roster_are_rated_by_id(self):
+        saved = self.controller.update_ratings(finished_tournament(self.roster[1:], [(2, 3, 1)]))
+        self.assertEqual(saved, {2: (12.8, 1), 3: (-12.8, 1)})
+        self.assertEqual(self.saved_ratings(), {1: 1700, 2: 1512.8, 3: 1587.2})
+
+    def test_legacy_players_are_found_by_national_id_only(self):
+        # Legacy tournament: ids local to the tournament, which are not the roster ids
+        players = [
+            make_player(1, last_name="Ancien"),
+            make_player(2, "AB00003", last_name="Joueur3"),
+        ]
+        tournament = finished_tournament(players, [(1, 2, 1)])
+        roster = self.controller.repository.roster()
+        self.assertEqual(TournamentManagerController.roster_ids(tournament, roster), {2: 3})
+        saved = self.controller.update_ratings(tournament)
+        self.assertEqual(list(saved), [3])
+        self.assertEqual(self.saved_ratings(), {1: 1700, 2: 1500, 3: 1600 + saved[3][0]})
+
+    def test_players_outside_the_roster_are_not_saved(self):
+        players = [make_player(8, last_name="Invité"), make_player(9, last_name="Invitée")]
+        self.assertEqual(self.controller.update_ratings(finished_tournament(players, [(8, 9, 1)])), {})
+        self.assertEqual(self.saved_ratings(), {1: 1700, 2: 1500, 3: 1600})
+
+    def test_tournaments_in_progress_are_not_rated(self):
+        tournament = finished_tournament(self.roster[1:], [(2, 3, 1)])
+        tournament.status = None
+        self.assertEqual(self.controller.update_ratings(tournament), {})
+        self.assertEqual(self.saved_ratings(), {1: 1700, 2: 1500, 3: 1600})
+
+
+class FinishTournamentTest(ControllerTestCase):
+    def setUp(self):
+        super().setUp()
+        Utils.interactive = False
+
+    def tearDown(self):
+        Utils.interactive = True
+        super().tearDown()
+
+    def finish(self, tournament):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            finished = self.controller.finish_tournament(tournament)
+        return finished, output.getvalue()
+
+    def test_finished_tournament_is_rated(self):
+        tournament = finished_tournament(self.roster[1:], [(2, 3, 1)])
+        tournament.status = None
+        finished, output = self.finish(tournament)
+        self.assertTrue(finished)
+        self.assertIn("Fin du tournoi !", output)
+        self.assertIn("Classements Elo mis à jour.", output)
+        self.assertEqual(self.saved_ratings(), {1: 1700, 2: 1512.8, 3: 1587.2})
+
+    def test_tournament_whose_save_failed_is_not_rated(self):
+        with open(TournamentStore.shards_dir(self.controller.repository.tournaments_file), "w"):
+            pass
+        tournament = finished_tournament(self.roster[1:], [(2, 3, 1)])
+        tournament.status = None
+        with self.assertLogs(level="ERROR"):
+            finished, output = self.finish(tournament)
+        self.assertFalse(finished)
+        self.assertIsNone(tournament.status)
+        self.assertNotIn("Fin du tournoi !", output)
+        self.assertNotIn("Classements Elo", output)
+        self.assertEqual(self.saved_ratings(), {1: 1700, 2: 1500, 3: 1600})
+
+
+if __name__ == "__main__":
+    unittest.main()
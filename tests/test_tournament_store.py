@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+import unittest
+
+from easychess.storage.tournament_store import TournamentStore
+from tests.fixtures import make_roster, make_tournament
+
+
+class ShardedLayoutTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "data_tournament.json")
+        players = make_roster(4)
+        self.roster = {player["id"]: player for player in players}
+        self.open = make_tournament("Open", players, [[(1, 2, 1), (3, 4, 0)]], number_of_rounds=3)
+        self.blitz = make_tournament("Blitz", players, [[(1, 3, 0.5), (2, 4, 1)]], status=True)
+        TournamentStore.save(self.file_path, self.open, self.roster)
+        TournamentStore.save(self.file_path, self.blitz, self.roster)
+
+    def tearDown(self):
+        for tournament_data in (self.open, self.blitz):
+            TournamentStore.saved_revisions.pop((self.file_path, tournament_data["name"]), None)
+        self.directory.cleanup()
+
+    def test_each_tournament_has_its_shard_and_a_header_in_the_manifest(self):
+        with open(self.file_path) as manifest_file:
+            manifest = json.load(manifest_file)
+        self.assertEqual(manifest["layout"], TournamentStore.LAYOUT)
+        self.assertEqual(list(manifest["tournaments"]), ["tournament1", "tournament2"])
+        header = manifest["tournaments"]["tournament2"]
+        self.assertEqual(
+            (header["name"], header["status"], header["current_round"], header["number_of_players"]),
+            ("Blitz", True, 1, 4),
+        )
+        self.assertNotIn("players", header)
+        shards = sorted(os.listdir(TournamentStore.shards_dir(self.file_path)))
+        self.assertEqual(shards, ["tournament1.json", "tournament2.json"])
+        self.assertEqual(TournamentStore.read_shard(self.file_path, "tournament1")["name"], "Open")
+
+    def test_saving_a_tournament_only_writes_its_shard(self):
+        blitz_shard = TournamentStore.shard_path(self.file_path, "tournament2")
+        os.utime(blitz_shard, ns=(1_000_000_000, 1_000_000_000))
+        stored = TournamentStore.read_one(self.file_path, "tournament1", self.roster)
+        TournamentStore.apply_match_result(stored, 0, 1, 0.5, 0.5)
+        TournamentStore.save(self.file_path, stored, self.roster)
+        self.assertEqual(os.stat(blitz_shard).st_mtime_ns, 1_000_000_000)
+        self.assertEqual(TournamentStore.read_headers(self.file_path)["tournament1"]["revision"], 2)
+        stored = TournamentStore.read_one(self.file_path, "tournament1", self.roster)
+        self.assertEqual(stored["list_rounds"][0]["matches"][1], [[3, 0.5], [4, 0.5]])
+
+    def test_read_returns_every_tournament(self):
+        tournaments = TournamentStore.read(self.file_path, self.roster)
+        self.assertEqual([data["name"] for data in tournaments.values()], ["Open", "Blitz"])
+        self.assertIsNone(TournamentStore.read_one(self.file_path, "tournament3", self.roster))
+
+    def test_single_file_is_split_into_shards(self):
+        other = os.path.join(self.directory.name, "data_other.json")
+        with open(other, "w") as json_file:
+            json.dump({"tournament1": self.open, "tournament2": self.blitz}, json_file)
+        headers = TournamentStore.read_headers(other)
+        self.assertEqual([header["name"] for header in headers.values()], ["Open", "Blitz"])
+        shards = sorted(os.listdir(TournamentStore.shards_dir(other)))
+        self.assertEqual(shards, ["tournament1.json", "tournament2.json"])
+        self.assertEqual(TournamentStore.read_one(other, "tournament2", self.roster)["status"], True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import contextlib
+import io
+import unittest
+
+from easychess.utils.tournament_validator import TournamentInputValidator
+from easychess.utils.utils import Utils
+
+
+class ValidateRoundResultsTest(unittest.TestCase):
+    def setUp(self):
+        Utils.interactive = False
+        self.validator = TournamentInputValidator(Utils(), None, None)
+
+    def tearDown(self):
+        Utils.interactive = True
+
+    def validate(self, results_input, open_boards=(0, 1, 2)):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            results = self.validator.validate_round_results(results_input, list(open_boards))
+        return results, output.getvalue()
+
+    def test_header_line_is_ignored_whatever_its_case_and_accents(self):
+        for header in ("échiquier,résultat", "Echiquier, Resultat", "ÉCHIQUIER,RÉSULTAT"):
+            results, _ = self.validate(f"{header}\n1,1\n3,0")
+            self.assertEqual(results, {0: "1", 2: "0"})
+
+    def test_first_line_with_an_invalid_board_is_reported(self):
+        results, output = self.validate("un,1\n2,0")
+        self.assertFalse(results)
+        self.assertIn("Ligne invalide : 'un,1'", output)
+
+    def test_one_code_per_open_board(self):
+        self.assertEqual(self.validate("1 0", open_boards=(1, 2))[0], {1: "1", 2: "0"})
+        self.assertFalse(self.validate("1 0")[0])
+        self.assertFalse(self.validate("1 3 0")[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
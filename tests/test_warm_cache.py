@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+from easychess.storage.read_cache import ReadCache
+from easychess.storage.warm_cache import WarmCache
+
+
+class WarmCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "data_tournament.json")
+        with open(self.path, "w") as data_file:
+            data_file.write("{}")
+        self.key = (self.path, "tournament", "tournament3")
+        self.warm_cache = WarmCache()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_data_is_loaded_with_the_same_signature_only(self):
+        signature = ReadCache.signature([self.path])
+        self.warm_cache.store(self.key, signature, {"name": "Open"})
+        self.assertEqual(
+            WarmCache.cache_file(self.key),
+            os.path.join(self.directory.name, "data_tournament_cache", "tournament-tournament3.pickle"),
+        )
+        self.assertEqual(self.warm_cache.load(self.key, signature), ({"name": "Open"},))
+        self.assertIsNone(self.warm_cache.load(self.key, ((self.path, None),)))
+        self.assertIsNone(self.warm_cache.load((self.path, "other"), signature))
+
+    def test_unreadable_cache_is_ignored(self):
+        os.makedirs(WarmCache.cache_dir(self.path))
+        with open(WarmCache.cache_file(self.key), "wb") as cache_file:
+            cache_file.write(b"not a pickle")
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(self.warm_cache.load(self.key, ReadCache.signature([self.path])))
+
+    def test_invalidate_removes_the_data_of_the_file(self):
+        self.warm_cache.invalidate(self.path)
+        signature = ReadCache.signature([self.path])
+        self.warm_cache.store(self.key, signature, {})
+        self.warm_cache.invalidate(self.path)
+        self.assertIsNone(self.warm_cache.load(self.key, signature))
+
+    def test_read_cache_loads_persistent_entries_after_a_launch(self):
+        loads = []
+
+        def load():
+            loads.append(1)
+            return {"name": "Open"}
+
+        cache = ReadCache(self.warm_cache)
+        cache.get(self.key, [self.path], load, persist=True)
+        cache.get((self.path, "players"), [self.path], load)
+        # A new launch: nothing in memory
+        cache.clear()
+        self.assertEqual(cache.get(self.key, [self.path], load, persist=True), {"name": "Open"})
+        cache.get((self.path, "players"), [self.path], load)
+        self.assertEqual(len(loads), 3)
+        self.assertEqual(cache.stats(), {"hits": 0, "warm_hits": 1, "misses": 1, "entries": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
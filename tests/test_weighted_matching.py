@@ -0,0 +1,69 @@
+import random
+import unittest
+
+from easychess.pairing.weighted_matching import max_weight_matching
+
+
+def matchings(vertices, weights):
+    """Yields the (cardinality, weight) of every matching of the vertices."""
+    if len(vertices) < 2:
+        yield 0, 0
+        return
+    first, rest = vertices[0], vertices[1:]
+    yield from matchings(rest, weights)
+    for other in rest:
+        if (first, other) in weights:
+            for cardinality, weight in matchings([vertex for vertex in rest if vertex != other], weights):
+                yield cardinality + 1, weight + weights[first, other]
+
+
+def random_graph(rng, number_of_vertices, density):
+    edges = []
+    for i in range(number_of_vertices):
+        for j in range(i + 1, number_of_vertices):
+            if rng.random() < density:
+                edges.append((i, j, rng.randint(-5, 20)))
+    return edges
+
+
+class MaxWeightMatchingTest(unittest.TestCase):
+    def check(self, edges, maxcardinality):
+        mate = max_weight_matching(edges, maxcardinality)
+        weights = {}
+        for i, j, weight in edges:
+            weights[i, j] = weights[j, i] = weight
+        for vertex, partner in enumerate(mate):
+            if partner != -1:
+                self.assertEqual(mate[partner], vertex)
+                self.assertIn((vertex, partner), weights)
+        pairs = [(vertex, partner) for vertex, partner in enumerate(mate) if vertex < partner]
+        vertices = sorted({vertex for i, j, _ in edges for vertex in (i, j)})
+        if maxcardinality:
+            self.assertEqual((len(pairs), sum(weights[pair] for pair in pairs)), max(matchings(vertices, weights)))
+        else:
+            best_weight = max(weight for _, weight in matchings(vertices, weights))
+            self.assertEqual(sum(weights[pair] for pair in pairs), best_weight)
+
+    def test_empty_graph(self):
+        self.assertEqual(max_weight_matching([]), [])
+
+    def test_heaviest_edge_is_preferred_over_two_lighter_ones(self):
+        self.assertEqual(max_weight_matching([(0, 1, 2), (1, 2, 10), (2, 3, 2)]), [-1, 2, 1, -1])
+        self.assertEqual(max_weight_matching([(0, 1, 2), (1, 2, 10), (2, 3, 2)], True), [1, 0, 3, 2])
+
+    def test_odd_cycle_blossom(self):
+        # Triangle 0-1-2 with a tail on each side: the optimum goes through the blossom
+        edges = [(0, 1, 8), (1, 2, 9), (0, 2, 10), (2, 3, 7), (0, 4, 6)]
+        self.check(edges, maxcardinality=False)
+        self.check(edges, maxcardinality=True)
+
+    def test_random_graphs_match_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(300):
+            edges = random_graph(rng, rng.randint(2, 8), rng.choice((0.3, 0.6, 1.0)))
+            if edges:
+                self.check(edges, maxcardinality=rng.random() < 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import threading
+import unittest
+
+from easychess.storage.write_behind import WriteBehind
+
+
+class WriteBehindTest(unittest.TestCase):
+    def setUp(self):
+        self.writer = WriteBehind()
+        self.written = []
+        # Keeps the writer thread busy, so that the next writes wait in the queue
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+        def block():
+            self.started.set()
+            self.release.wait(5)
+
+        self.writer.submit(("busy",), block)
+        self.assertTrue(self.started.wait(5))
+
+    def tearDown(self):
+        self.release.set()
+        self.writer.flush()
+
+    def write(self, key, value):
+        self.written.append((key, value))
+
+    def test_snapshots_replace_the_pending_writes_of_their_key(self):
+        self.writer.submit(("Open",), self.write, "Open", "match 1")
+        self.writer.submit(("Blitz",), self.write, "Blitz", 1, replace=True)
+        self.writer.submit(("Open",), self.write, "Open", 1, replace=True)
+        self.writer.submit(("Open",), self.write, "Open", 2, replace=True)
+        self.writer.submit(("Open",), self.write, "Open", "match 2")
+        self.release.set()
+        self.writer.flush()
+        self.assertEqual(self.written, [("Open", 2), ("Open", "match 2"), ("Blitz", 1)])
+
+    def test_writes_submitted_after_a_write_started_are_kept(self):
+        self.writer.submit(("Open",), self.write, "Open", 1, replace=True)
+        self.release.set()
+        self.writer.flush()
+        self.writer.submit(("Open",), self.write, "Open", 2, replace=True)
+        self.writer.flush()
+        self.assertEqual(self.written, [("Open", 1), ("Open", 2)])
+
+    def test_failed_write_is_logged_and_the_writer_goes_on(self):
+        def fail():
+            raise OSError("disque plein")
+
+        self.writer.submit(("Open",), fail)
+        self.writer.submit(("Blitz",), self.write, "Blitz", 1)
+        with self.assertLogs(level="ERROR") as logs:
+            self.release.set()
+            self.writer.flush()
+        self.assertIn("disque plein", logs.output[0])
+        self.assertEqual(self.written, [("Blitz", 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()